@@ -2,7 +2,10 @@
 Authentication utilities: JWT token generation, verification, and decorators
 """
 import jwt
+import threading
+import time
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from functools import wraps
 from flask import request, jsonify
@@ -22,15 +25,40 @@ def generate_jwt_token(user_data):
     return jwt.encode(payload, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
 
 
+# Verified token payloads keyed by token, so polling clients skip the decode
+# and signature check until the token expires. Least recently used tokens are
+# evicted one at a time once the cache is full.
+_verified_tokens = OrderedDict()
+_verified_tokens_lock = threading.Lock()
+VERIFIED_TOKEN_CACHE_MAX_SIZE = 10000
+
+
 def verify_jwt_token(token):
     """Verify JWT token and return user data"""
+    with _verified_tokens_lock:
+        payload = _verified_tokens.get(token)
+        if payload is not None:
+            if payload["exp"] > time.time():
+                _verified_tokens.move_to_end(token)
+                return dict(payload)
+            del _verified_tokens[token]
+    
     try:
         payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
-        return payload
     except jwt.ExpiredSignatureError:
         return None
     except jwt.InvalidTokenError:
         return None
+    
+    # Only tokens with an expiry are cached, the cache must never outlive them
+    if isinstance(payload.get("exp"), (int, float)):
+        with _verified_tokens_lock:
+            _verified_tokens[token] = payload
+            _verified_tokens.move_to_end(token)
+            if len(_verified_tokens) > VERIFIED_TOKEN_CACHE_MAX_SIZE:
+                _verified_tokens.popitem(last=False)
+        return dict(payload)
+    return payload
 
 
 def token_required(f):
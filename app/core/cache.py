@@ -0,0 +1,41 @@
+"""
+Response cache for read-heavy endpoints, backed by Flask-Caching
+
+Uses Redis when CACHE_REDIS_URL is set, so all workers share one cache, and an
+in-process SimpleCache otherwise. Without Flask-Caching installed, memoized
+functions are simply called every time.
+"""
+from app.core.config import CACHE_REDIS_URL, CACHE_DEFAULT_TIMEOUT
+
+try:
+    from flask_caching import Cache
+    CACHING_AVAILABLE = True
+except ImportError:
+    Cache = None
+    CACHING_AVAILABLE = False
+
+
+class _NoCache:
+    """Pass-through used when Flask-Caching is not installed"""
+
+    def memoize(self, *args, **kwargs):
+        return lambda f: f
+
+    def delete_memoized(self, *args, **kwargs):
+        pass
+
+    def init_app(self, app, config=None):
+        pass
+
+
+cache = Cache() if CACHING_AVAILABLE else _NoCache()
+
+
+def init_cache(app):
+    """Configure the shared cache for the app"""
+    if CACHE_REDIS_URL:
+        config = {"CACHE_TYPE": "RedisCache", "CACHE_REDIS_URL": CACHE_REDIS_URL}
+    else:
+        config = {"CACHE_TYPE": "SimpleCache"}
+    config["CACHE_DEFAULT_TIMEOUT"] = CACHE_DEFAULT_TIMEOUT
+    cache.init_app(app, config=config)
@@ -77,6 +77,9 @@ S3_BUCKET_NAME = os.getenv("S3_BUCKET_NAME", "pregnancy-ai-chat")
 MAX_IMAGE_SIZE = int(os.getenv("MAX_IMAGE_SIZE", "10"))
 MAX_DOCUMENT_SIZE = int(os.getenv("MAX_DOCUMENT_SIZE", "50"))
 MAX_VOICE_SIZE = int(os.getenv("MAX_VOICE_SIZE", "25"))
+# Whole request body limit, enforced by Flask before buffering; leaves room for
+# the ~4/3 base64 overhead of JSON-encoded uploads
+MAX_REQUEST_SIZE = int(os.getenv("MAX_REQUEST_SIZE", "70"))
 
 # Allowed File Extensions
 ALLOWED_IMAGE_EXTENSIONS = os.getenv("ALLOWED_IMAGE_EXTENSIONS", "jpg,jpeg,png,gif,webp").split(',')
@@ -87,3 +90,22 @@ ALLOWED_VOICE_EXTENSIONS = os.getenv("ALLOWED_VOICE_EXTENSIONS", "mp3,wav,ogg,we
 S3_UPLOAD_ENABLED = os.getenv("S3_UPLOAD_ENABLED", "true").lower() == "true"
 S3_URL_EXPIRATION = int(os.getenv("S3_URL_EXPIRATION", "3600"))  # Signed URL expiration in seconds
 
+
+# Vital Signs Configuration
+MAX_VITAL_HISTORY = int(os.getenv("MAX_VITAL_HISTORY", "500"))  # Entries kept per patient
+
+# Logging Configuration
+LOG_LEVEL = os.getenv("LOG_LEVEL", "").upper()  # Empty keeps the current root logger level
+
+# Shared Async Runner Configuration (voice STT/LLM/TTS and trimester service calls)
+ASYNC_RUNNER_CONCURRENCY = int(os.getenv("ASYNC_RUNNER_CONCURRENCY", "16"))  # Coroutines in flight at once
+ASYNC_RUNNER_RATE_LIMIT = float(os.getenv("ASYNC_RUNNER_RATE_LIMIT", "0"))  # Calls per second, 0 disables
+ASYNC_RUNNER_TIMEOUT = float(os.getenv("ASYNC_RUNNER_TIMEOUT", "120"))  # Seconds a request thread waits
+
+# Response Cache Configuration (Flask-Caching)
+CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL", "")  # Empty uses an in-process SimpleCache
+CACHE_DEFAULT_TIMEOUT = int(os.getenv("CACHE_DEFAULT_TIMEOUT", "60"))
+
+# User Activity Tracking Configuration
+ACTIVITY_FLUSH_INTERVAL = float(os.getenv("ACTIVITY_FLUSH_INTERVAL", "0.2"))  # Seconds between buffered writes
+ACTIVITY_FLUSH_BATCH = int(os.getenv("ACTIVITY_FLUSH_BATCH", "128"))  # Buffered events that trigger an early flush
@@ -0,0 +1,43 @@
+"""
+Fast JSON provider for Flask responses backed by orjson
+"""
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that encodes with orjson
+
+    Dates are passed through to Flask's default handler so they keep the
+    same HTTP date format as the stdlib provider, and any other type orjson
+    does not support natively (Decimal, __html__, ...) falls back to it too.
+    """
+
+    def _options(self, kwargs):
+        # numpy scalars and arrays show up in RAG scores and embeddings
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_SERIALIZE_NUMPY
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj, **kwargs):
+        """Serialize data as JSON"""
+        return orjson.dumps(obj, default=self.default, option=self._options(kwargs)).decode()
+
+    def loads(self, s, **kwargs):
+        """Deserialize data as JSON"""
+        return orjson.loads(s)
+
+
+def init_json_provider(app):
+    """Use orjson for JSON responses when it is installed"""
+    if ORJSON_AVAILABLE:
+        app.json = OrjsonProvider(app)
@@ -0,0 +1,38 @@
+"""
+Non-blocking logging through a queue
+
+Request threads only put records on a queue, a background listener thread
+does the actual (locking, flushing) writes to the real handlers.
+"""
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+from app.core.config import LOG_LEVEL
+
+_listener = None
+
+
+def init_queue_logging():
+    """Route root logger output through a QueueHandler drained by a background QueueListener"""
+    global _listener
+    if _listener is not None:
+        return
+    
+    root = logging.getLogger()
+    # Keep handlers already installed (e.g. by the WSGI server), just move them behind the queue
+    handlers = root.handlers[:] or [logging.StreamHandler()]
+    for handler in handlers:
+        if handler.formatter is None:
+            handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+        root.removeHandler(handler)
+    
+    log_queue = queue.SimpleQueue()
+    root.addHandler(QueueHandler(log_queue))
+    if LOG_LEVEL:
+        root.setLevel(LOG_LEVEL)
+    
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
@@ -1,9 +1,17 @@
 """
-Validation utilities for email, mobile, password, and profile validation
+Validation utilities for email, mobile, password, profile and base64 payload validation
 """
+import base64
+import binascii
 import re
+from typing import Optional, Tuple
+
 import bcrypt
 
+# Optional "data:<mime>;base64," prefix sent by browsers (FileReader.readAsDataURL)
+_DATA_URL_RE = re.compile(rb'^data:([^;,]*)[^,]*;base64,')
+_BASE64_WHITESPACE = b' \t\r\n'
+
 
 def hash_password(password: str) -> str:
     """Hash password using bcrypt"""
@@ -49,3 +57,24 @@ def is_profile_complete(patient_doc: dict) -> bool:
     ]
     return all(field in patient_doc for field in required_fields)
 
+
+def decode_base64_payload(data: str) -> Tuple[bytes, Optional[str]]:
+    """Decode a base64 string (optionally a data URL) into bytes and its MIME type
+
+    Raises binascii.Error (a ValueError) on malformed input, including
+    non-string values and non-ASCII characters.
+    """
+    if not isinstance(data, str):
+        raise binascii.Error("Base64 payload must be a string")
+    try:
+        raw = data.encode('ascii')
+    except UnicodeEncodeError:
+        raise binascii.Error("Base64 payload must be ASCII") from None
+    mime_type = None
+    match = _DATA_URL_RE.match(raw)
+    if match:
+        mime_type = match.group(1).decode() or None
+        raw = raw[match.end():]
+    # Line-wrapped base64 is common; strict validation rejects anything else
+    raw = raw.translate(None, _BASE64_WHITESPACE)
+    return base64.b64decode(raw, validate=True), mime_type
@@ -8,7 +8,10 @@ from datetime import datetime
 
 # Import core utilities
 from app.core.database import db
-from app.core.config import PORT, DEBUG
+from app.core.config import PORT, DEBUG, MAX_REQUEST_SIZE
+from app.core.json_provider import init_json_provider
+from app.core.log_queue import init_queue_logging
+from app.core.cache import init_cache
 
 # Import module blueprints
 from app.modules.auth.routes import auth_bp
@@ -53,6 +56,18 @@ def create_app():
     """Application factory"""
     app = Flask(__name__)
     
+    # Log through a background thread so request threads never block on log I/O
+    init_queue_logging()
+    
+    # Encode JSON responses with orjson when available
+    init_json_provider(app)
+    
+    # Response cache for read-heavy endpoints (Redis when configured)
+    init_cache(app)
+    
+    # Reject oversize uploads with 413 before they are spooled to memory/disk
+    app.config['MAX_CONTENT_LENGTH'] = MAX_REQUEST_SIZE * 1024 * 1024
+    
     # Enable CORS
     CORS(app)
       # Initialize Socket.IO for real-time communication
@@ -221,6 +236,10 @@ def create_app():
     def internal_error(error):
         return jsonify({"error": "Internal server error"}), 500
     
+    @app.errorhandler(413)
+    def request_too_large(error):
+        return jsonify({"error": f"Request too large. Maximum size: {MAX_REQUEST_SIZE}MB"}), 413
+    
     print("=" * 80)
     print("              PATIENT ALERT SYSTEM API - MODULAR MVC")
     print("=" * 80)
@@ -346,9 +346,8 @@ def login_service(data: Dict[str, Any]) -> Tuple[Dict[str, Any], int]:
     EXACT SAME LOGIC - NO CHANGES
     """
     try:
-        # Import activity tracker
-        from app.shared.activity_tracker import UserActivityTracker
-        activity_tracker = UserActivityTracker(db)
+        # Import the shared activity tracker (it owns the buffered event writer)
+        from app.shared.activity_tracker import activity_tracker
         
         # Check database connection and attempt reconnection if needed
         if not db.is_connected():
@@ -453,8 +452,7 @@ def logout_service(user_data):
     EXACT SAME LOGIC - NO CHANGES
     """
     try:
-        from app.shared.activity_tracker import UserActivityTracker
-        activity_tracker = UserActivityTracker(db)
+        from app.shared.activity_tracker import activity_tracker
         
         patient_id = user_data.get('patient_id')
         email = user_data.get('email')
@@ -656,6 +654,9 @@ def complete_profile_service(patient_id, data):
         )
         
         if result.modified_count > 0:
+            # The LMP may have changed, so the trimester routes must re-read the week
+            from app.modules.trimester.routes import invalidate_patient_week_cache
+            invalidate_patient_week_cache(patient_id)
             return jsonify({
                 "message": "Profile completed successfully",
                 "patient_id": patient_id
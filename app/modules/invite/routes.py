@@ -17,6 +17,7 @@ from .services import (
     get_invite_details_service,
     verify_invite_code_service
 )
+from .schemas import REQUEST_CONNECTION_SCHEMA, CANCEL_REQUEST_SCHEMA
 
 invite_bp = Blueprint('invite', __name__, url_prefix='/api/invite')
 
@@ -49,9 +50,7 @@ def request_connection():
         data = request.get_json()
         
         # Validate input using schema
-        from .schemas import RequestConnectionSchema
-        schema = RequestConnectionSchema()
-        errors = schema.validate(data)
+        errors = REQUEST_CONNECTION_SCHEMA.validate(data)
         if errors:
             return jsonify({"success": False, "error": "Validation failed", "details": errors}), 400
         
@@ -126,9 +125,7 @@ def cancel_request():
         data = request.get_json()
         
         # Validate input using schema
-        from .schemas import CancelRequestSchema
-        schema = CancelRequestSchema()
-        errors = schema.validate(data)
+        errors = CANCEL_REQUEST_SCHEMA.validate(data)
         if errors:
             return jsonify({"success": False, "error": "Validation failed", "details": errors}), 400
         
@@ -52,3 +52,6 @@ class GetInviteDetailsSchema(Schema):
     invite_id = fields.Str(required=True)
 
 
+# Shared by the request-connection and cancel-request handlers
+REQUEST_CONNECTION_SCHEMA = RequestConnectionSchema()
+CANCEL_REQUEST_SCHEMA = CancelRequestSchema()
@@ -10,10 +10,7 @@ from bson import ObjectId
 from app.core.database import db
 from app.core.config import DISCLAIMER_TEXT
 from app.shared.external_services.symptoms_service import symptoms_service
-from app.shared.activity_tracker import UserActivityTracker
-
-# Initialize
-activity_tracker = UserActivityTracker(db)
+from app.shared.activity_tracker import activity_tracker
 
 
 def symptoms_health_check_service():
@@ -22,6 +22,19 @@ class Settings:
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
     OPENAI_MODEL: str = os.getenv("OPENAI_MODEL", "gpt-3.5-turbo")
     OPENAI_MAX_TOKENS: int = int(os.getenv("OPENAI_MAX_TOKENS", "500"))
+    OPENAI_MAX_CONCURRENCY: int = int(os.getenv("OPENAI_MAX_CONCURRENCY", "8"))
+    OPENAI_MAX_RETRIES: int = int(os.getenv("OPENAI_MAX_RETRIES", "3"))
+    OPENAI_RESPONSE_CACHE_TTL: int = int(os.getenv("OPENAI_RESPONSE_CACHE_TTL", "86400"))  # seconds
+    OPENAI_BATCH_POLL_INTERVAL: float = float(os.getenv("OPENAI_BATCH_POLL_INTERVAL", "30"))  # seconds between batch status checks
+    OPENAI_PRECOMPUTED_PATH: str = os.getenv("OPENAI_PRECOMPUTED_PATH", "")  # JSON written by precompute.py, loaded at startup
+    
+    # Shared HTTP Client Configuration
+    HTTP_TIMEOUT: float = float(os.getenv("HTTP_TIMEOUT", "30"))
+    HTTP_CONNECT_TIMEOUT: float = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+    HTTP_MAX_CONNECTIONS: int = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "50"))
+    ASYNC_CALL_TIMEOUT: float = float(os.getenv("ASYNC_CALL_TIMEOUT", "90"))  # seconds a request waits on the async loop
+    BABY_IMAGE_JOB_TTL: int = int(os.getenv("BABY_IMAGE_JOB_TTL", "600"))  # seconds finished image jobs are kept
     
     # Flask Configuration (adapted from FastAPI)
     HOST: str = os.getenv("HOST", "0.0.0.0")
@@ -33,10 +46,14 @@ class Settings:
     QDRANT_API_KEY: str = os.getenv("QDRANT_API_KEY", "")
     QDRANT_COLLECTION_NAME: str = os.getenv("QDRANT_COLLECTION_NAME", "pregnancy_weeks")
     EMBEDDING_MODEL: str = os.getenv("EMBEDDING_MODEL", "all-MiniLM-L6-v2")
+    QDRANT_PREFER_GRPC: bool = os.getenv("QDRANT_PREFER_GRPC", "False").lower() == "true"  # async client only, needs gRPC port 6334
+    QDRANT_SEARCH_BATCH_SIZE: int = int(os.getenv("QDRANT_SEARCH_BATCH_SIZE", "16"))
+    QDRANT_CACHE_TTL: int = int(os.getenv("QDRANT_CACHE_TTL", "3600"))  # seconds
     
     # Patient Backend Configuration
     PATIENT_BACKEND_URL: str = os.getenv("PATIENT_BACKEND_URL", "http://localhost:3000")
     PATIENT_BACKEND_API_KEY: str = os.getenv("PATIENT_BACKEND_API_KEY", "")
+    PATIENT_WEEK_CACHE_TTL: int = int(os.getenv("PATIENT_WEEK_CACHE_TTL", "300"))  # seconds
     
     # Module Configuration
     MODULE_NAME: str = "trimester"
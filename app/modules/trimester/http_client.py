@@ -0,0 +1,40 @@
+"""
+Shared HTTP Client for Trimester Module
+
+This file provides a single pooled httpx.AsyncClient shared by the OpenAI
+and patient backend services, so outgoing calls reuse TCP/TLS connections
+instead of opening a new client per request.
+"""
+
+import asyncio
+import httpx
+
+from .config import settings
+
+try:
+    import h2  # noqa: F401 - HTTP/2 support for httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+# The client is created lazily because it is bound to an event loop
+_client = None
+_client_loop = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared async HTTP client for the running event loop"""
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(settings.HTTP_TIMEOUT, connect=settings.HTTP_CONNECT_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=settings.HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS
+            )
+        )
+        _client_loop = loop
+    return _client
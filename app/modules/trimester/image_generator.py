@@ -11,7 +11,6 @@ from matplotlib.patches import Circle, Ellipse, Rectangle
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 import io
-import base64
 from typing import Dict, Tuple, Optional
 import os
 import requests
@@ -21,6 +20,11 @@ import asyncio
 
 from .config import settings
 
+try:
+    import pybase64 as base64  # SIMD-accelerated drop-in for the stdlib module
+except ImportError:
+    import base64
+
 
 class BabySizeImageGenerator:
     """Service for generating baby size comparison images"""
@@ -36,6 +40,10 @@ class BabySizeImageGenerator:
         self.fruit_images_cache = {}
         self.fruit_image_urls = self._get_fruit_image_urls()
         self.openai_service = openai_service
+        
+        # Image downloads and DALL-E calls reuse pooled keep-alive connections
+        self._http_session = requests.Session()
+        self._openai_client = None
     
     def _get_fruit_image_urls(self) -> Dict:
         """Get URLs for real fruit/vegetable images - high quality photos"""
@@ -165,14 +173,14 @@ class BabySizeImageGenerator:
     def generate_real_fruit_only_image(self, week: int) -> str:
         """Generate real fruit image for baby size comparison"""
         try:
-            # Get fruit name from full pregnancy data
-            fruit_name = self._get_fruit_name_for_week(week)
-            
-            # Check cache first
-            cache_key = f"{week}_{fruit_name}"
+            # Check cache first, keyed by week so a hit skips the fruit name lookup
+            cache_key = f"fruit_{week}"
             if cache_key in self.fruit_images_cache:
                 return self.fruit_images_cache[cache_key]
             
+            # Get fruit name from full pregnancy data
+            fruit_name = self._get_fruit_name_for_week(week)
+            
             # Get fruit image URL
             fruit_url = self.fruit_image_urls.get(fruit_name)
             if not fruit_url:
@@ -181,7 +189,7 @@ class BabySizeImageGenerator:
             
             # Download and process image
             headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-            response = requests.get(fruit_url, headers=headers, timeout=10)
+            response = self._http_session.get(fruit_url, headers=headers, timeout=10)
             response.raise_for_status()
             
             # Convert to base64
@@ -224,16 +232,18 @@ class BabySizeImageGenerator:
             return self._get_fallback_image(week)
     
     async def _generate_openai_image(self, week: int, fruit_name: str) -> str:
-        """Generate image using OpenAI DALL-E"""
+        """Generate image using OpenAI DALL-E without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._generate_openai_image_sync, week, fruit_name)
+    
+    def _generate_openai_image_sync(self, week: int, fruit_name: str) -> str:
+        """Generate image using OpenAI DALL-E (blocking)"""
         try:
             # Create prompt for single fruit image
             prompt = f"A single {fruit_name.lower()} on a clean white background, professional photography style, high quality, isolated object, perfect for baby size comparison during pregnancy week {week}"
             
             # Generate image using OpenAI
-            import openai
-            client = openai.OpenAI(api_key=settings.OPENAI_API_KEY)
-            
-            response = client.images.generate(
+            response = self._get_openai_client().images.generate(
                 model="dall-e-3",
                 prompt=prompt,
                 size="1024x1024",
@@ -245,7 +255,7 @@ class BabySizeImageGenerator:
             image_url = response.data[0].url
             
             # Download image
-            image_response = requests.get(image_url, timeout=30)
+            image_response = self._http_session.get(image_url, timeout=30)
             image_response.raise_for_status()
             
             # Convert to base64
@@ -256,6 +266,16 @@ class BabySizeImageGenerator:
             print(f"Error generating OpenAI image: {e}")
             raise
     
+    def _get_openai_client(self):
+        """Get the sync OpenAI client used for DALL-E, created on first use"""
+        if self._openai_client is None:
+            import openai
+            self._openai_client = openai.OpenAI(
+                api_key=settings.OPENAI_API_KEY,
+                max_retries=settings.OPENAI_MAX_RETRIES
+            )
+        return self._openai_client
+    
     def _get_fallback_image(self, week: int) -> str:
         """Get fallback image when other methods fail"""
         try:
@@ -0,0 +1,52 @@
+"""
+Precompute Trimester AI Responses
+
+Runs the baby size, symptoms, screening, wellness and nutrition prompts for
+the given weeks as a single OpenAI Batch API job and writes the parsed
+responses to a JSON file. Set OPENAI_PRECOMPUTED_PATH to that file and every
+worker's OpenAIBabySizeService answers those weeks without calling OpenAI.
+
+Usage:
+    python -m app.modules.trimester.precompute --output trimester_precomputed.json
+    python -m app.modules.trimester.precompute --weeks 1-13,20 --output first_trimester.json
+"""
+
+import argparse
+import asyncio
+import logging
+from typing import List
+
+from .config import settings
+from .services import OpenAIBabySizeService
+
+
+def _parse_weeks(value: str) -> List[int]:
+    """Parse a week list such as "1-40" or "1-13,20" """
+    weeks = set()
+    for part in value.split(","):
+        start, _, end = part.strip().partition("-")
+        weeks.update(range(int(start), int(end or start) + 1))
+    if not weeks or min(weeks) < 1 or max(weeks) > 40:
+        raise argparse.ArgumentTypeError("weeks must be between 1 and 40")
+    return sorted(weeks)
+
+
+async def _precompute(weeks: List[int], output: str):
+    service = OpenAIBabySizeService()
+    await service.get_bundle_batch(weeks)
+    service.save_precomputed(output)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Precompute trimester AI responses with the OpenAI Batch API")
+    parser.add_argument("--weeks", type=_parse_weeks, default=list(range(1, 41)), help="weeks to precompute, e.g. 1-40 or 1-13,20")
+    parser.add_argument("--output", default=settings.OPENAI_PRECOMPUTED_PATH or "trimester_precomputed.json", help="JSON file to write")
+    args = parser.parse_args(argv)
+    
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_precompute(args.weeks, args.output))
+    print(f"[OK] Precomputed OpenAI responses for {len(args.weeks)} weeks written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
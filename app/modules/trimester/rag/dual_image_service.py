@@ -5,8 +5,9 @@ This service combines RAG and OpenAI for baby size images
 with intelligent fallback mechanisms.
 """
 
+import asyncio
 import base64
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AsyncIterator
 from io import BytesIO
 
 from ..services import PregnancyDataService, OpenAIBabySizeService
@@ -77,30 +78,15 @@ class DualImageService:
                 "personalized_info": {}
             }
             
-            # Generate images using different methods
-            enhanced_data["images"] = await self._generate_all_image_types(week)
-            
-            # Add RAG analysis if requested
-            if include_rag_analysis and self.rag_service and patient_id:
-                try:
-                    rag_response = await self.rag_service.get_personalized_developments(
-                        week=week,
-                        patient_id=patient_id,
-                        use_mock_data=use_mock_data
-                    )
-                    enhanced_data["rag_analysis"] = rag_response.dict() if hasattr(rag_response, 'dict') else rag_response
-                except Exception as e:
-                    print(f"RAG analysis failed: {e}")
-                    enhanced_data["rag_analysis"] = {"error": str(e)}
+            # Generate images and the RAG analysis (if requested) concurrently,
+            # they do not depend on each other
+            enhanced_data["images"], enhanced_data["rag_analysis"] = await asyncio.gather(
+                self._generate_all_image_types(week),
+                self._get_rag_analysis(week, patient_id, use_mock_data, include_rag_analysis)
+            )
             
             # Add personalized information
-            enhanced_data["personalized_info"] = {
-                "patient_id": patient_id,
-                "use_mock_data": use_mock_data,
-                "rag_available": self.rag_service is not None,
-                "openai_available": self.openai_service is not None,
-                "image_generator_available": self.image_generator is not None
-            }
+            enhanced_data["personalized_info"] = self._get_personalized_info(patient_id, use_mock_data)
             
             return enhanced_data
             
@@ -112,14 +98,99 @@ class DualImageService:
                 "message": f"Failed to get enhanced week data: {str(e)}"
             }
     
+    async def stream_enhanced_week_data(
+        self,
+        week: int,
+        patient_id: str = None,
+        use_mock_data: bool = True,
+        include_rag_analysis: bool = True
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield the same enhanced week data as get_enhanced_week_data_with_image in parts
+        
+        The base week data is yielded first, then the "images" and "rag_analysis"
+        parts in the order they finish.
+        """
+        try:
+            week_data = self.pregnancy_service.get_week_data(week)
+        except Exception as e:
+            yield {
+                "success": False,
+                "error": str(e),
+                "week": week,
+                "message": f"Failed to get enhanced week data: {str(e)}"
+            }
+            return
+        
+        yield {
+            "success": True,
+            "week": week,
+            "trimester": week_data.trimester,
+            "base_data": week_data.dict() if hasattr(week_data, 'dict') else week_data,
+            "personalized_info": self._get_personalized_info(patient_id, use_mock_data)
+        }
+        
+        parts = {
+            asyncio.ensure_future(self._generate_all_image_types(week)): "images",
+            asyncio.ensure_future(
+                self._get_rag_analysis(week, patient_id, use_mock_data, include_rag_analysis)
+            ): "rag_analysis"
+        }
+        pending = set(parts)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield {parts[task]: task.result()}
+        finally:
+            # The consumer may stop early, e.g. when the client disconnects
+            for task in pending:
+                task.cancel()
+    
+    def _get_personalized_info(self, patient_id: Optional[str], use_mock_data: bool) -> Dict[str, Any]:
+        """Get the personalization flags included with enhanced week data"""
+        return {
+            "patient_id": patient_id,
+            "use_mock_data": use_mock_data,
+            "rag_available": self.rag_service is not None,
+            "openai_available": self.openai_service is not None,
+            "image_generator_available": self.image_generator is not None
+        }
+    
+    async def _get_rag_analysis(
+        self,
+        week: int,
+        patient_id: Optional[str],
+        use_mock_data: bool,
+        include_rag_analysis: bool
+    ) -> Dict[str, Any]:
+        """Get RAG-based personalized analysis, empty if not requested"""
+        if not (include_rag_analysis and self.rag_service and patient_id):
+            return {}
+        
+        try:
+            rag_response = await self.rag_service.get_personalized_developments(
+                week=week,
+                patient_id=patient_id,
+                use_mock_data=use_mock_data
+            )
+            return rag_response.dict() if hasattr(rag_response, 'dict') else rag_response
+        except Exception as e:
+            print(f"RAG analysis failed: {e}")
+            return {"error": str(e)}
+    
     async def _generate_all_image_types(self, week: int) -> Dict[str, Any]:
         """Generate all types of images for a given week"""
         images = {}
+        # Real fruit and matplotlib generators are blocking, run them in the executor
+        loop = asyncio.get_running_loop()
         
         # 1. RAG-based real fruit image
         try:
             if self.image_generator:
-                rag_image = self.image_generator.generate_real_fruit_only_image(week)
+                rag_image = await loop.run_in_executor(
+                    None, self.image_generator.generate_real_fruit_only_image, week
+                )
                 images["rag"] = {
                     "type": "real_fruit",
                     "data": rag_image,
@@ -155,7 +226,9 @@ class DualImageService:
         # 3. Traditional matplotlib image
         try:
             if self.image_generator:
-                traditional_image = self.image_generator.generate_baby_size_image(week)
+                traditional_image = await loop.run_in_executor(
+                    None, self.image_generator.generate_baby_size_image, week
+                )
                 images["traditional"] = {
                     "type": "matplotlib",
                     "data": traditional_image,
@@ -12,6 +12,7 @@ from datetime import datetime, timedelta
 
 from ..schemas import PatientProfile, PatientDiseaseHistory
 from ..config import settings
+from ..http_client import get_http_client
 
 
 class PatientBackendService:
@@ -28,14 +29,13 @@ class PatientBackendService:
             if self.api_key:
                 headers["Authorization"] = f"Bearer {self.api_key}"
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.backend_url}/patients/{patient_id}",
-                    headers=headers,
-                    timeout=30.0
-                )
-                response.raise_for_status()
-                return PatientProfile(**response.json())
+            response = await get_http_client().get(
+                f"{self.backend_url}/patients/{patient_id}",
+                headers=headers,
+                timeout=30.0
+            )
+            response.raise_for_status()
+            return PatientProfile(**response.json())
         
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
@@ -58,17 +58,16 @@ class PatientBackendService:
             if self.api_key:
                 headers["Authorization"] = f"Bearer {self.api_key}"
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.backend_url}/patients/search",
-                    params={"conditions": ",".join(conditions)},
-                    headers=headers,
-                    timeout=30.0
-                )
-                response.raise_for_status()
-                
-                patients_data = response.json()
-                return [PatientProfile(**patient) for patient in patients_data]
+            response = await get_http_client().get(
+                f"{self.backend_url}/patients/search",
+                params={"conditions": ",".join(conditions)},
+                headers=headers,
+                timeout=30.0
+            )
+            response.raise_for_status()
+            
+            patients_data = response.json()
+            return [PatientProfile(**patient) for patient in patients_data]
         
         except httpx.HTTPStatusError as e:
             raise Exception(f"Backend API error: {e.response.status_code} - {e.response.text}")
@@ -147,19 +146,18 @@ class PatientBackendService:
             if self.api_key:
                 headers["Authorization"] = f"Bearer {self.api_key}"
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.backend_url}/health",
-                    headers=headers,
-                    timeout=10.0
-                )
-                response.raise_for_status()
-                
-                return {
-                    "status": "healthy",
-                    "backend_url": self.backend_url,
-                    "response_time": response.elapsed.total_seconds()
-                }
+            response = await get_http_client().get(
+                f"{self.backend_url}/health",
+                headers=headers,
+                timeout=10.0
+            )
+            response.raise_for_status()
+            
+            return {
+                "status": "healthy",
+                "backend_url": self.backend_url,
+                "response_time": response.elapsed.total_seconds()
+            }
         
         except Exception as e:
             return {
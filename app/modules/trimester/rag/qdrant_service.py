@@ -5,13 +5,16 @@ This service handles all interactions with the Qdrant vector database
 for semantic search and RAG functionality.
 """
 
-from qdrant_client import QdrantClient
+from qdrant_client import QdrantClient, AsyncQdrantClient
 from qdrant_client.models import (
     Distance, VectorParams, PointStruct, Filter, FieldCondition, MatchValue,
-    PayloadSchemaType
+    PayloadSchemaType, SearchRequest, SearchParams, QuantizationSearchParams,
+    ScalarQuantization, ScalarQuantizationConfig, ScalarType
 )
 from sentence_transformers import SentenceTransformer
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
+import asyncio
+import time
 import uuid
 import json
 
@@ -19,6 +22,10 @@ from ..schemas import PregnancyWeek, KeyDevelopment
 from ..config import settings
 
 
+# Search params for queries that only need hit counts: skip rescoring with original vectors
+IDS_ONLY_SEARCH_PARAMS = SearchParams(quantization=QuantizationSearchParams(rescore=False))
+
+
 class QdrantService:
     """Service for Qdrant vector database operations"""
     
@@ -32,13 +39,43 @@ class QdrantService:
             api_key=settings.QDRANT_API_KEY,
             timeout=60  # Increased timeout for patient app
         )
+        # Async client is created lazily because it is bound to an event loop
+        self._async_client = None
+        self._async_client_loop = None
         self.collection_name = settings.QDRANT_COLLECTION_NAME
         self.embedding_model = SentenceTransformer(settings.EMBEDDING_MODEL)
         self.vector_size = 384  # all-MiniLM-L6-v2 produces 384-dimensional vectors
         
+        # Week data is static reference content, cache lookups for QDRANT_CACHE_TTL
+        self._week_cache: Dict[int, Tuple[float, Dict[str, Any]]] = {}
+        self._trimester_cache: Dict[int, Tuple[float, List[Dict[str, Any]]]] = {}
+        
+        # Trimester lookups only filter on payload, so their query vectors are constant
+        trimesters = (1, 2, 3)
+        self._trimester_vectors = dict(zip(
+            trimesters,
+            self.encode_queries([f"trimester {trimester} pregnancy" for trimester in trimesters])
+        ))
+        
         # Initialize collection
         self.create_collection()
     
+    def _get_cached(self, cache: Dict, key: int) -> Optional[Any]:
+        """Get a cached value if it has not expired"""
+        entry = cache.get(key)
+        if entry and time.monotonic() - entry[0] < settings.QDRANT_CACHE_TTL:
+            return entry[1]
+        return None
+    
+    def _set_cached(self, cache: Dict, key: int, value: Any):
+        """Store a value in the given cache"""
+        cache[key] = (time.monotonic(), value)
+    
+    def cache_clear(self):
+        """Clear cached week and trimester lookups"""
+        self._week_cache.clear()
+        self._trimester_cache.clear()
+    
     def create_collection(self):
         """Create Qdrant collection if it doesn't exist"""
         try:
@@ -50,6 +87,9 @@ class QdrantService:
                 self.client.create_collection(
                     collection_name=self.collection_name,
                     vectors_config=VectorParams(size=self.vector_size, distance=Distance.COSINE),
+                    quantization_config=ScalarQuantization(
+                        scalar=ScalarQuantizationConfig(type=ScalarType.INT8, always_ram=True)
+                    ),
                 )
                 print(f"Created collection: {self.collection_name}")
                 
@@ -143,59 +183,193 @@ class QdrantService:
         
         return " ".join(content_parts)
     
+    def _build_week_filter(self, week: Optional[int]) -> Optional[Filter]:
+        """Build a payload filter restricting results to a single week"""
+        if week is None:
+            return None
+        return Filter(
+            must=[
+                FieldCondition(
+                    key="week",
+                    match=MatchValue(value=week)
+                )
+            ]
+        )
+    
+    def _format_hit(self, hit) -> Dict[str, Any]:
+        """Format a Qdrant search hit into a plain dictionary"""
+        return self._format_payload(hit.payload, hit.score)
+    
+    def _format_payload(self, payload: Optional[Dict[str, Any]], score: Optional[float] = None) -> Dict[str, Any]:
+        """Format a Qdrant point payload into a plain dictionary"""
+        payload = payload or {}
+        return {
+            "week": payload.get("week"),
+            "trimester": payload.get("trimester"),
+            "score": score,
+            "content": payload.get("text_content", ""),
+            "baby_size": payload.get("baby_size"),
+            "key_developments": payload.get("key_developments", []),
+            "symptoms": payload.get("symptoms", []),
+            "tips": payload.get("tips", [])
+        }
+    
     def semantic_search(self, query: str, limit: int = 5, week_filter: Optional[int] = None) -> List[Dict[str, Any]]:
         """Perform semantic search on pregnancy data"""
         try:
             # Generate query embedding
             query_embedding = self.embedding_model.encode(query).tolist()
             
-            # Build filter
-            search_filter = None
-            if week_filter is not None:
-                search_filter = Filter(
-                    must=[
-                        FieldCondition(
-                            key="week",
-                            match=MatchValue(value=week_filter)
-                        )
-                    ]
-                )
-            
             # Perform search
             search_result = self.client.search(
                 collection_name=self.collection_name,
                 query_vector=query_embedding,
                 limit=limit,
-                query_filter=search_filter
+                query_filter=self._build_week_filter(week_filter)
             )
             
             # Format results
+            return [self._format_hit(hit) for hit in search_result]
+            
+        except Exception as e:
+            print(f"Error performing semantic search: {e}")
+            return []
+    
+    def _get_async_client(self) -> AsyncQdrantClient:
+        """Get the async Qdrant client for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            if self._async_client is not None:
+                self._close_async_client(self._async_client, self._async_client_loop)
+            self._async_client = AsyncQdrantClient(
+                url=settings.QDRANT_URL,
+                api_key=settings.QDRANT_API_KEY,
+                prefer_grpc=settings.QDRANT_PREFER_GRPC,
+                timeout=60
+            )
+            self._async_client_loop = loop
+        return self._async_client
+    
+    @staticmethod
+    def _close_async_client(client: AsyncQdrantClient, client_loop: asyncio.AbstractEventLoop):
+        """Close a client replaced by a new loop, on its own loop while that loop still runs"""
+        try:
+            if client_loop.is_running():
+                asyncio.run_coroutine_threadsafe(client.close(), client_loop)
+            else:
+                asyncio.get_running_loop().create_task(client.close())
+        except Exception as e:
+            print(f"Error closing previous async Qdrant client: {e}")
+    
+    def encode_queries(self, texts: List[str]) -> List[List[float]]:
+        """Encode several query texts in a single model call"""
+        return [embedding.tolist() for embedding in self.embedding_model.encode(texts)]
+    
+    def _build_search_requests(self, queries: List[Dict[str, Any]]) -> List[SearchRequest]:
+        """Build search requests, encoding queries without a precomputed vector in one call"""
+        texts = [q["query"] for q in queries if q.get("vector") is None]
+        encoded = iter(self.encode_queries(texts) if texts else [])
+        return [
+            SearchRequest(
+                vector=q["vector"] if q.get("vector") is not None else next(encoded),
+                limit=q.get("limit", 5),
+                filter=self._build_week_filter(q.get("week_filter")),
+                with_payload=False if q.get("ids_only") else q.get("with_payload", True),
+                with_vector=False,
+                params=IDS_ONLY_SEARCH_PARAMS if q.get("ids_only") else None
+            )
+            for q in queries
+        ]
+    
+    def semantic_search_batch(self, queries: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        Perform several semantic searches in a single Qdrant round trip
+        
+        Args:
+            queries: List of dicts with "query" and optional "limit", "week_filter",
+                     "with_payload" and precomputed "vector" keys. Set "ids_only"
+                     when only the number of hits matters: payloads are skipped
+                     and quantized scores are not rescored.
+        
+        Returns:
+            One result list per query, in the same order as the queries
+        """
+        if not queries:
+            return []
+        
+        try:
+            requests = self._build_search_requests(queries)
+            
+            # Send requests in fixed-size batches
             results = []
-            for hit in search_result:
-                results.append({
-                    "week": hit.payload.get("week"),
-                    "trimester": hit.payload.get("trimester"),
-                    "score": hit.score,
-                    "content": hit.payload.get("text_content", ""),
-                    "baby_size": hit.payload.get("baby_size"),
-                    "key_developments": hit.payload.get("key_developments", []),
-                    "symptoms": hit.payload.get("symptoms", []),
-                    "tips": hit.payload.get("tips", [])
-                })
+            batch_size = settings.QDRANT_SEARCH_BATCH_SIZE
+            for start in range(0, len(requests), batch_size):
+                batch_result = self.client.search_batch(
+                    collection_name=self.collection_name,
+                    requests=requests[start:start + batch_size]
+                )
+                results.extend([self._format_hit(hit) for hit in hits] for hits in batch_result)
             
             return results
             
         except Exception as e:
-            print(f"Error performing semantic search: {e}")
+            print(f"Error performing batched semantic search: {e}")
+            return [[] for _ in queries]
+    
+    async def async_semantic_search_batch(self, queries: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Async variant of semantic_search_batch that does not block the event loop"""
+        if not queries:
             return []
+        
+        try:
+            if all(q.get("vector") is not None for q in queries):
+                requests = self._build_search_requests(queries)
+            else:
+                # Encoding is CPU-bound, keep it off the event loop
+                loop = asyncio.get_running_loop()
+                requests = await loop.run_in_executor(None, self._build_search_requests, queries)
+            
+            client = self._get_async_client()
+            results = []
+            batch_size = settings.QDRANT_SEARCH_BATCH_SIZE
+            for start in range(0, len(requests), batch_size):
+                batch_result = await client.search_batch(
+                    collection_name=self.collection_name,
+                    requests=requests[start:start + batch_size]
+                )
+                results.extend([self._format_hit(hit) for hit in hits] for hits in batch_result)
+            
+            return results
+            
+        except Exception as e:
+            print(f"Error performing async batched semantic search: {e}")
+            return [[] for _ in queries]
+    
+    async def async_semantic_search(
+        self,
+        query: str,
+        limit: int = 5,
+        week_filter: Optional[int] = None,
+        query_vector: Optional[List[float]] = None
+    ) -> List[Dict[str, Any]]:
+        """Async variant of semantic_search, optionally with a precomputed query vector"""
+        results = await self.async_semantic_search_batch([
+            {"query": query, "limit": limit, "week_filter": week_filter, "vector": query_vector}
+        ])
+        return results[0] if results else []
     
     def get_week_by_number(self, week: int) -> Optional[Dict[str, Any]]:
         """Get specific week data by week number"""
         try:
+            cached = self._get_cached(self._week_cache, week)
+            if cached is not None:
+                return cached
+            
             # Search for specific week
             results = self.semantic_search(f"week {week}", limit=1, week_filter=week)
             
             if results:
+                self._set_cached(self._week_cache, week, results[0])
                 return results[0]
             else:
                 return None
@@ -204,9 +378,76 @@ class QdrantService:
             print(f"Error getting week {week}: {e}")
             return None
     
+    async def async_get_week_by_number(self, week: int) -> Optional[Dict[str, Any]]:
+        """Async variant of get_week_by_number"""
+        cached = self._get_cached(self._week_cache, week)
+        if cached is not None:
+            return cached
+        
+        results = await self.async_semantic_search(f"week {week}", limit=1, week_filter=week)
+        if results:
+            self._set_cached(self._week_cache, week, results[0])
+            return results[0]
+        return None
+    
+    async def async_get_week_with_related(
+        self,
+        week: int,
+        related_request: Dict[str, Any]
+    ) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Get week data and related weeks in a single round trip
+        
+        Week data is served from the cache when possible, in which case only
+        the related-weeks query (a semantic_search_batch query dict) is sent
+        to Qdrant.
+        """
+        week_data = self._get_cached(self._week_cache, week)
+        
+        queries = [related_request]
+        if week_data is None:
+            queries.append({"query": f"week {week}", "limit": 1, "week_filter": week})
+        
+        results = await self.async_semantic_search_batch(queries)
+        related_weeks = results[0]
+        
+        if week_data is None and results[1]:
+            week_data = results[1][0]
+            self._set_cached(self._week_cache, week, week_data)
+        
+        return week_data, related_weeks
+    
+    def get_all_weeks(self) -> List[Dict[str, Any]]:
+        """Get all pregnancy weeks stored in the collection, sorted by week"""
+        try:
+            results = []
+            offset = None
+            while True:
+                records, offset = self.client.scroll(
+                    collection_name=self.collection_name,
+                    limit=100,
+                    offset=offset,
+                    with_payload=True,
+                    with_vectors=False
+                )
+                results.extend(self._format_payload(record.payload) for record in records)
+                if offset is None:
+                    break
+            
+            results.sort(key=lambda x: x.get("week") or 0)
+            return results
+            
+        except Exception as e:
+            print(f"Error getting all weeks: {e}")
+            return []
+    
     def get_weeks_by_trimester(self, trimester: int) -> List[Dict[str, Any]]:
         """Get all weeks for a specific trimester"""
         try:
+            cached = self._get_cached(self._trimester_cache, trimester)
+            if cached is not None:
+                return cached
+            
             # Search with trimester filter
             search_filter = Filter(
                 must=[
@@ -217,8 +458,10 @@ class QdrantService:
                 ]
             )
             
-            # Generate a generic embedding for trimester search
-            query_embedding = self.embedding_model.encode(f"trimester {trimester} pregnancy").tolist()
+            # Reuse the precomputed embedding for trimester search
+            query_embedding = self._trimester_vectors.get(trimester)
+            if query_embedding is None:
+                query_embedding = self.embedding_model.encode(f"trimester {trimester} pregnancy").tolist()
             
             # Perform search
             search_result = self.client.search(
@@ -244,6 +487,9 @@ class QdrantService:
             # Sort by week number
             results.sort(key=lambda x: x.get("week", 0))
             
+            if results:
+                self._set_cached(self._trimester_cache, trimester, results)
+            
             return results
             
         except Exception as e:
@@ -6,15 +6,86 @@ for personalized pregnancy information based on patient medical history.
 """
 
 from typing import List, Dict, Optional, Any
-import json
+import asyncio
 import re
+import time
 
 from ..schemas import (
-    PregnancyWeek, KeyDevelopment, PersonalizedKeyDevelopment, 
+    KeyDevelopment, PersonalizedKeyDevelopment, 
     PatientProfile, PatientDiseaseHistory, RAGPregnancyResponse
 )
 from .qdrant_service import QdrantService
 from .patient_backend_service import PatientBackendService
+from ..config import settings
+
+
+# Disease keyword rules applied to active/remission conditions, in priority order:
+# (keyword, personalized note, medical consideration, risk level, monitoring)
+DISEASE_RULES = (
+    (
+        "diabetes",
+        " Given your diabetes history, blood sugar control is crucial during this development phase.",
+        "Diabetes can affect fetal growth and development",
+        "medium",
+        ("Daily blood glucose monitoring", "Nutritionist consultation", "Endocrinologist review")
+    ),
+    (
+        "hypertension",
+        " Due to your blood pressure history, cardiovascular monitoring is important.",
+        "Hypertension increases risk of preeclampsia and other complications",
+        "medium",
+        ("Daily blood pressure monitoring", "Preeclampsia screening", "Cardiologist consultation")
+    ),
+    (
+        "cancer",
+        " Your previous cancer treatment history requires special monitoring during pregnancy.",
+        "Previous cancer treatment may affect fetal development and pregnancy risks",
+        "high",
+        ("Oncologist consultation", "Specialized blood work", "High-risk pregnancy monitoring")
+    ),
+)
+
+# Query used to find weeks related to the requested one
+RELATED_WEEKS_QUERY = "week {week} pregnancy developments symptoms"
+
+# Disease statuses that still influence the current pregnancy
+ACTIVE_DISEASE_STATUSES = frozenset({"active", "remission"})
+HEALTHY_STATUS = "healthy"
+
+# Single pattern matching any disease keyword, scanned once per disease name
+DISEASE_PATTERN = re.compile(
+    "|".join(re.escape(keyword) for keyword, *_ in DISEASE_RULES),
+    re.IGNORECASE
+)
+
+MEDICATION_CONSIDERATION = "Medication safety during pregnancy needs evaluation"
+MEDICATION_MONITORING = "Medication review with healthcare provider"
+
+ADVANCED_AGE_NOTE = " Given your age, additional screening may be recommended."
+ADVANCED_AGE_CONSIDERATION = "Advanced maternal age increases certain pregnancy risks"
+ADVANCED_AGE_MONITORING = ("Genetic counseling", "Additional ultrasound monitoring")
+
+PREVIOUS_PREGNANCY_NOTE = " Your previous pregnancy experience may provide insights for this pregnancy."
+PREVIOUS_PREGNANCY_MONITORING = "Review previous pregnancy records"
+
+# Growth considerations for trimester fruit recommendations
+DIABETES_GROWTH_CONSIDERATION = "Monitor blood sugar levels as baby grows"
+HYPERTENSION_GROWTH_CONSIDERATION = "Blood pressure monitoring important during growth spurts"
+
+
+BASE_CONFIDENCE = 0.7
+CONFIDENCE_BOOST = 0.1
+
+
+def calculate_confidence_score(has_developments: bool, has_history: bool, related_count: int) -> float:
+    """
+    Score RAG confidence from data-availability features
+    
+    Kept as a pure function of plain scalars so it can be applied to
+    batches of feature rows without touching the service objects.
+    """
+    boosts = has_developments + has_history + (related_count > 1)
+    return min(BASE_CONFIDENCE + CONFIDENCE_BOOST * boosts, 1.0)
 
 
 class RAGService:
@@ -23,6 +94,62 @@ class RAGService:
     def __init__(self, qdrant_service: QdrantService, patient_service: PatientBackendService):
         self.qdrant_service = qdrant_service
         self.patient_service = patient_service
+        
+        # In-process index of the static week reference data, warmed at startup
+        self._weeks: Dict[int, Dict[str, Any]] = {}
+        self._trimester_weeks: Dict[int, List[Dict[str, Any]]] = {}
+        self._weeks_loaded_at = 0.0
+        self._week_index_refresh = None
+        self._load_week_index()
+        
+        # Related-weeks queries are static per week, embed them once up front
+        self._related_query_vectors = self._encode_related_queries()
+    
+    def _encode_related_queries(self) -> Dict[int, List[float]]:
+        """Precompute related-weeks query vectors for weeks 1-40"""
+        try:
+            weeks = range(1, 41)
+            vectors = self.qdrant_service.encode_queries(
+                [RELATED_WEEKS_QUERY.format(week=week) for week in weeks]
+            )
+            return dict(zip(weeks, vectors))
+        except Exception as e:
+            print(f"Failed to precompute related-weeks query vectors: {e}")
+            return {}
+    
+    def _load_week_index(self):
+        """Load all weeks from Qdrant into the in-process index"""
+        weeks = self.qdrant_service.get_all_weeks()
+        
+        week_index = {w["week"]: w for w in weeks if w.get("week")}
+        trimester_index = {1: [], 2: [], 3: []}
+        for week_num in sorted(week_index):
+            week_data = week_index[week_num]
+            trimester_index.setdefault(week_data.get("trimester"), []).append(week_data)
+        
+        self._weeks = week_index
+        self._trimester_weeks = trimester_index
+        self._weeks_loaded_at = time.monotonic()
+        print(f"Loaded {len(week_index)} pregnancy weeks into RAG index")
+    
+    def _ensure_week_index(self):
+        """Reload the week index once it is older than QDRANT_CACHE_TTL
+        
+        The full Qdrant scroll runs in the executor so the event loop is not
+        blocked; requests keep serving the stale index until it finishes.
+        """
+        if time.monotonic() - self._weeks_loaded_at < settings.QDRANT_CACHE_TTL:
+            return
+        if self._week_index_refresh is not None and not self._week_index_refresh.done():
+            return
+        self._week_index_refresh = asyncio.get_running_loop().run_in_executor(None, self._refresh_week_index)
+    
+    def _refresh_week_index(self):
+        """Background reload of the week index, keeping the stale copy on failure"""
+        try:
+            self._load_week_index()
+        except Exception as e:
+            print(f"Failed to refresh RAG week index: {e}")
     
     async def get_personalized_developments(
         self, 
@@ -34,50 +161,44 @@ class RAGService:
         """RAG pipeline for personalized pregnancy developments"""
         
         try:
-            # STEP 1: RETRIEVAL - Get relevant pregnancy data
-            week_data = self.qdrant_service.get_week_by_number(week)
+            # STEP 1 + 2: RETRIEVAL - Get week data, related weeks and patient
+            # medical history concurrently
+            self._ensure_week_index()
+            week_data = self._weeks.get(week)
+            # Related weeks only feed counts into the context and confidence score
+            related_request = {
+                "query": RELATED_WEEKS_QUERY.format(week=week),
+                "vector": self._related_query_vectors.get(week),
+                "limit": 3,
+                "ids_only": True
+            }
+            
+            if week_data is not None:
+                (related_weeks,), patient_profile = await asyncio.gather(
+                    self.qdrant_service.async_semantic_search_batch([related_request]),
+                    self._get_patient_profile(patient_id, use_mock_data)
+                )
+            else:
+                (week_data, related_weeks), patient_profile = await asyncio.gather(
+                    self.qdrant_service.async_get_week_with_related(week, related_request),
+                    self._get_patient_profile(patient_id, use_mock_data)
+                )
+            
             if not week_data:
                 raise ValueError(f"Week {week} data not found")
             
-            # Get related weeks for broader context
-            related_weeks = self.qdrant_service.semantic_search(
-                f"week {week} pregnancy developments symptoms", 
-                limit=3
-            )
-            
-            # STEP 2: RETRIEVAL - Get patient medical history
-            try:
-                if use_mock_data:
-                    patient_profile = self.patient_service.get_mock_patient_profile(patient_id)
-                else:
-                    patient_profile = await self.patient_service.get_patient_profile(patient_id)
-            except Exception as e:
-                print(f"Backend not available, using mock data: {e}")
-                patient_profile = self.patient_service.get_mock_patient_profile(patient_id)
+            key_developments = week_data.get("key_developments") or []
             
             # STEP 3: GENERATION - Create personalized developments
-            personalized_developments = []
-            medical_advisories = []
-            special_monitoring = []
-            
-            # Process each key development
-            for development_data in week_data.get("key_developments", []):
-                personalized_dev = self._personalize_development(
-                    development_data, 
-                    patient_profile, 
-                    week
-                )
-                personalized_developments.append(personalized_dev)
-                
-                # Collect medical advisories and monitoring recommendations
-                if personalized_dev.medical_consideration:
-                    medical_advisories.append(personalized_dev.medical_consideration)
-                
-                special_monitoring.extend(personalized_dev.monitoring_recommendations)
-            
-            # Remove duplicates
-            medical_advisories = list(set(medical_advisories))
-            special_monitoring = list(set(special_monitoring))
+            # (CPU-bound, run off the event loop in a single executor hop)
+            loop = asyncio.get_running_loop()
+            personalized_developments, medical_advisories, special_monitoring = await loop.run_in_executor(
+                None,
+                self._personalize_developments,
+                key_developments,
+                patient_profile,
+                week
+            )
             
             # STEP 4: Create RAG context
             rag_context = self._create_rag_context(week_data, patient_profile, related_weeks)
@@ -103,93 +224,123 @@ class RAGService:
             print(f"RAG processing error: {e}")
             raise
     
+    async def _get_patient_profile(self, patient_id: str, use_mock_data: bool) -> PatientProfile:
+        """Get patient profile, falling back to mock data if the backend is unavailable"""
+        try:
+            if use_mock_data:
+                return self.patient_service.get_mock_patient_profile(patient_id)
+            return await self.patient_service.get_patient_profile(patient_id)
+        except Exception as e:
+            print(f"Backend not available, using mock data: {e}")
+            return self.patient_service.get_mock_patient_profile(patient_id)
+    
+    def _personalize_developments(
+        self,
+        key_developments: List[Dict],
+        patient_profile: PatientProfile,
+        week: int
+    ):
+        """Personalize all key developments and collect advisories and monitoring"""
+        personalized_developments = []
+        medical_advisories = []
+        special_monitoring = []
+        
+        # Classify the disease history once for all developments
+        active_diseases = [
+            disease for disease in patient_profile.disease_history
+            if disease.current_status in ACTIVE_DISEASE_STATUSES
+        ]
+        
+        # Process each key development
+        for development_data in key_developments:
+            personalized_dev = self._personalize_development(
+                development_data, 
+                patient_profile, 
+                week,
+                active_diseases
+            )
+            personalized_developments.append(personalized_dev)
+            
+            # Collect medical advisories and monitoring recommendations
+            if personalized_dev.medical_consideration:
+                medical_advisories.append(personalized_dev.medical_consideration)
+            
+            special_monitoring.extend(personalized_dev.monitoring_recommendations)
+        
+        # Remove duplicates, keeping first-seen order
+        return (
+            personalized_developments,
+            list(dict.fromkeys(medical_advisories)),
+            list(dict.fromkeys(special_monitoring))
+        )
+    
     def _personalize_development(
         self, 
         development_data: Dict, 
         patient_profile: PatientProfile, 
-        week: int
+        week: int,
+        active_diseases: Optional[List[PatientDiseaseHistory]] = None
     ) -> PersonalizedKeyDevelopment:
         """Personalize a key development based on patient's medical history"""
+        if active_diseases is None:
+            active_diseases = [
+                disease for disease in patient_profile.disease_history
+                if disease.current_status in ACTIVE_DISEASE_STATUSES
+            ]
         
-        # Create KeyDevelopment object from data
+        # The Qdrant payload is validated here; nested models are not re-validated later
+        get = development_data.get
         development = KeyDevelopment(
-            title=development_data.get("title", ""),
-            description=development_data.get("description", ""),
-            icon=development_data.get("icon", ""),
-            category=development_data.get("category", "")
+            title=get("title", ""),
+            description=get("description", ""),
+            icon=get("icon", ""),
+            category=get("category", "")
         )
         
-        # Start with original description
-        personalized_note = development.description
+        # Start with original description, note fragments are joined once at the end
+        note_parts = [development.description]
         medical_consideration = ""
         risk_level = "low"
-        monitoring_recommendations = []
+        # Ordered set of monitoring recommendations (dict keys keep insertion order)
+        monitoring_recommendations = {}
         
         # Analyze patient's disease history
-        for disease in patient_profile.disease_history:
-            if disease.current_status == "active" or disease.current_status == "remission":
-                
-                # Diabetes considerations
-                if "diabetes" in disease.disease_name.lower():
-                    personalized_note += f" Given your diabetes history, blood sugar control is crucial during this development phase."
-                    medical_consideration = "Diabetes can affect fetal growth and development"
-                    risk_level = "medium"
-                    monitoring_recommendations.extend([
-                        "Daily blood glucose monitoring",
-                        "Nutritionist consultation",
-                        "Endocrinologist review"
-                    ])
-                
-                # Hypertension considerations
-                if "hypertension" in disease.disease_name.lower():
-                    personalized_note += f" Due to your blood pressure history, cardiovascular monitoring is important."
-                    medical_consideration = "Hypertension increases risk of preeclampsia and other complications"
-                    risk_level = "medium"
-                    monitoring_recommendations.extend([
-                        "Daily blood pressure monitoring",
-                        "Preeclampsia screening",
-                        "Cardiologist consultation"
-                    ])
-                
-                # Cancer considerations
-                if "cancer" in disease.disease_name.lower():
-                    personalized_note += f" Your previous cancer treatment history requires special monitoring during pregnancy."
-                    medical_consideration = "Previous cancer treatment may affect fetal development and pregnancy risks"
-                    risk_level = "high"
-                    monitoring_recommendations.extend([
-                        "Oncologist consultation",
-                        "Specialized blood work",
-                        "High-risk pregnancy monitoring"
-                    ])
-                
-                # General medication considerations
-                if disease.treatment:
-                    personalized_note += f" Current medications ({', '.join(disease.treatment)}) may need review during pregnancy."
-                    medical_consideration = "Medication safety during pregnancy needs evaluation"
-                    monitoring_recommendations.append("Medication review with healthcare provider")
+        for disease in active_diseases:
+            # Disease-specific considerations
+            matched = {m.group(0).lower() for m in DISEASE_PATTERN.finditer(disease.disease_name)}
+            for keyword, note, consideration, level, monitoring in DISEASE_RULES:
+                if keyword in matched:
+                    note_parts.append(note)
+                    medical_consideration = consideration
+                    risk_level = level
+                    monitoring_recommendations.update(dict.fromkeys(monitoring))
+            
+            # General medication considerations
+            if disease.treatment:
+                note_parts.append(f" Current medications ({', '.join(disease.treatment)}) may need review during pregnancy.")
+                medical_consideration = MEDICATION_CONSIDERATION
+                monitoring_recommendations[MEDICATION_MONITORING] = None
         
         # Age considerations
         if patient_profile.age > 35:
-            personalized_note += " Given your age, additional screening may be recommended."
-            medical_consideration = "Advanced maternal age increases certain pregnancy risks"
+            note_parts.append(ADVANCED_AGE_NOTE)
+            medical_consideration = ADVANCED_AGE_CONSIDERATION
             if risk_level == "low":
                 risk_level = "medium"
-            monitoring_recommendations.extend([
-                "Genetic counseling",
-                "Additional ultrasound monitoring"
-            ])
+            monitoring_recommendations.update(dict.fromkeys(ADVANCED_AGE_MONITORING))
         
         # Previous pregnancy considerations
         if patient_profile.previous_pregnancies > 0:
-            personalized_note += " Your previous pregnancy experience may provide insights for this pregnancy."
-            monitoring_recommendations.append("Review previous pregnancy records")
+            note_parts.append(PREVIOUS_PREGNANCY_NOTE)
+            monitoring_recommendations[PREVIOUS_PREGNANCY_MONITORING] = None
         
-        return PersonalizedKeyDevelopment(
+        # Every field below is built here from validated values, so skip re-validation
+        return PersonalizedKeyDevelopment.model_construct(
             original_development=development,
-            personalized_note=personalized_note,
+            personalized_note="".join(note_parts),
             medical_consideration=medical_consideration,
             risk_level=risk_level,
-            monitoring_recommendations=list(set(monitoring_recommendations))
+            monitoring_recommendations=list(monitoring_recommendations)
         )
     
     def _create_rag_context(
@@ -199,32 +350,24 @@ class RAGService:
         related_weeks: List[Dict]
     ) -> str:
         """Create RAG context for the personalized response"""
+        diseases = patient_profile.disease_history
         
-        context_parts = [
+        return " | ".join((
             f"Pregnancy Week {week_data.get('week', 'unknown')} Information:",
             f"Baby Size: {week_data.get('baby_size', {}).get('size', 'unknown')}",
-            f"Key Developments: {len(week_data.get('key_developments', []))} developments identified"
-        ]
-        
-        # Add patient context
-        context_parts.extend([
+            f"Key Developments: {len(week_data.get('key_developments', []))} developments identified",
+            # Patient context
             f"Patient Profile: Age {patient_profile.age}, Blood Type {patient_profile.blood_type}",
-            f"Medical History: {len(patient_profile.disease_history)} conditions documented"
-        ])
-        
-        # Add disease history context
-        for disease in patient_profile.disease_history:
-            if disease.current_status != "healthy":
-                context_parts.append(
-                    f"- {disease.disease_name}: {disease.severity} severity, "
-                    f"{disease.current_status} status"
-                )
-        
-        # Add related weeks context
-        if related_weeks:
-            context_parts.append(f"Related Weeks Context: {len(related_weeks)} similar weeks analyzed")
-        
-        return " | ".join(context_parts)
+            f"Medical History: {len(diseases)} conditions documented",
+            # Disease history context
+            *(
+                f"- {disease.disease_name}: {disease.severity} severity, {disease.current_status} status"
+                for disease in diseases
+                if disease.current_status != HEALTHY_STATUS
+            ),
+            # Related weeks context
+            *((f"Related Weeks Context: {len(related_weeks)} similar weeks analyzed",) if related_weeks else ())
+        ))
     
     def _calculate_confidence_score(
         self, 
@@ -233,21 +376,11 @@ class RAGService:
         related_weeks: List[Dict]
     ) -> float:
         """Calculate confidence score for the RAG response"""
-        
-        base_score = 0.7  # Base confidence
-        
-        # Boost confidence based on data availability
-        if week_data and week_data.get("key_developments"):
-            base_score += 0.1
-        
-        if patient_profile and patient_profile.disease_history:
-            base_score += 0.1
-        
-        if related_weeks and len(related_weeks) > 1:
-            base_score += 0.1
-        
-        # Cap at 1.0
-        return min(base_score, 1.0)
+        return calculate_confidence_score(
+            has_developments=bool(week_data and week_data.get("key_developments")),
+            has_history=bool(patient_profile and patient_profile.disease_history),
+            related_count=len(related_weeks) if related_weeks else 0
+        )
     
     async def get_trimester_fruit_recommendations(
         self,
@@ -259,7 +392,12 @@ class RAGService:
         
         try:
             # Get trimester weeks
-            trimester_weeks = self.qdrant_service.get_weeks_by_trimester(trimester)
+            self._ensure_week_index()
+            trimester_weeks = self._trimester_weeks.get(trimester)
+            if not trimester_weeks:
+                trimester_weeks = await asyncio.get_running_loop().run_in_executor(
+                    None, self.qdrant_service.get_weeks_by_trimester, trimester
+                )
             
             if not trimester_weeks:
                 raise ValueError(f"No data found for trimester {trimester}")
@@ -274,31 +412,20 @@ class RAGService:
                 print(f"Using mock data for fruit recommendations: {e}")
                 patient_profile = self.patient_service.get_mock_patient_profile(patient_id)
             
-            # Generate fruit recommendations
-            fruit_recommendations = []
+            # Derive the growth consideration once, it is the same for every week
+            growth_consideration = ""
+            for disease in patient_profile.disease_history:
+                matched = {m.group(0).lower() for m in DISEASE_PATTERN.finditer(disease.disease_name)}
+                if "diabetes" in matched:
+                    growth_consideration = DIABETES_GROWTH_CONSIDERATION
+                elif "hypertension" in matched:
+                    growth_consideration = HYPERTENSION_GROWTH_CONSIDERATION
             
-            for week_data in trimester_weeks:
-                week_num = week_data.get("week", 0)
-                baby_size = week_data.get("baby_size", {})
-                
-                # Create personalized fruit recommendation
-                recommendation = {
-                    "week": week_num,
-                    "fruit_name": baby_size.get("size", "Unknown"),
-                    "weight": baby_size.get("weight", "Unknown"),
-                    "length": baby_size.get("length", "Unknown"),
-                    "personalized_note": f"Baby size comparison for week {week_num}",
-                    "medical_consideration": ""
-                }
-                
-                # Add medical considerations based on patient history
-                for disease in patient_profile.disease_history:
-                    if "diabetes" in disease.disease_name.lower():
-                        recommendation["medical_consideration"] = "Monitor blood sugar levels as baby grows"
-                    elif "hypertension" in disease.disease_name.lower():
-                        recommendation["medical_consideration"] = "Blood pressure monitoring important during growth spurts"
-                
-                fruit_recommendations.append(recommendation)
+            # Generate fruit recommendations
+            fruit_recommendations = [
+                self._build_fruit_recommendation(week_data, growth_consideration)
+                for week_data in trimester_weeks
+            ]
             
             return {
                 "success": True,
@@ -319,11 +446,25 @@ class RAGService:
                 "message": f"Failed to generate trimester fruit recommendations: {str(e)}"
             }
     
+    def _build_fruit_recommendation(self, week_data: Dict, growth_consideration: str) -> Dict[str, Any]:
+        """Create a personalized fruit size recommendation for a single week"""
+        week_num = week_data.get("week", 0)
+        baby_size = week_data.get("baby_size", {})
+        return {
+            "week": week_num,
+            "fruit_name": baby_size.get("size", "Unknown"),
+            "weight": baby_size.get("weight", "Unknown"),
+            "length": baby_size.get("length", "Unknown"),
+            "personalized_note": f"Baby size comparison for week {week_num}",
+            "medical_consideration": growth_consideration
+        }
+    
     def health_check(self) -> Dict[str, Any]:
         """Check the health of the RAG service"""
         return {
             "status": "healthy",
             "qdrant_available": self.qdrant_service is not None,
             "patient_service_available": self.patient_service is not None,
+            "indexed_weeks": len(self._weeks),
             "service_type": "rag_service"
         }
@@ -5,89 +5,223 @@ This file contains all Flask routes for the trimester module,
 converted from the original FastAPI endpoints.
 """
 
-from flask import Blueprint, request, jsonify, Response
+from flask import Blueprint, request, jsonify, Response, current_app, stream_with_context
 from functools import wraps
 import asyncio
-import base64
+import concurrent.futures
+import hashlib
 import json
-from typing import Optional, Dict, Any
+import logging
+import threading
+import time
+import uuid
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 
 # Create blueprint
 trimester_bp = Blueprint('trimester', __name__)
 
+logger = logging.getLogger(__name__)
+
 from .services import PregnancyDataService, OpenAIBabySizeService
 from .rag import RAGService, QdrantService, PatientBackendService, DualImageService
 from .image_generator import BabySizeImageGenerator
 from .schemas import (
-    PregnancyResponse, QuickActionResponse, RAGPregnancyResponse
+    PregnancyResponse, RAGPregnancyResponse
 )
 from .config import settings
 
 # Import auth decorator and database
 from app.core.auth import token_required
 from app.core.database import db
+from app.core.cache import cache, CACHING_AVAILABLE
+from app.shared.async_runner import run_coro, get_shared_loop
 
+try:
+    import pybase64 as base64  # SIMD-accelerated drop-in for the stdlib module
+except ImportError:
+    import base64
+
+
+# Services are created on first use rather than at import time, so importing
+# the blueprint stays cheap, routes that never touch a service (e.g. /health)
+# do not load Qdrant, the embedding model or the OpenAI SDK, and each worker
+# process builds its own clients after forking.
+_UNSET = object()
+_services: Dict[str, Any] = {}
+_services_lock = threading.RLock()
+
+
+def _lazy_service(name: str, factory):
+    """Get a service instance, creating it with factory on first use"""
+    service = _services.get(name, _UNSET)
+    if service is _UNSET:
+        with _services_lock:
+            service = _services.get(name, _UNSET)
+            if service is _UNSET:
+                service = factory()
+                _services[name] = service
+    return service
+
+
+def _create_openai_service() -> Optional[OpenAIBabySizeService]:
+    """Initialize OpenAI service if API key is available"""
+    try:
+        service = OpenAIBabySizeService()
+        logger.info("✅ OpenAI service initialized successfully")
+        return service
+    except ValueError as e:
+        logger.warning("OpenAI service not available: %s", e)
+        return None
 
-# Initialize services
-pregnancy_service = PregnancyDataService()
-openai_service = None
-image_generator = None
-patient_service = PatientBackendService()
-rag_service = None
-dual_image_service = None
 
-# Initialize OpenAI service if API key is available
-try:
-    openai_service = OpenAIBabySizeService()
-    print("✅ OpenAI service initialized successfully")
-except ValueError as e:
-    print(f"Warning: OpenAI service not available: {e}")
+def _create_image_generator() -> Optional[BabySizeImageGenerator]:
+    """Initialize image generator"""
+    try:
+        generator = BabySizeImageGenerator(_get_openai_service())
+        logger.info("✅ Baby size image generator initialized")
+        return generator
+    except Exception as e:
+        logger.warning("Image generator initialization failed: %s", e)
+        return None
 
-# Initialize image generator
-try:
-    image_generator = BabySizeImageGenerator(openai_service)
-    print("✅ Baby size image generator initialized")
-except Exception as e:
-    print(f"Warning: Image generator initialization failed: {e}")
 
-# Initialize RAG services if Qdrant is available
-try:
-    if pregnancy_service.use_qdrant and pregnancy_service.qdrant_service:
-        rag_service = RAGService(pregnancy_service.qdrant_service, patient_service)
-        print("✅ RAG service initialized successfully")
-    else:
-        print("⚠️  RAG service not available - Qdrant not configured")
-except Exception as e:
-    print(f"⚠️  RAG service initialization failed: {e}")
+def _create_rag_service() -> Optional[RAGService]:
+    """Initialize RAG service if Qdrant is available"""
+    pregnancy_service = _get_pregnancy_service()
+    try:
+        if pregnancy_service.use_qdrant and pregnancy_service.qdrant_service:
+            service = RAGService(pregnancy_service.qdrant_service, _get_patient_service())
+            logger.info("✅ RAG service initialized successfully")
+            return service
+        logger.info("⚠️  RAG service not available - Qdrant not configured")
+    except Exception as e:
+        logger.warning("⚠️  RAG service initialization failed: %s", e)
+    return None
 
-# Initialize Dual Image Service
-try:
-    dual_image_service = DualImageService(
-        pregnancy_service=pregnancy_service,
-        rag_service=rag_service,
-        openai_service=openai_service,
-        image_generator=image_generator
-    )
-    print("✅ Dual Image Service initialized")
-except Exception as e:
-    print(f"❌ Dual Image Service initialization failed: {e}")
-    dual_image_service = None
+
+def _create_dual_image_service() -> Optional[DualImageService]:
+    """Initialize Dual Image Service"""
+    try:
+        service = DualImageService(
+            pregnancy_service=_get_pregnancy_service(),
+            rag_service=_get_rag_service(),
+            openai_service=_get_openai_service(),
+            image_generator=_get_image_generator()
+        )
+        logger.info("✅ Dual Image Service initialized")
+        return service
+    except Exception as e:
+        logger.error("❌ Dual Image Service initialization failed: %s", e)
+        return None
+
+
+def _get_pregnancy_service() -> PregnancyDataService:
+    """Get the pregnancy data service"""
+    return _lazy_service("pregnancy", PregnancyDataService)
+
+
+def _get_patient_service() -> PatientBackendService:
+    """Get the patient backend service"""
+    return _lazy_service("patient", PatientBackendService)
+
+
+def _get_openai_service() -> Optional[OpenAIBabySizeService]:
+    """Get the OpenAI service, None if not configured"""
+    return _lazy_service("openai", _create_openai_service)
+
+
+def _get_image_generator() -> Optional[BabySizeImageGenerator]:
+    """Get the baby size image generator, None if it failed to initialize"""
+    return _lazy_service("image_generator", _create_image_generator)
+
+
+def _get_rag_service() -> Optional[RAGService]:
+    """Get the RAG service, None if Qdrant is not available"""
+    return _lazy_service("rag", _create_rag_service)
+
+
+def _get_dual_image_service() -> Optional[DualImageService]:
+    """Get the Dual Image Service, None if it failed to initialize"""
+    return _lazy_service("dual_image", _create_dual_image_service)
+
+
+# Valid path parameters
+VALID_WEEKS = frozenset(range(1, 41))
+VALID_TRIMESTERS = frozenset((1, 2, 3))
+
+
+def _error_json(message: str) -> str:
+    """Serialize a static error body once, for returning with _json_response"""
+    return json.dumps({"error": message, "success": False}, separators=(",", ":"))
+
+
+# Static error bodies, serialized at import so error paths skip jsonify
+WEEK_ERROR = _error_json("Week must be between 1 and 40")
+TRIMESTER_ERROR = _error_json("Trimester must be 1, 2, or 3")
+PATIENT_ID_ERROR = _error_json("Patient ID not found in token")
+OPENAI_UNAVAILABLE_ERROR = _error_json("OpenAI service not available. Please check your API key configuration.")
+IMAGE_GENERATOR_UNAVAILABLE_ERROR = _error_json("Image generator not available")
+RAG_UNAVAILABLE_ERROR = _error_json("RAG service not available. Qdrant must be configured.")
+DUAL_IMAGE_UNAVAILABLE_ERROR = _error_json("Dual Image Service not available. Please check service initialization.")
+IMAGE_TASK_NOT_FOUND_ERROR = _error_json("Image task not found")
+
+# Maximum number of fruit images fetched at once for a trimester
+FRUIT_IMAGE_CONCURRENCY = 8
 
 
 def _run_async(coro):
-    """Helper function to run async functions in Flask"""
+    """Helper function to run async functions in Flask on the shared event loop
+
+    The per-worker loop from app.shared.async_runner keeps async clients
+    (Qdrant, httpx) connected across requests. The request thread waits at
+    most ASYNC_CALL_TIMEOUT seconds; a call that takes longer is cancelled on
+    the loop so it does not hold the worker thread.
+    """
+    return run_coro(coro, timeout=settings.ASYNC_CALL_TIMEOUT)
+
+
+def _iter_async(async_iterator):
+    """Iterate an async iterator from Flask, running each step on the shared event loop"""
     try:
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(coro)
-    except RuntimeError:
-        # Create new event loop if none exists
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            return loop.run_until_complete(coro)
-        finally:
-            loop.close()
+        while True:
+            try:
+                yield _run_async(async_iterator.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        # Runs when the client disconnects mid-stream too, so pending work is cancelled
+        _run_async(async_iterator.aclose())
+
+
+def _ndjson_response(parts) -> Response:
+    """Stream dict parts as newline-delimited JSON, one part per line"""
+    def generate():
+        for part in parts:
+            yield current_app.json.dumps(part) + "\n"
+    return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
+
+TRUE_VALUES = frozenset(('1', 'true', 't', 'yes', 'y', 'on'))
+
+
+def _query_bool(name: str, default: bool) -> bool:
+    """Parse a boolean query string parameter"""
+    value = request.args.get(name)
+    if value is None:
+        return default
+    return value.lower() in TRUE_VALUES
+
+
+def _trimester_for_week(week: int) -> int:
+    """Get the trimester for a pregnancy week, using the same boundaries as the week data"""
+    if week not in VALID_WEEKS:
+        raise ValueError(f"Week {week} is not valid. Week must be between 1 and 40.")
+    if week <= 12:
+        return 1
+    if week <= 27:
+        return 2
+    return 3
 
 
 def _serialize_pydantic(obj):
@@ -100,14 +234,456 @@ def _serialize_pydantic(obj):
         return obj
 
 
+# Serialized AI responses keyed by (action_type, week), with the model they came from
+_ai_response_dicts: Dict[Tuple[str, int], Tuple[Any, Dict[str, Any]]] = {}
+
+
+def _serialize_ai_response(action_type: str, week: int, info) -> Dict[str, Any]:
+    """Serialize an AI response, reusing the dict while the service returns the same cached model"""
+    entry = _ai_response_dicts.get((action_type, week))
+    if entry is not None and entry[0] is info:
+        return entry[1]
+    info_dict = _serialize_pydantic(info)
+    _ai_response_dicts[(action_type, week)] = (info, info_dict)
+    return info_dict
+
+
+async def _get_week_extras(week: int, use_openai: bool, include_fruit_image: bool):
+    """Get the optional AI baby size and real fruit image for a week concurrently"""
+    openai_service = _get_openai_service()
+    image_generator = _get_image_generator()
+    loop = asyncio.get_running_loop()
+    
+    async def ai_baby_size():
+        if not (use_openai and openai_service):
+            return None
+        try:
+            return await openai_service.get_baby_size_for_week(week)
+        except Exception as e:
+            logger.warning("OpenAI baby size generation failed: %s", e)
+            return None
+    
+    async def fruit_image():
+        if not (include_fruit_image and image_generator):
+            return None
+        try:
+            return await loop.run_in_executor(None, image_generator.generate_real_fruit_only_image, week)
+        except Exception as e:
+            logger.warning("Real fruit image generation failed: %s", e)
+            return None
+    
+    return await asyncio.gather(ai_baby_size(), fruit_image())
+
+
+async def _get_fruit_images(weeks: List[int]) -> List[Any]:
+    """Get real fruit images for several weeks concurrently
+    
+    Returns one entry per week, either the image data or the exception raised.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(FRUIT_IMAGE_CONCURRENCY)
+    
+    async def fruit_image(week: int):
+        async with semaphore:
+            return await loop.run_in_executor(None, _get_image_generator().generate_real_fruit_only_image, week)
+    
+    return await asyncio.gather(*(fruit_image(week) for week in weeks), return_exceptions=True)
+
+
+async def _get_baby_size_and_detail(week: int):
+    """Get AI baby size and detailed baby information concurrently"""
+    openai_service = _get_openai_service()
+    return await asyncio.gather(
+        openai_service.get_baby_size_for_week(week),
+        openai_service.get_detailed_baby_info(week)
+    )
+
+
+# Week data is static, so its responses are serialized once on first use
+_all_weeks_json = None
+_developments_json: Dict[int, str] = {}
+_trimester_week_dicts: Dict[int, List[Dict[str, Any]]] = {}
+_trimester_json: Dict[int, str] = {}
+
+# Service availability does not change once services are created, so the
+# root and OpenAI status responses are serialized once as well
+_root_json = None
+_openai_status_json = None
+
+
+def _json_response(payload: str, cache_control: Optional[str] = None) -> Response:
+    """Return an already serialized JSON payload"""
+    headers = {"Cache-Control": cache_control} if cache_control else None
+    return Response(payload, mimetype="application/json", headers=headers)
+
+
+def _conditional_json_response(payload: Dict[str, Any]) -> Response:
+    """Return a per-patient JSON response with an ETag of its body, answering 304 when it matches"""
+    response = jsonify(payload)
+    # Clients revalidate on every poll, an unchanged body costs only a 304
+    response.headers["Cache-Control"] = "private, no-cache"
+    # Same validator as the baby images, blake2b is faster than add_etag's sha1
+    response.set_etag(hashlib.blake2b(response.get_data(), digest_size=16).hexdigest())
+    return response.make_conditional(request)
+
+
+def _get_all_weeks_json() -> str:
+    """Get the serialized /weeks response"""
+    global _all_weeks_json
+    if _all_weeks_json is None:
+        all_weeks = {
+            str(k): _serialize_pydantic(v) for k, v in _get_pregnancy_service().get_all_weeks().items()
+        }
+        _all_weeks_json = json.dumps({
+            "success": True,
+            "data": all_weeks,
+            "message": f"Successfully retrieved data for {len(all_weeks)} weeks"
+        }, separators=(",", ":"))
+    return _all_weeks_json
+
+
+def _get_developments_json(week: int) -> str:
+    """Get the serialized /week/<week>/developments response"""
+    payload = _developments_json.get(week)
+    if payload is None:
+        week_data = _get_pregnancy_service().get_week_data(week)
+        payload = json.dumps({
+            "success": True,
+            "week": week,
+            "developments": [_serialize_pydantic(dev) for dev in week_data.key_developments],
+            "message": f"Successfully retrieved developments for week {week}"
+        }, separators=(",", ":"))
+        _developments_json[week] = payload
+    return payload
+
+
+def _build_trimester_response(trimester: int, include_fruit_images: bool, fruit_images: List[Any]) -> Dict[str, Any]:
+    """Build the /trimester/<trimester> response with one fruit image entry per week"""
+    enhanced_weeks = []
+    for week_dict, fruit_image in zip(_get_trimester_week_dicts(trimester), fruit_images):
+        if isinstance(fruit_image, Exception):
+            logger.warning("Fruit image generation failed for week %s: %s", week_dict['week'], fruit_image)
+            fruit_image = None
+        
+        enhanced_weeks.append({
+            **week_dict,
+            'fruit_image': fruit_image,
+            'fruit_image_available': fruit_image is not None
+        })
+    
+    return {
+        "success": True,
+        "trimester": trimester,
+        "weeks": enhanced_weeks,
+        "total_weeks": len(enhanced_weeks),
+        "fruit_images_included": include_fruit_images,
+        "message": f"Successfully retrieved {len(enhanced_weeks)} weeks for trimester {trimester} with fruit images"
+    }
+
+
+def _get_trimester_json(trimester: int) -> str:
+    """Get the serialized /trimester/<trimester> response without fruit images"""
+    payload = _trimester_json.get(trimester)
+    if payload is None:
+        week_count = len(_get_trimester_week_dicts(trimester))
+        payload = json.dumps(
+            _build_trimester_response(trimester, False, [None] * week_count),
+            separators=(",", ":")
+        )
+        _trimester_json[trimester] = payload
+    return payload
+
+
+def _build_root_info() -> Dict[str, Any]:
+    """Build the API information returned by the root endpoint"""
+    dual_image_service = _get_dual_image_service()
+    pregnancy_service = _get_pregnancy_service()
+    return {
+        "message": "Pregnancy Week Development API",
+        "version": "1.0.0",
+        "endpoints": {
+            "get_week": "/trimester/week/{week}",
+            "get_enhanced_week": "/trimester/week/{week}/enhanced",
+            "get_all_weeks": "/trimester/weeks",
+            "get_trimester": "/trimester/trimester/{trimester}",
+            "semantic_search": "/trimester/search?query={query}",
+            "health": "/trimester/health"
+        },
+        "features": {
+            "qdrant_enabled": pregnancy_service.use_qdrant,
+            "semantic_search_available": pregnancy_service.use_qdrant,
+            "rag_personalization_available": _get_rag_service() is not None,
+            "dual_image_service_available": dual_image_service is not None,
+            "service_status": dual_image_service.get_service_status() if dual_image_service else {}
+        }
+    }
+
+
+def _get_trimester_week_dicts(trimester: int) -> List[Dict[str, Any]]:
+    """Get serialized week data for a trimester, callers must copy before modifying"""
+    week_dicts = _trimester_week_dicts.get(trimester)
+    if week_dicts is None:
+        week_dicts = [
+            _serialize_pydantic(week_data) for week_data in _get_pregnancy_service().get_weeks_by_trimester(trimester)
+        ]
+        _trimester_week_dicts[trimester] = week_dicts
+    return week_dicts
+
+
+# Serialized week data keyed by week; week data is static once loaded
+_week_dicts: Dict[int, Dict[str, Any]] = {}
+
+
+def _get_week_dict(week: int) -> Dict[str, Any]:
+    """Get serialized data for a week, callers must copy before modifying
+
+    Invalid weeks raise ValueError like PregnancyDataService.get_week_data.
+    """
+    week_dict = _week_dicts.get(week)
+    if week_dict is None:
+        week_dict = _serialize_pydantic(_get_pregnancy_service().get_week_data(week))
+        _week_dicts[week] = week_dict
+    return week_dict
+
+
+# Raw PNG bytes, ETag and data URL of generated baby size images, keyed by
+# week. A cache hit never reaches the image generator, so conditional requests
+# answer 304 from memory and base64 requests skip re-encoding.
+_png_cache: Dict[int, Tuple[bytes, str, str]] = {}
+
+
+def _get_baby_image(week: int, regenerate: bool = False) -> Tuple[bytes, str, str]:
+    """Get raw PNG bytes, ETag and data URL for a week's baby size image, decoding the data URL once"""
+    cached = None if regenerate else _png_cache.get(week)
+    if cached is not None:
+        return cached
+    
+    # Wait without cancelling, other requests may be waiting on the same generation
+    return _start_baby_image_generation(week, regenerate).result(timeout=settings.ASYNC_CALL_TIMEOUT)
+
+
+async def _generate_baby_image(week: int, regenerate: bool) -> Tuple[bytes, str, str]:
+    """Generate a week's baby size image and decode it, caching generated images"""
+    image_generator = _get_image_generator()
+    image_data = await image_generator.get_or_generate_openai_image(week, regenerate)
+    
+    # Extract base64 data (remove "data:image/png;base64," prefix if present)
+    base64_data = image_data.split(',')[1] if ',' in image_data else image_data
+    image_bytes = base64.b64decode(base64_data)
+    result = (
+        image_bytes,
+        hashlib.blake2b(image_bytes, digest_size=16).hexdigest(),
+        f"data:image/png;base64,{base64_data}"
+    )
+    
+    # Only keep generated images, fallback images are retried on the next request
+    if image_generator.fruit_images_cache.get(f"openai_{week}") is image_data:
+        _png_cache[week] = result
+    return result
+
+
+# In-flight baby image generations by week, so concurrent requests for the
+# same week share one OpenAI call instead of each generating an image
+_baby_image_generations: Dict[int, concurrent.futures.Future] = {}
+_baby_image_generations_lock = threading.Lock()
+
+
+def _start_baby_image_generation(week: int, regenerate: bool = False) -> concurrent.futures.Future:
+    """Start generating a week's baby size image on the shared event loop, joining one already in flight"""
+    if regenerate:
+        return asyncio.run_coroutine_threadsafe(_generate_baby_image(week, True), get_shared_loop())
+    
+    with _baby_image_generations_lock:
+        future = _baby_image_generations.get(week)
+        if future is not None:
+            return future
+        future = asyncio.run_coroutine_threadsafe(_generate_baby_image(week, False), get_shared_loop())
+        _baby_image_generations[week] = future
+    
+    def forget(done_future):
+        with _baby_image_generations_lock:
+            if _baby_image_generations.get(week) is done_future:
+                del _baby_image_generations[week]
+    
+    future.add_done_callback(forget)
+    return future
+
+
+# Background baby image jobs by task_id. Job records and finished images live
+# in the shared app cache, so a status or result poll can land on any worker
+# as long as CACHE_REDIS_URL points every worker at the same Redis. Without
+# Flask-Caching they fall back to a process-local store, which needs a single
+# worker. Entries expire after BABY_IMAGE_JOB_TTL seconds.
+BABY_IMAGE_JOB_KEY = "trimester:baby_image_job:{}"
+BABY_IMAGE_RESULT_KEY = "trimester:baby_image_result:{}"
+
+_local_baby_image_jobs: Dict[str, Tuple[float, Any]] = {}
+_local_baby_image_jobs_lock = threading.Lock()
+
+# Typical DALL-E generation time, returned so clients can pace their polling
+BABY_IMAGE_EXPECTED_SECONDS = 20
+
+
+def _job_store_set(key: str, value: Any):
+    """Store a baby image job entry for BABY_IMAGE_JOB_TTL seconds"""
+    if CACHING_AVAILABLE:
+        cache.set(key, value, timeout=settings.BABY_IMAGE_JOB_TTL)
+        return
+    now = time.monotonic()
+    with _local_baby_image_jobs_lock:
+        for stored_key, (expires_at, _) in list(_local_baby_image_jobs.items()):
+            if expires_at <= now:
+                del _local_baby_image_jobs[stored_key]
+        _local_baby_image_jobs[key] = (now + settings.BABY_IMAGE_JOB_TTL, value)
+
+
+def _job_store_get(key: str) -> Optional[Any]:
+    """Get a baby image job entry, None if missing or expired"""
+    if CACHING_AVAILABLE:
+        return cache.get(key)
+    with _local_baby_image_jobs_lock:
+        entry = _local_baby_image_jobs.get(key)
+    if entry is None or entry[0] <= time.monotonic():
+        return None
+    return entry[1]
+
+
+def _finish_baby_image_job(job: Dict[str, Any], future: concurrent.futures.Future):
+    """Record the outcome of a baby image job's generation"""
+    if future.cancelled():
+        job = {**job, "status": "failed", "error": "Image generation was cancelled"}
+    elif future.exception() is not None:
+        job = {**job, "status": "failed", "error": str(future.exception())}
+    else:
+        _job_store_set(BABY_IMAGE_RESULT_KEY.format(job["task_id"]), future.result())
+        job = {**job, "status": "completed"}
+    _job_store_set(BABY_IMAGE_JOB_KEY.format(job["task_id"]), job)
+
+
+def _submit_baby_image_job(patient_id: str, week: int, regenerate: bool) -> Dict[str, Any]:
+    """Start a background baby image job for a patient and return its job record"""
+    job = {
+        "task_id": uuid.uuid4().hex,
+        "patient_id": patient_id,
+        "week": week,
+        "regenerate": regenerate,
+        "status": "pending",
+        "error": None
+    }
+    
+    cached = None if regenerate else _png_cache.get(week)
+    if cached is not None:
+        future = concurrent.futures.Future()
+        future.set_result(cached)
+        _finish_baby_image_job(job, future)
+        return {**job, "status": "completed"}
+    
+    future = _start_baby_image_generation(week, regenerate)
+    _job_store_set(BABY_IMAGE_JOB_KEY.format(job["task_id"]), job)
+    
+    # The generation finishes on the loop thread, outside this request's app context
+    app = current_app._get_current_object()
+    
+    def on_done(done_future):
+        with app.app_context():
+            _finish_baby_image_job(job, done_future)
+    
+    future.add_done_callback(on_done)
+    return job
+
+
+def _get_baby_image_job(task_id: Optional[str], patient_id: str) -> Optional[Dict[str, Any]]:
+    """Get a baby image job record, None if it does not exist or belongs to another patient"""
+    job = _job_store_get(BABY_IMAGE_JOB_KEY.format(task_id)) if task_id else None
+    if job is None or job["patient_id"] != patient_id:
+        return None
+    return job
+
+
+def _baby_image_response(image_bytes: bytes, etag: str, filename: str, cache_control: str) -> Response:
+    """Build a PNG response with caching headers, answering 304 when the ETag matches"""
+    response = Response(
+        image_bytes,
+        mimetype="image/png",
+        headers={
+            "Content-Disposition": f"inline; filename={filename}",
+            "Cache-Control": cache_control,
+            "Content-Length": str(len(image_bytes))
+        }
+    )
+    # The ETag is a hash of the exact bytes served, so it is a strong validator
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+
+# Only the fields _get_patient_current_week reads the pregnancy week from.
+# The week is stored on the patient (complete_profile_service computes it from
+# the LMP once), so the request path does no date arithmetic.
+PATIENT_WEEK_PROJECTION = {
+    "_id": 0,
+    "pregnancy_week": 1,
+    "health_data.pregnancy_week": 1,
+    "health_data.pregnancy_info.current_week": 1,
+    "current_pregnancy_week": 1
+}
+PATIENT_WEEK_CACHE_MAX_SIZE = 10000
+
+# Patient current weeks rarely change within a session, cache them briefly
+_patient_week_cache: Dict[str, Tuple[float, int]] = {}
+
+# In-flight database lookups by patient_id. A dashboard fires several /my-*
+# requests at once, so concurrent cache misses for a patient share one query.
+_patient_week_lookups: Dict[str, concurrent.futures.Future] = {}
+_patient_week_lookups_lock = threading.Lock()
+
+
 def _get_patient_current_week(patient_id: str) -> int:
-    """Get current pregnancy week for a patient from database"""
+    """Get current pregnancy week for a patient, cached for PATIENT_WEEK_CACHE_TTL seconds"""
+    entry = _patient_week_cache.get(patient_id)
+    if entry and time.monotonic() - entry[0] < settings.PATIENT_WEEK_CACHE_TTL:
+        return entry[1]
+    
+    with _patient_week_lookups_lock:
+        lookup = _patient_week_lookups.get(patient_id)
+        if lookup is None:
+            lookup = _patient_week_lookups[patient_id] = concurrent.futures.Future()
+            is_owner = True
+        else:
+            is_owner = False
+    if not is_owner:
+        return lookup.result()
+    
+    try:
+        pregnancy_week = _load_patient_current_week(patient_id)
+        if pregnancy_week is None:
+            pregnancy_week = 1
+        else:
+            if len(_patient_week_cache) >= PATIENT_WEEK_CACHE_MAX_SIZE:
+                _patient_week_cache.clear()
+            _patient_week_cache[patient_id] = (time.monotonic(), pregnancy_week)
+        lookup.set_result(pregnancy_week)
+        return pregnancy_week
+    except BaseException as e:
+        lookup.set_exception(e)
+        raise
+    finally:
+        with _patient_week_lookups_lock:
+            del _patient_week_lookups[patient_id]
+
+
+def invalidate_patient_week_cache(patient_id: str):
+    """Drop a patient's cached current week, e.g. after their LMP changes"""
+    _patient_week_cache.pop(patient_id, None)
+
+
+def _load_patient_current_week(patient_id: str) -> Optional[int]:
+    """Get current pregnancy week for a patient from database, None if it could not be loaded"""
     try:
         # Find patient by patient_id
-        patient = db.patients_collection.find_one({"patient_id": patient_id})
+        patient = db.patients_collection.find_one({"patient_id": patient_id}, PATIENT_WEEK_PROJECTION)
         if not patient:
-            print(f"Patient {patient_id} not found, using default week 1")
-            return 1
+            logger.debug("Patient %s not found, using default week 1", patient_id)
+            return None
         
         # Try to get pregnancy week from various sources
         pregnancy_week = 1  # Default
@@ -127,12 +703,12 @@ def _get_patient_current_week(patient_id: str) -> int:
         elif 'current_pregnancy_week' in patient:
             pregnancy_week = patient['current_pregnancy_week']
         
-        print(f"[Trimester Module] Patient {patient_id} is at week {pregnancy_week}")
+        logger.debug("Patient %s is at week %s", patient_id, pregnancy_week)
         return int(pregnancy_week)
         
     except Exception as e:
-        print(f"Error getting patient week: {e}")
-        return 1
+        logger.error("Error getting patient week: %s", e)
+        return None
 
 
 def _get_patient_id_from_token() -> Optional[str]:
@@ -142,7 +718,7 @@ def _get_patient_id_from_token() -> Optional[str]:
             return request.user_data.get('patient_id')
         return None
     except Exception as e:
-        print(f"Error extracting patient_id from token: {e}")
+        logger.error("Error extracting patient_id from token: %s", e)
         return None
 
 
@@ -157,25 +733,10 @@ def health_check():
 @trimester_bp.route('/', methods=['GET'])
 def root():
     """Root endpoint with API information"""
-    return jsonify({
-        "message": "Pregnancy Week Development API",
-        "version": "1.0.0",
-        "endpoints": {
-            "get_week": "/trimester/week/{week}",
-            "get_enhanced_week": "/trimester/week/{week}/enhanced",
-            "get_all_weeks": "/trimester/weeks",
-            "get_trimester": "/trimester/trimester/{trimester}",
-            "semantic_search": "/trimester/search?query={query}",
-            "health": "/trimester/health"
-        },
-        "features": {
-            "qdrant_enabled": pregnancy_service.use_qdrant,
-            "semantic_search_available": pregnancy_service.use_qdrant,
-            "rag_personalization_available": rag_service is not None,
-            "dual_image_service_available": dual_image_service is not None,
-            "service_status": dual_image_service.get_service_status() if dual_image_service else {}
-        }
-    })
+    global _root_json
+    if _root_json is None:
+        _root_json = json.dumps(_build_root_info(), separators=(",", ":"))
+    return _json_response(_root_json)
 
 
 # Get pregnancy week information
@@ -183,38 +744,27 @@ def root():
 def get_pregnancy_week(week: int):
     """Get pregnancy week information including key developments and real fruit images"""
     try:
-        if week < 1 or week > 40:
-            return jsonify({
-                "error": "Week must be between 1 and 40",
-                "success": False
-            }), 400
+        if week not in VALID_WEEKS:
+            return _json_response(WEEK_ERROR), 400
         
         # Get query parameters
-        use_openai = request.args.get('use_openai', 'false').lower() == 'true'
-        include_fruit_image = request.args.get('include_fruit_image', 'true').lower() == 'true'
+        use_openai = _query_bool('use_openai', False)
+        include_fruit_image = _query_bool('include_fruit_image', True)
         
-        week_data = pregnancy_service.get_week_data(week)
+        week_dict = _get_week_dict(week)
         
-        # Use OpenAI for baby size if requested and available
-        if use_openai and openai_service:
-            try:
-                ai_baby_size = _run_async(openai_service.get_baby_size_for_week(week))
-                week_data.baby_size = ai_baby_size
-            except Exception as e:
-                print(f"OpenAI baby size generation failed: {e}")
-        
-        # Add real fruit image if requested
-        fruit_image_data = None
-        if include_fruit_image and image_generator:
-            try:
-                fruit_image_data = image_generator.generate_real_fruit_only_image(week)
-            except Exception as e:
-                print(f"Real fruit image generation failed: {e}")
+        # Get AI baby size and real fruit image (if requested) concurrently
+        ai_baby_size, fruit_image_data = _run_async(
+            _get_week_extras(week, use_openai, include_fruit_image)
+        )
+        if ai_baby_size:
+            # Copy so the shared week data is not modified
+            week_dict = {**week_dict, "baby_size": _serialize_pydantic(ai_baby_size)}
         
         # Create enhanced response
         response_data = {
             "success": True,
-            "data": _serialize_pydantic(week_data),
+            "data": week_dict,
             "message": f"Successfully retrieved data for week {week}",
             "fruit_image": fruit_image_data,
             "fruit_image_available": fruit_image_data is not None
@@ -238,25 +788,20 @@ def get_pregnancy_week(week: int):
 @trimester_bp.route('/week/<int:week>/enhanced', methods=['GET'])
 def get_enhanced_week_data(week: int):
     """Get enhanced pregnancy week data using both RAG and OpenAI with multiple image options"""
+    dual_image_service = _get_dual_image_service()
     try:
-        if week < 1 or week > 40:
-            return jsonify({
-                "error": "Week must be between 1 and 40",
-                "success": False
-            }), 400
+        if week not in VALID_WEEKS:
+            return _json_response(WEEK_ERROR), 400
         
         # Get query parameters
         patient_id = request.args.get('patient_id')
-        use_mock_data = request.args.get('use_mock_data', 'true').lower() == 'true'
-        include_rag_analysis = request.args.get('include_rag_analysis', 'true').lower() == 'true'
+        use_mock_data = _query_bool('use_mock_data', True)
+        include_rag_analysis = _query_bool('include_rag_analysis', True)
         image_method = request.args.get('image_method', 'all')
         
         # Get enhanced data using dual service
         if not dual_image_service:
-            return jsonify({
-                "error": "Dual Image Service not available. Please check service initialization.",
-                "success": False
-            }), 503
+            return _json_response(DUAL_IMAGE_UNAVAILABLE_ERROR), 503
         
         enhanced_data = _run_async(dual_image_service.get_enhanced_week_data_with_image(
             week=week,
@@ -297,12 +842,7 @@ def get_enhanced_week_data(week: int):
 def get_all_pregnancy_weeks():
     """Get all available pregnancy week data"""
     try:
-        all_weeks = pregnancy_service.get_all_weeks()
-        return jsonify({
-            "success": True,
-            "data": {str(k): _serialize_pydantic(v) for k, v in all_weeks.items()},
-            "message": f"Successfully retrieved data for {len(all_weeks)} weeks"
-        })
+        return _json_response(_get_all_weeks_json())
     except Exception as e:
         return jsonify({
             "error": f"Internal server error: {str(e)}",
@@ -315,20 +855,10 @@ def get_all_pregnancy_weeks():
 def get_week_developments(week: int):
     """Get only the key developments for a specific week"""
     try:
-        if week < 1 or week > 40:
-            return jsonify({
-                "error": "Week must be between 1 and 40",
-                "success": False
-            }), 400
-        
-        week_data = pregnancy_service.get_week_data(week)
+        if week not in VALID_WEEKS:
+            return _json_response(WEEK_ERROR), 400
         
-        return jsonify({
-            "success": True,
-            "week": week,
-            "developments": [_serialize_pydantic(dev) for dev in week_data.key_developments],
-            "message": f"Successfully retrieved developments for week {week}"
-        })
+        return _json_response(_get_developments_json(week))
     
     except ValueError as e:
         return jsonify({
@@ -347,46 +877,25 @@ def get_week_developments(week: int):
 def get_trimester_weeks(trimester: int):
     """Get all weeks for a specific trimester using Qdrant filtering with real fruit images"""
     try:
-        if trimester not in [1, 2, 3]:
-            return jsonify({
-                "error": "Trimester must be 1, 2, or 3",
-                "success": False
-            }), 400
+        if trimester not in VALID_TRIMESTERS:
+            return _json_response(TRIMESTER_ERROR), 400
         
-        include_fruit_images = request.args.get('include_fruit_images', 'true').lower() == 'true'
+        include_fruit_images = _query_bool('include_fruit_images', True)
+        
+        # Without fruit images the response is static
+        if not include_fruit_images:
+            return _json_response(_get_trimester_json(trimester), cache_control="public, max-age=86400")
         
         # Get trimester weeks
-        trimester_weeks = pregnancy_service.get_weeks_by_trimester(trimester)
-        
-        # Add fruit images to each week if requested
-        enhanced_weeks = []
-        for week_data in trimester_weeks:
-            week_dict = _serialize_pydantic(week_data)
-            
-            if include_fruit_images and image_generator:
-                try:
-                    # Generate real fruit image for this week
-                    fruit_image = image_generator.generate_real_fruit_only_image(week_data.week)
-                    week_dict['fruit_image'] = fruit_image
-                    week_dict['fruit_image_available'] = True
-                except Exception as e:
-                    print(f"Fruit image generation failed for week {week_data.week}: {e}")
-                    week_dict['fruit_image'] = None
-                    week_dict['fruit_image_available'] = False
-            else:
-                week_dict['fruit_image'] = None
-                week_dict['fruit_image_available'] = False
-            
-            enhanced_weeks.append(week_dict)
+        trimester_weeks = _get_trimester_week_dicts(trimester)
         
-        return jsonify({
-            "success": True,
-            "trimester": trimester,
-            "weeks": enhanced_weeks,
-            "total_weeks": len(enhanced_weeks),
-            "fruit_images_included": include_fruit_images,
-            "message": f"Successfully retrieved {len(enhanced_weeks)} weeks for trimester {trimester} with fruit images"
-        })
+        # Get fruit images for all weeks concurrently
+        if _get_image_generator():
+            fruit_images = _run_async(_get_fruit_images([week_dict["week"] for week_dict in trimester_weeks]))
+        else:
+            fruit_images = [None] * len(trimester_weeks)
+        
+        return jsonify(_build_trimester_response(trimester, include_fruit_images, fruit_images))
     
     except Exception as e:
         return jsonify({
@@ -400,23 +909,14 @@ def get_trimester_weeks(trimester: int):
 def get_baby_size_openai(week: int):
     """Get AI-powered baby size information for a specific week"""
     try:
-        if week < 1 or week > 40:
-            return jsonify({
-                "error": "Week must be between 1 and 40",
-                "success": False
-            }), 400
+        if week not in VALID_WEEKS:
+            return _json_response(WEEK_ERROR), 400
         
-        if not openai_service:
-            return jsonify({
-                "error": "OpenAI service not available. Please check your API key configuration.",
-                "success": False
-            }), 503
+        if not _get_openai_service():
+            return _json_response(OPENAI_UNAVAILABLE_ERROR), 503
         
-        # Get basic baby size
-        baby_size = _run_async(openai_service.get_baby_size_for_week(week))
-        
-        # Get detailed information
-        detailed_info = _run_async(openai_service.get_detailed_baby_info(week))
+        # Get basic baby size and detailed information concurrently
+        baby_size, detailed_info = _run_async(_get_baby_size_and_detail(week))
         
         return jsonify({
             "success": True,
@@ -442,13 +942,17 @@ def get_baby_size_openai(week: int):
 @trimester_bp.route('/openai/status', methods=['GET'])
 def get_openai_status():
     """Check if OpenAI service is available and configured"""
-    return jsonify({
-        "success": True,
-        "openai_available": openai_service is not None,
-        "model": settings.OPENAI_MODEL if openai_service else None,
-        "api_key_configured": bool(settings.OPENAI_API_KEY),
-        "message": "OpenAI service status retrieved successfully"
-    })
+    global _openai_status_json
+    if _openai_status_json is None:
+        openai_service = _get_openai_service()
+        _openai_status_json = json.dumps({
+            "success": True,
+            "openai_available": openai_service is not None,
+            "model": settings.OPENAI_MODEL if openai_service else None,
+            "api_key_configured": bool(settings.OPENAI_API_KEY),
+            "message": "OpenAI service status retrieved successfully"
+        }, separators=(",", ":"))
+    return _json_response(_openai_status_json)
 
 
 # Get baby size image
@@ -456,23 +960,17 @@ def get_openai_status():
 def get_baby_size_image_stream(week: int):
     """Get baby size comparison image - single fruit style generated by OpenAI DALL-E"""
     try:
-        if week < 1 or week > 40:
-            return jsonify({
-                "error": "Week must be between 1 and 40",
-                "success": False
-            }), 400
+        if week not in VALID_WEEKS:
+            return _json_response(WEEK_ERROR), 400
         
         format_type = request.args.get('format', 'stream')
-        regenerate = request.args.get('regenerate', 'false').lower() == 'true'
+        regenerate = _query_bool('regenerate', False)
         
-        if not image_generator:
-            return jsonify({
-                "error": "Image generator not available",
-                "success": False
-            }), 503
+        if not _get_image_generator():
+            return _json_response(IMAGE_GENERATOR_UNAVAILABLE_ERROR), 503
         
         # Get cached or generate new OpenAI image
-        image_data = _run_async(image_generator.get_or_generate_openai_image(week, regenerate))
+        image_bytes, etag, data_url = _get_baby_image(week, regenerate)
         
         # Return format based on query parameter
         if format_type == "base64":
@@ -480,23 +978,17 @@ def get_baby_size_image_stream(week: int):
             return jsonify({
                 "success": True,
                 "week": week,
-                "image_data": image_data,
+                "image_data": data_url,
                 "format": "base64",
                 "regenerated": regenerate,
                 "message": f"Successfully generated OpenAI baby size image for week {week}"
             })
         else:
             # Return raw image stream (default for <img> tags)
-            # Extract base64 data (remove "data:image/png;base64," prefix if present)
-            base64_data = image_data.split(',')[1] if ',' in image_data else image_data
-            image_bytes = base64.b64decode(base64_data)
-            
-            return Response(
-                image_bytes,
-                mimetype="image/png",
-                headers={
-                    "Content-Disposition": f"inline; filename=baby_week_{week}_openai.png"
-                }
+            return _baby_image_response(
+                image_bytes, etag,
+                filename=f"baby_week_{week}_openai.png",
+                cache_control="public, max-age=604800"
             )
     
     except Exception as e:
@@ -510,33 +1002,28 @@ def get_baby_size_image_stream(week: int):
 @trimester_bp.route('/week/<int:week>/symptoms', methods=['GET'])
 def get_early_symptoms(week: int):
     """Get AI-powered early symptoms information for a specific week"""
+    openai_service = _get_openai_service()
     try:
-        if week < 1 or week > 40:
-            return jsonify({
-                "error": "Week must be between 1 and 40",
-                "success": False
-            }), 400
+        if week not in VALID_WEEKS:
+            return _json_response(WEEK_ERROR), 400
         
         if not openai_service:
-            return jsonify({
-                "error": "OpenAI service not available. Please check your API key configuration.",
-                "success": False
-            }), 503
+            return _json_response(OPENAI_UNAVAILABLE_ERROR), 503
         
-        # Get week data for trimester info
-        week_data = pregnancy_service.get_week_data(week)
+        # Trimester is derived from the week, no week data lookup needed
+        trimester = _trimester_for_week(week)
         
         # Get AI-powered symptoms
         symptoms_info = _run_async(openai_service.get_early_symptoms(week))
         
-        return jsonify(_serialize_pydantic(QuickActionResponse(
-            success=True,
-            week=week,
-            trimester=week_data.trimester,
-            action_type="early_symptoms",
-            data=_serialize_pydantic(symptoms_info),
-            message=f"Successfully generated early symptoms information for week {week}"
-        )))
+        return jsonify({
+            "success": True,
+            "week": week,
+            "trimester": trimester,
+            "action_type": "early_symptoms",
+            "data": _serialize_ai_response("early_symptoms", week, symptoms_info),
+            "message": f"Successfully generated early symptoms information for week {week}"
+        })
     
     except ValueError as e:
         return jsonify({
@@ -554,33 +1041,28 @@ def get_early_symptoms(week: int):
 @trimester_bp.route('/week/<int:week>/screening', methods=['GET'])
 def get_prenatal_screening(week: int):
     """Get AI-powered prenatal screening information for a specific week"""
+    openai_service = _get_openai_service()
     try:
-        if week < 1 or week > 40:
-            return jsonify({
-                "error": "Week must be between 1 and 40",
-                "success": False
-            }), 400
+        if week not in VALID_WEEKS:
+            return _json_response(WEEK_ERROR), 400
         
         if not openai_service:
-            return jsonify({
-                "error": "OpenAI service not available. Please check your API key configuration.",
-                "success": False
-            }), 503
+            return _json_response(OPENAI_UNAVAILABLE_ERROR), 503
         
-        # Get week data for trimester info
-        week_data = pregnancy_service.get_week_data(week)
+        # Trimester is derived from the week, no week data lookup needed
+        trimester = _trimester_for_week(week)
         
         # Get AI-powered screening
         screening_info = _run_async(openai_service.get_prenatal_screening(week))
         
-        return jsonify(_serialize_pydantic(QuickActionResponse(
-            success=True,
-            week=week,
-            trimester=week_data.trimester,
-            action_type="prenatal_screening",
-            data=_serialize_pydantic(screening_info),
-            message=f"Successfully generated prenatal screening information for week {week}"
-        )))
+        return jsonify({
+            "success": True,
+            "week": week,
+            "trimester": trimester,
+            "action_type": "prenatal_screening",
+            "data": _serialize_ai_response("prenatal_screening", week, screening_info),
+            "message": f"Successfully generated prenatal screening information for week {week}"
+        })
     
     except ValueError as e:
         return jsonify({
@@ -598,33 +1080,28 @@ def get_prenatal_screening(week: int):
 @trimester_bp.route('/week/<int:week>/wellness', methods=['GET'])
 def get_wellness_tips(week: int):
     """Get AI-powered wellness tips for a specific week"""
+    openai_service = _get_openai_service()
     try:
-        if week < 1 or week > 40:
-            return jsonify({
-                "error": "Week must be between 1 and 40",
-                "success": False
-            }), 400
+        if week not in VALID_WEEKS:
+            return _json_response(WEEK_ERROR), 400
         
         if not openai_service:
-            return jsonify({
-                "error": "OpenAI service not available. Please check your API key configuration.",
-                "success": False
-            }), 503
+            return _json_response(OPENAI_UNAVAILABLE_ERROR), 503
         
-        # Get week data for trimester info
-        week_data = pregnancy_service.get_week_data(week)
+        # Trimester is derived from the week, no week data lookup needed
+        trimester = _trimester_for_week(week)
         
         # Get AI-powered wellness tips
         wellness_info = _run_async(openai_service.get_wellness_tips(week))
         
-        return jsonify(_serialize_pydantic(QuickActionResponse(
-            success=True,
-            week=week,
-            trimester=week_data.trimester,
-            action_type="wellness_tips",
-            data=_serialize_pydantic(wellness_info),
-            message=f"Successfully generated wellness tips for week {week}"
-        )))
+        return jsonify({
+            "success": True,
+            "week": week,
+            "trimester": trimester,
+            "action_type": "wellness_tips",
+            "data": _serialize_ai_response("wellness_tips", week, wellness_info),
+            "message": f"Successfully generated wellness tips for week {week}"
+        })
     
     except ValueError as e:
         return jsonify({
@@ -642,33 +1119,28 @@ def get_wellness_tips(week: int):
 @trimester_bp.route('/week/<int:week>/nutrition', methods=['GET'])
 def get_nutrition_tips(week: int):
     """Get AI-powered nutrition tips for a specific week"""
+    openai_service = _get_openai_service()
     try:
-        if week < 1 or week > 40:
-            return jsonify({
-                "error": "Week must be between 1 and 40",
-                "success": False
-            }), 400
+        if week not in VALID_WEEKS:
+            return _json_response(WEEK_ERROR), 400
         
         if not openai_service:
-            return jsonify({
-                "error": "OpenAI service not available. Please check your API key configuration.",
-                "success": False
-            }), 503
+            return _json_response(OPENAI_UNAVAILABLE_ERROR), 503
         
-        # Get week data for trimester info
-        week_data = pregnancy_service.get_week_data(week)
+        # Trimester is derived from the week, no week data lookup needed
+        trimester = _trimester_for_week(week)
         
         # Get AI-powered nutrition tips
         nutrition_info = _run_async(openai_service.get_nutrition_tips(week))
         
-        return jsonify(_serialize_pydantic(QuickActionResponse(
-            success=True,
-            week=week,
-            trimester=week_data.trimester,
-            action_type="nutrition_tips",
-            data=_serialize_pydantic(nutrition_info),
-            message=f"Successfully generated nutrition tips for week {week}"
-        )))
+        return jsonify({
+            "success": True,
+            "week": week,
+            "trimester": trimester,
+            "action_type": "nutrition_tips",
+            "data": _serialize_ai_response("nutrition_tips", week, nutrition_info),
+            "message": f"Successfully generated nutrition tips for week {week}"
+        })
     
     except ValueError as e:
         return jsonify({
@@ -688,7 +1160,7 @@ def semantic_search():
     """Perform semantic search on pregnancy data using Qdrant"""
     try:
         query = request.args.get('query', '')
-        limit = int(request.args.get('limit', 5))
+        limit = request.args.get('limit', 5, type=int)
         
         if not query or len(query.strip()) < 3:
             return jsonify({
@@ -697,7 +1169,7 @@ def semantic_search():
             }), 400
         
         # Perform semantic search
-        results = pregnancy_service.semantic_search(query, limit=limit)
+        results = _get_pregnancy_service().semantic_search(query, limit=limit)
         
         return jsonify({
             "success": True,
@@ -724,16 +1196,14 @@ def semantic_search():
 @trimester_bp.route('/patient/<int:week>/rag', methods=['GET'])
 def get_personalized_rag_developments(week: int):
     """RAG-powered personalized pregnancy developments based on patient's disease history"""
+    rag_service = _get_rag_service()
     try:
-        if week < 1 or week > 40:
-            return jsonify({
-                "error": "Week must be between 1 and 40",
-                "success": False
-            }), 400
+        if week not in VALID_WEEKS:
+            return _json_response(WEEK_ERROR), 400
         
         patient_id = request.args.get('patient_id')
-        use_ai = request.args.get('use_ai', 'true').lower() == 'true'
-        use_mock_data = request.args.get('use_mock_data', 'true').lower() == 'true'
+        use_ai = _query_bool('use_ai', True)
+        use_mock_data = _query_bool('use_mock_data', True)
         
         if not patient_id:
             return jsonify({
@@ -742,10 +1212,7 @@ def get_personalized_rag_developments(week: int):
             }), 400
         
         if not rag_service:
-            return jsonify({
-                "error": "RAG service not available. Qdrant must be configured.",
-                "success": False
-            }), 503
+            return _json_response(RAG_UNAVAILABLE_ERROR), 503
         
         # RAG Pipeline
         rag_response = _run_async(rag_service.get_personalized_developments(
@@ -755,7 +1222,8 @@ def get_personalized_rag_developments(week: int):
             use_mock_data=use_mock_data
         ))
         
-        return jsonify(_serialize_pydantic(rag_response))
+        # Serialize straight to JSON in pydantic-core, no intermediate dict
+        return _json_response(rag_response.model_dump_json())
     
     except ValueError as e:
         return jsonify({
@@ -773,22 +1241,20 @@ def get_personalized_rag_developments(week: int):
 @trimester_bp.route('/trimester/<int:trimester>/fruit-recommendations', methods=['GET'])
 def get_trimester_fruit_recommendations(trimester: int):
     """Get RAG-based fruit size recommendations for a specific trimester"""
+    rag_service = _get_rag_service()
     
-    if not pregnancy_service.use_qdrant or not rag_service:
+    if not _get_pregnancy_service().use_qdrant or not rag_service:
         return jsonify({
             "error": "RAG service not available. Qdrant integration required.",
             "success": False
         }), 503
     
     try:
-        if trimester < 1 or trimester > 3:
-            return jsonify({
-                "error": "Trimester must be 1, 2, or 3",
-                "success": False
-            }), 400
+        if trimester not in VALID_TRIMESTERS:
+            return _json_response(TRIMESTER_ERROR), 400
         
         patient_id = request.args.get('patient_id')
-        use_mock_data = request.args.get('use_mock_data', 'true').lower() == 'true'
+        use_mock_data = _query_bool('use_mock_data', True)
         
         # Get trimester fruit recommendations using RAG
         recommendations = _run_async(rag_service.get_trimester_fruit_recommendations(
@@ -817,10 +1283,7 @@ def get_my_current_week():
     try:
         patient_id = _get_patient_id_from_token()
         if not patient_id:
-            return jsonify({
-                "error": "Patient ID not found in token",
-                "success": False
-            }), 401
+            return _json_response(PATIENT_ID_ERROR), 401
         
         current_week = _get_patient_current_week(patient_id)
         
@@ -845,48 +1308,37 @@ def get_my_week_data():
     try:
         patient_id = _get_patient_id_from_token()
         if not patient_id:
-            return jsonify({
-                "error": "Patient ID not found in token",
-                "success": False
-            }), 401
+            return _json_response(PATIENT_ID_ERROR), 401
         
         # Get patient's current week
         current_week = _get_patient_current_week(patient_id)
         
         # Get query parameters
-        use_openai = request.args.get('use_openai', 'false').lower() == 'true'
-        include_fruit_image = request.args.get('include_fruit_image', 'true').lower() == 'true'
+        use_openai = _query_bool('use_openai', False)
+        include_fruit_image = _query_bool('include_fruit_image', True)
         
-        week_data = pregnancy_service.get_week_data(current_week)
+        week_dict = _get_week_dict(current_week)
         
-        # Use OpenAI for baby size if requested and available
-        if use_openai and openai_service:
-            try:
-                ai_baby_size = _run_async(openai_service.get_baby_size_for_week(current_week))
-                week_data.baby_size = ai_baby_size
-            except Exception as e:
-                print(f"OpenAI baby size generation failed: {e}")
-        
-        # Add real fruit image if requested
-        fruit_image_data = None
-        if include_fruit_image and image_generator:
-            try:
-                fruit_image_data = image_generator.generate_real_fruit_only_image(current_week)
-            except Exception as e:
-                print(f"Real fruit image generation failed: {e}")
+        # Get AI baby size and real fruit image (if requested) concurrently
+        ai_baby_size, fruit_image_data = _run_async(
+            _get_week_extras(current_week, use_openai, include_fruit_image)
+        )
+        if ai_baby_size:
+            # Copy so the shared week data is not modified
+            week_dict = {**week_dict, "baby_size": _serialize_pydantic(ai_baby_size)}
         
         # Create enhanced response
         response_data = {
             "success": True,
             "patient_id": patient_id,
             "current_week": current_week,
-            "data": _serialize_pydantic(week_data),
+            "data": week_dict,
             "message": f"Successfully retrieved data for your current week {current_week}",
             "fruit_image": fruit_image_data,
             "fruit_image_available": fruit_image_data is not None
         }
         
-        return jsonify(response_data)
+        return _conditional_json_response(response_data)
     
     except ValueError as e:
         return jsonify({
@@ -907,25 +1359,19 @@ def get_my_baby_image():
     try:
         patient_id = _get_patient_id_from_token()
         if not patient_id:
-            return jsonify({
-                "error": "Patient ID not found in token",
-                "success": False
-            }), 401
+            return _json_response(PATIENT_ID_ERROR), 401
         
         # Get patient's current week
         current_week = _get_patient_current_week(patient_id)
         
         format_type = request.args.get('format', 'stream')
-        regenerate = request.args.get('regenerate', 'false').lower() == 'true'
+        regenerate = _query_bool('regenerate', False)
         
-        if not image_generator:
-            return jsonify({
-                "error": "Image generator not available",
-                "success": False
-            }), 503
+        if not _get_image_generator():
+            return _json_response(IMAGE_GENERATOR_UNAVAILABLE_ERROR), 503
         
         # Get cached or generate new OpenAI image
-        image_data = _run_async(image_generator.get_or_generate_openai_image(current_week, regenerate))
+        image_bytes, etag, data_url = _get_baby_image(current_week, regenerate)
         
         # Return format based on query parameter
         if format_type == "base64":
@@ -934,23 +1380,18 @@ def get_my_baby_image():
                 "success": True,
                 "patient_id": patient_id,
                 "current_week": current_week,
-                "image_data": image_data,
+                "image_data": data_url,
                 "format": "base64",
                 "regenerated": regenerate,
                 "message": f"Successfully generated baby size image for your current week {current_week}"
             })
         else:
             # Return raw image stream (default for <img> tags)
-            # Extract base64 data (remove "data:image/png;base64," prefix if present)
-            base64_data = image_data.split(',')[1] if ',' in image_data else image_data
-            image_bytes = base64.b64decode(base64_data)
-            
-            return Response(
-                image_bytes,
-                mimetype="image/png",
-                headers={
-                    "Content-Disposition": f"inline; filename=baby_week_{current_week}_patient_{patient_id}.png"
-                }
+            # The current week changes over time, so clients revalidate with the ETag
+            return _baby_image_response(
+                image_bytes, etag,
+                filename=f"baby_week_{current_week}_patient_{patient_id}.png",
+                cache_control="private, no-cache"
             )
     
     except Exception as e:
@@ -960,32 +1401,174 @@ def get_my_baby_image():
         }), 500
 
 
+@trimester_bp.route('/my-baby-image', methods=['POST'])
+@token_required
+def start_my_baby_image_job():
+    """Start generating the baby size image for logged-in patient's current week in the background"""
+    try:
+        patient_id = _get_patient_id_from_token()
+        if not patient_id:
+            return _json_response(PATIENT_ID_ERROR), 401
+        
+        # Get patient's current week
+        current_week = _get_patient_current_week(patient_id)
+        regenerate = _query_bool('regenerate', False)
+        
+        if not _get_image_generator():
+            return _json_response(IMAGE_GENERATOR_UNAVAILABLE_ERROR), 503
+        
+        job = _submit_baby_image_job(patient_id, current_week, regenerate)
+        
+        return jsonify({
+            "success": True,
+            "task_id": job["task_id"],
+            "status": job["status"],
+            "current_week": current_week,
+            "expected_time_seconds": BABY_IMAGE_EXPECTED_SECONDS,
+            "message": f"Baby size image generation started for your current week {current_week}"
+        }), 202
+    
+    except Exception as e:
+        return jsonify({
+            "error": f"Error starting image generation: {str(e)}",
+            "success": False
+        }), 500
+
+
+@trimester_bp.route('/my-baby-image/status', methods=['GET'])
+@token_required
+def get_my_baby_image_job_status():
+    """Get the status of a background baby size image job"""
+    patient_id = _get_patient_id_from_token()
+    if not patient_id:
+        return _json_response(PATIENT_ID_ERROR), 401
+    
+    task_id = request.args.get('task_id')
+    job = _get_baby_image_job(task_id, patient_id)
+    if job is None:
+        return _json_response(IMAGE_TASK_NOT_FOUND_ERROR), 404
+    
+    status = job["status"]
+    response_data = {
+        "success": True,
+        "task_id": task_id,
+        "status": status,
+        "current_week": job["week"]
+    }
+    if status == "failed":
+        response_data["error"] = job["error"]
+    return jsonify(response_data)
+
+
+@trimester_bp.route('/my-baby-image/result', methods=['GET'])
+@token_required
+def get_my_baby_image_job_result():
+    """Get the image of a completed background baby size image job"""
+    patient_id = _get_patient_id_from_token()
+    if not patient_id:
+        return _json_response(PATIENT_ID_ERROR), 401
+    
+    task_id = request.args.get('task_id')
+    job = _get_baby_image_job(task_id, patient_id)
+    if job is None:
+        return _json_response(IMAGE_TASK_NOT_FOUND_ERROR), 404
+    
+    status = job["status"]
+    if status == "pending":
+        return jsonify({
+            "success": True,
+            "task_id": task_id,
+            "status": status,
+            "message": "Image is still being generated"
+        }), 202
+    if status == "failed":
+        return jsonify({
+            "error": f"Error generating image: {job['error']}",
+            "success": False
+        }), 500
+    
+    result = _job_store_get(BABY_IMAGE_RESULT_KEY.format(task_id))
+    if result is None:
+        return _json_response(IMAGE_TASK_NOT_FOUND_ERROR), 404
+    
+    current_week = job["week"]
+    image_bytes, etag, data_url = result
+    
+    if request.args.get('format', 'stream') == "base64":
+        return jsonify({
+            "success": True,
+            "patient_id": patient_id,
+            "current_week": current_week,
+            "image_data": data_url,
+            "format": "base64",
+            "regenerated": job["regenerate"],
+            "message": f"Successfully generated baby size image for your current week {current_week}"
+        })
+    return _baby_image_response(
+        image_bytes, etag,
+        filename=f"baby_week_{current_week}_patient_{patient_id}.png",
+        cache_control="private, no-cache"
+    )
+
+
+def _filter_enhanced_images(enhanced_data: Dict[str, Any], image_method: str):
+    """Keep only the requested image method in enhanced data, unless all were requested"""
+    if image_method != "all" and "images" in enhanced_data:
+        filtered_images = {}
+        if image_method in enhanced_data["images"]:
+            filtered_images[image_method] = enhanced_data["images"][image_method]
+        enhanced_data["images"] = filtered_images
+        enhanced_data["image_method_used"] = image_method
+
+
+def _stream_my_enhanced_data(dual_image_service, current_week: int, patient_id: str,
+                             use_mock_data: bool, include_rag_analysis: bool, image_method: str):
+    """Yield /my-enhanced response parts, the merged parts equal the non-streamed response"""
+    yield {
+        "service_status": dual_image_service.get_service_status(),
+        "current_week": current_week,
+        "patient_id": patient_id,
+        "message": f"Enhanced data for your current week {current_week} with RAG + OpenAI analysis"
+    }
+    for part in _iter_async(dual_image_service.stream_enhanced_week_data(
+        week=current_week,
+        patient_id=patient_id,
+        use_mock_data=use_mock_data,
+        include_rag_analysis=include_rag_analysis
+    )):
+        _filter_enhanced_images(part, image_method)
+        yield part
+
+
 @trimester_bp.route('/my-enhanced', methods=['GET'])
 @token_required
 def get_my_enhanced_data():
     """Get enhanced pregnancy data for logged-in patient's current week"""
+    dual_image_service = _get_dual_image_service()
     try:
         patient_id = _get_patient_id_from_token()
         if not patient_id:
-            return jsonify({
-                "error": "Patient ID not found in token",
-                "success": False
-            }), 401
+            return _json_response(PATIENT_ID_ERROR), 401
         
         # Get patient's current week
         current_week = _get_patient_current_week(patient_id)
         
         # Get query parameters
-        use_mock_data = request.args.get('use_mock_data', 'false').lower() == 'true'
-        include_rag_analysis = request.args.get('include_rag_analysis', 'true').lower() == 'true'
+        use_mock_data = _query_bool('use_mock_data', False)
+        include_rag_analysis = _query_bool('include_rag_analysis', True)
         image_method = request.args.get('image_method', 'all')
         
         # Get enhanced data using dual service
         if not dual_image_service:
-            return jsonify({
-                "error": "Dual Image Service not available. Please check service initialization.",
-                "success": False
-            }), 503
+            return _json_response(DUAL_IMAGE_UNAVAILABLE_ERROR), 503
+        
+        if _query_bool('stream', False):
+            # Send the patient and base week data right away, then images and
+            # RAG analysis as NDJSON lines as each finishes
+            return _ndjson_response(_stream_my_enhanced_data(
+                dual_image_service, current_week, patient_id,
+                use_mock_data, include_rag_analysis, image_method
+            ))
         
         enhanced_data = _run_async(dual_image_service.get_enhanced_week_data_with_image(
             week=current_week,
@@ -1000,12 +1583,7 @@ def get_my_enhanced_data():
         enhanced_data["patient_id"] = patient_id
         
         # Filter images based on requested method
-        if image_method != "all" and "images" in enhanced_data:
-            filtered_images = {}
-            if image_method in enhanced_data["images"]:
-                filtered_images[image_method] = enhanced_data["images"][image_method]
-            enhanced_data["images"] = filtered_images
-            enhanced_data["image_method_used"] = image_method
+        _filter_enhanced_images(enhanced_data, image_method)
         
         enhanced_data["message"] = f"Enhanced data for your current week {current_week} with RAG + OpenAI analysis"
         
@@ -1027,25 +1605,20 @@ def get_my_enhanced_data():
 @token_required
 def get_my_rag_personalized():
     """Get RAG-powered personalized developments for logged-in patient's current week"""
+    rag_service = _get_rag_service()
     try:
         patient_id = _get_patient_id_from_token()
         if not patient_id:
-            return jsonify({
-                "error": "Patient ID not found in token",
-                "success": False
-            }), 401
+            return _json_response(PATIENT_ID_ERROR), 401
         
         # Get patient's current week
         current_week = _get_patient_current_week(patient_id)
         
-        use_ai = request.args.get('use_ai', 'true').lower() == 'true'
-        use_mock_data = request.args.get('use_mock_data', 'false').lower() == 'true'
+        use_ai = _query_bool('use_ai', True)
+        use_mock_data = _query_bool('use_mock_data', False)
         
         if not rag_service:
-            return jsonify({
-                "error": "RAG service not available. Qdrant must be configured.",
-                "success": False
-            }), 503
+            return _json_response(RAG_UNAVAILABLE_ERROR), 503
         
         # RAG Pipeline with patient's real data
         rag_response = _run_async(rag_service.get_personalized_developments(
@@ -1055,7 +1628,8 @@ def get_my_rag_personalized():
             use_mock_data=use_mock_data
         ))
         
-        return jsonify(_serialize_pydantic(rag_response))
+        # Serialize straight to JSON in pydantic-core, no intermediate dict
+        return _json_response(rag_response.model_dump_json())
     
     except ValueError as e:
         return jsonify({
@@ -1069,41 +1643,43 @@ def get_my_rag_personalized():
         }), 500
 
 
-@trimester_bp.route('/my-symptoms', methods=['GET'])
-@token_required
-def get_my_symptoms():
-    """Get AI-powered symptoms for logged-in patient's current week"""
+# Per-patient quick actions: action_type -> (OpenAI service method, description)
+MY_QUICK_ACTIONS = {
+    "early_symptoms": ("get_early_symptoms", "symptoms"),
+    "nutrition_tips": ("get_nutrition_tips", "nutrition tips"),
+    "wellness_tips": ("get_wellness_tips", "wellness tips")
+}
+
+
+def _get_my_quick_action(action_type: str):
+    """Get an AI-powered quick action for logged-in patient's current week"""
+    method_name, description = MY_QUICK_ACTIONS[action_type]
+    openai_service = _get_openai_service()
     try:
         patient_id = _get_patient_id_from_token()
         if not patient_id:
-            return jsonify({
-                "error": "Patient ID not found in token",
-                "success": False
-            }), 401
+            return _json_response(PATIENT_ID_ERROR), 401
         
         # Get patient's current week
         current_week = _get_patient_current_week(patient_id)
         
         if not openai_service:
-            return jsonify({
-                "error": "OpenAI service not available. Please check your API key configuration.",
-                "success": False
-            }), 503
+            return _json_response(OPENAI_UNAVAILABLE_ERROR), 503
         
-        # Get week data for trimester info
-        week_data = pregnancy_service.get_week_data(current_week)
+        # Trimester is derived from the week, no week data lookup needed
+        trimester = _trimester_for_week(current_week)
         
-        # Get AI-powered symptoms
-        symptoms_info = _run_async(openai_service.get_early_symptoms(current_week))
+        # Get AI-powered info for the action
+        info = _run_async(getattr(openai_service, method_name)(current_week))
         
-        return jsonify(_serialize_pydantic(QuickActionResponse(
-            success=True,
-            week=current_week,
-            trimester=week_data.trimester,
-            action_type="early_symptoms",
-            data=_serialize_pydantic(symptoms_info),
-            message=f"Successfully generated symptoms for your current week {current_week}"
-        )))
+        return _conditional_json_response({
+            "success": True,
+            "week": current_week,
+            "trimester": trimester,
+            "action_type": action_type,
+            "data": _serialize_ai_response(action_type, current_week, info),
+            "message": f"Successfully generated {description} for your current week {current_week}"
+        })
     
     except Exception as e:
         return jsonify({
@@ -1112,87 +1688,22 @@ def get_my_symptoms():
         }), 500
 
 
+@trimester_bp.route('/my-symptoms', methods=['GET'])
+@token_required
+def get_my_symptoms():
+    """Get AI-powered symptoms for logged-in patient's current week"""
+    return _get_my_quick_action("early_symptoms")
+
+
 @trimester_bp.route('/my-nutrition', methods=['GET'])
 @token_required
 def get_my_nutrition():
     """Get AI-powered nutrition tips for logged-in patient's current week"""
-    try:
-        patient_id = _get_patient_id_from_token()
-        if not patient_id:
-            return jsonify({
-                "error": "Patient ID not found in token",
-                "success": False
-            }), 401
-        
-        # Get patient's current week
-        current_week = _get_patient_current_week(patient_id)
-        
-        if not openai_service:
-            return jsonify({
-                "error": "OpenAI service not available. Please check your API key configuration.",
-                "success": False
-            }), 503
-        
-        # Get week data for trimester info
-        week_data = pregnancy_service.get_week_data(current_week)
-        
-        # Get AI-powered nutrition tips
-        nutrition_info = _run_async(openai_service.get_nutrition_tips(current_week))
-        
-        return jsonify(_serialize_pydantic(QuickActionResponse(
-            success=True,
-            week=current_week,
-            trimester=week_data.trimester,
-            action_type="nutrition_tips",
-            data=_serialize_pydantic(nutrition_info),
-            message=f"Successfully generated nutrition tips for your current week {current_week}"
-        )))
-    
-    except Exception as e:
-        return jsonify({
-            "error": f"Internal server error: {str(e)}",
-            "success": False
-        }), 500
+    return _get_my_quick_action("nutrition_tips")
 
 
 @trimester_bp.route('/my-wellness', methods=['GET'])
 @token_required
 def get_my_wellness():
     """Get AI-powered wellness tips for logged-in patient's current week"""
-    try:
-        patient_id = _get_patient_id_from_token()
-        if not patient_id:
-            return jsonify({
-                "error": "Patient ID not found in token",
-                "success": False
-            }), 401
-        
-        # Get patient's current week
-        current_week = _get_patient_current_week(patient_id)
-        
-        if not openai_service:
-            return jsonify({
-                "error": "OpenAI service not available. Please check your API key configuration.",
-                "success": False
-            }), 503
-        
-        # Get week data for trimester info
-        week_data = pregnancy_service.get_week_data(current_week)
-        
-        # Get AI-powered wellness tips
-        wellness_info = _run_async(openai_service.get_wellness_tips(current_week))
-        
-        return jsonify(_serialize_pydantic(QuickActionResponse(
-            success=True,
-            week=current_week,
-            trimester=week_data.trimester,
-            action_type="wellness_tips",
-            data=_serialize_pydantic(wellness_info),
-            message=f"Successfully generated wellness tips for your current week {current_week}"
-        )))
-    
-    except Exception as e:
-        return jsonify({
-            "error": f"Internal server error: {str(e)}",
-            "success": False
-        }), 500
+    return _get_my_quick_action("wellness_tips")
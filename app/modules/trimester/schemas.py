@@ -5,13 +5,15 @@ This file contains all data models used by the trimester module.
 These models are used for data validation, serialization, and API responses.
 """
 
-from pydantic import BaseModel
-from typing import List, Optional, Dict
+from pydantic import BaseModel, ConfigDict
+from typing import List, Optional, Dict, Tuple
 from datetime import datetime
 
 
 class KeyDevelopment(BaseModel):
     """Model for key pregnancy developments"""
+    model_config = ConfigDict(frozen=True)
+    
     title: str
     description: str
     icon: Optional[str] = None
@@ -20,6 +22,8 @@ class KeyDevelopment(BaseModel):
 
 class BabySize(BaseModel):
     """Model for baby size information"""
+    model_config = ConfigDict(frozen=True)
+    
     size: str
     weight: Optional[str] = None
     length: Optional[str] = None
@@ -27,6 +31,8 @@ class BabySize(BaseModel):
 
 class PregnancyWeek(BaseModel):
     """Model for pregnancy week data"""
+    model_config = ConfigDict(frozen=True)
+    
     week: int
     trimester: int
     days_remaining: int
@@ -55,34 +61,42 @@ class QuickActionResponse(BaseModel):
 
 class SymptomInfo(BaseModel):
     """Model for symptom information"""
-    common_symptoms: List[str]
-    when_to_call_doctor: List[str]
-    relief_tips: List[str]
+    model_config = ConfigDict(frozen=True)
+    
+    common_symptoms: Tuple[str, ...]
+    when_to_call_doctor: Tuple[str, ...]
+    relief_tips: Tuple[str, ...]
     severity_level: str
 
 
 class ScreeningInfo(BaseModel):
     """Model for screening information"""
-    recommended_tests: List[str]
-    test_descriptions: List[str]
+    model_config = ConfigDict(frozen=True)
+    
+    recommended_tests: Tuple[str, ...]
+    test_descriptions: Tuple[str, ...]
     timing: str
     importance: str
 
 
 class WellnessInfo(BaseModel):
     """Model for wellness information"""
-    exercise_tips: List[str]
-    sleep_advice: List[str]
-    stress_management: List[str]
-    general_wellness: List[str]
+    model_config = ConfigDict(frozen=True)
+    
+    exercise_tips: Tuple[str, ...]
+    sleep_advice: Tuple[str, ...]
+    stress_management: Tuple[str, ...]
+    general_wellness: Tuple[str, ...]
 
 
 class NutritionInfo(BaseModel):
     """Model for nutrition information"""
-    essential_nutrients: List[str]
-    foods_to_avoid: List[str]
-    meal_suggestions: List[str]
-    hydration_tips: List[str]
+    model_config = ConfigDict(frozen=True)
+    
+    essential_nutrients: Tuple[str, ...]
+    foods_to_avoid: Tuple[str, ...]
+    meal_suggestions: Tuple[str, ...]
+    hydration_tips: Tuple[str, ...]
 
 
 # RAG and Medical History Models
@@ -7,8 +7,10 @@ It includes services for pregnancy data, OpenAI integration, and image generatio
 
 import asyncio
 import json
+import logging
 import base64
-from typing import Dict, Optional, List, Any
+import time
+from typing import Dict, Optional, List, Any, Tuple
 from datetime import datetime, timedelta
 
 from .schemas import (
@@ -16,6 +18,165 @@ from .schemas import (
     QuickActionResponse, SymptomInfo, ScreeningInfo, WellnessInfo, NutritionInfo
 )
 from .config import settings
+from .http_client import get_http_client
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _extract_json(text: str) -> Optional[Any]:
+    """Decode the first JSON object in a model response, ignoring any prose around it"""
+    text = text.strip()
+    start = text.find('{')
+    if start == -1:
+        return None
+    # Most responses are a bare JSON object, orjson parses those directly
+    if orjson is not None and start == 0 and text.endswith('}'):
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return _JSON_DECODER.raw_decode(text, start)[0]
+
+
+# Prompts only vary by week, so the templates are formatted per call
+_BABY_SIZE_PROMPT = """
+    Provide detailed baby size information for pregnancy week {week}. 
+    
+    Please respond with a JSON object containing:
+    - "size": A relatable size comparison (e.g., "Lima bean", "Blueberry", "Coconut", "Avocado")
+    - "weight": Weight in grams (e.g., "0.1g", "1.2g", "15g")
+    - "length": Length in centimeters (e.g., "0.1cm", "0.5cm", "2.5cm")
+    
+    Make the size comparison relatable and easy to understand.
+    """
+
+_SYMPTOMS_PROMPT = """
+    Provide comprehensive early pregnancy symptoms information for week {week}.
+    
+    Respond with a JSON object containing:
+    - "common_symptoms": List of common symptoms for this week
+    - "when_to_call_doctor": List of warning signs requiring medical attention
+    - "relief_tips": List of practical relief suggestions
+    - "severity_level": Overall severity level (mild, moderate, severe)
+    """
+
+_SCREENING_PROMPT = """
+    Provide prenatal screening information for pregnancy week {week}.
+    
+    Respond with a JSON object containing:
+    - "recommended_tests": List of recommended screening tests
+    - "test_descriptions": List of descriptions for each test
+    - "timing": When these tests should be performed
+    - "importance": Why these tests are important
+    """
+
+_WELLNESS_PROMPT = """
+    Provide wellness and lifestyle tips for pregnancy week {week}.
+    
+    Respond with a JSON object containing:
+    - "exercise_tips": List of safe exercise recommendations
+    - "sleep_advice": List of sleep and rest tips
+    - "stress_management": List of stress management techniques
+    - "general_wellness": List of general wellness practices
+    """
+
+_NUTRITION_PROMPT = """
+    Provide nutrition guidance for pregnancy week {week}.
+    
+    Respond with a JSON object containing:
+    - "essential_nutrients": List of key nutrients needed
+    - "foods_to_avoid": List of foods to avoid or limit
+    - "meal_suggestions": List of meal and snack ideas
+    - "hydration_tips": List of hydration recommendations
+    """
+
+# Fallback sizes at key weeks, each covering the weeks up to it
+_FALLBACK_BABY_SIZES = (
+    (1, BabySize(size="Poppy seed", weight="0.1g", length="0.1cm")),
+    (10, BabySize(size="Kumquat", weight="4g", length="3.1cm")),
+    (20, BabySize(size="Banana", weight="300g", length="16.4cm")),
+    (30, BabySize(size="Cabbage", weight="1.3kg", length="39.9cm")),
+    (40, BabySize(size="Watermelon", weight="3.4kg", length="51.2cm"))
+)
+
+
+def _build_fallback_baby_size_by_week() -> Tuple[BabySize, ...]:
+    """Expand the key-week fallback sizes into a table indexed by week (index 0 unused)"""
+    by_week = [_FALLBACK_BABY_SIZES[0][1]]
+    for week in range(1, 41):
+        by_week.append(next(size for w, size in _FALLBACK_BABY_SIZES if week <= w))
+    return tuple(by_week)
+
+
+# The fallback models are frozen, so every call can share the same instances
+_FALLBACK_BABY_SIZE_BY_WEEK = _build_fallback_baby_size_by_week()
+
+_FALLBACK_SYMPTOMS = SymptomInfo(
+    common_symptoms=["Nausea", "Fatigue", "Breast tenderness"],
+    when_to_call_doctor=["Severe nausea", "Heavy bleeding", "Severe pain"],
+    relief_tips=["Eat small meals", "Stay hydrated", "Get plenty of rest"],
+    severity_level="mild"
+)
+
+_FALLBACK_SCREENING = ScreeningInfo(
+    recommended_tests=["Blood work", "Ultrasound"],
+    test_descriptions=["Basic blood tests", "First trimester screening"],
+    timing="As recommended by healthcare provider",
+    importance="Important for monitoring pregnancy health"
+)
+
+_FALLBACK_WELLNESS = WellnessInfo(
+    exercise_tips=["Walking", "Prenatal yoga", "Swimming"],
+    sleep_advice=["Sleep on side", "Use pregnancy pillow", "Maintain regular schedule"],
+    stress_management=["Meditation", "Deep breathing", "Gentle exercise"],
+    general_wellness=["Stay hydrated", "Eat balanced meals", "Take prenatal vitamins"]
+)
+
+_FALLBACK_NUTRITION = NutritionInfo(
+    essential_nutrients=["Folic acid", "Iron", "Calcium", "Protein"],
+    foods_to_avoid=["Raw fish", "Unpasteurized cheese", "Excessive caffeine"],
+    meal_suggestions=["Balanced breakfast", "Protein-rich snacks", "Colorful vegetables"],
+    hydration_tips=["Drink 8-10 glasses of water", "Limit caffeine", "Include hydrating foods"]
+)
+
+# Response model and per-week field defaults for each OpenAI prompt kind
+_PARSE_SPECS = {
+    "baby_size": (BabySize, lambda week: {"size": f"Week {week} baby", "weight": "Unknown", "length": "Unknown"}),
+    "symptoms": (SymptomInfo, lambda week: {
+        "common_symptoms": [], "when_to_call_doctor": [], "relief_tips": [], "severity_level": "mild"
+    }),
+    "screening": (ScreeningInfo, lambda week: {
+        "recommended_tests": [], "test_descriptions": [],
+        "timing": "As recommended by healthcare provider",
+        "importance": "Important for monitoring pregnancy health"
+    }),
+    "wellness": (WellnessInfo, lambda week: {
+        "exercise_tips": [], "sleep_advice": [], "stress_management": [], "general_wellness": []
+    }),
+    "nutrition": (NutritionInfo, lambda week: {
+        "essential_nutrients": [], "foods_to_avoid": [], "meal_suggestions": [], "hydration_tips": []
+    })
+}
+
+# Week prompt kinds, in the order a week bundle returns them
+_BUNDLE_KINDS = ("baby_size", "symptoms", "screening", "wellness", "nutrition")
+
+
+# The full week data is static, build it once per process and share it
+try:
+    from app.shared.pregnancy_rag.pregnancy_data_full import get_all_40_weeks_data
+    _ALL_40_WEEKS: Optional[Dict[int, PregnancyWeek]] = get_all_40_weeks_data()
+except Exception as e:
+    logger.warning("⚠️ Could not load full pregnancy data: %s", e)
+    _ALL_40_WEEKS = None
 
 
 class PregnancyDataService:
@@ -37,28 +198,36 @@ class PregnancyDataService:
         
         # Always initialize in-memory data as fallback
         self.pregnancy_data = self._initialize_data()
+        # Weeks are dense 1..40, index week - 1 (None for weeks missing from fallback data)
+        self._weeks_by_index = tuple(self.pregnancy_data.get(week) for week in range(1, 41))
+        
+        # Week data is static, so group it by trimester once
+        self._trimester_weeks = self._build_trimester_index(self.pregnancy_data)
         
         if self.use_qdrant:
             try:
                 from .rag.qdrant_service import QdrantService
                 self.qdrant_service = QdrantService()
-                print("✅ Using Qdrant for pregnancy data storage")
+                logger.info("✅ Using Qdrant for pregnancy data storage")
             except Exception as e:
-                print(f"⚠️  Qdrant initialization failed: {e}")
-                print("Falling back to in-memory data")
+                logger.warning("⚠️  Qdrant initialization failed, falling back to in-memory data: %s", e)
                 self.use_qdrant = False
         else:
-            print("ℹ️  Using in-memory data storage")
+            logger.info("ℹ️  Using in-memory data storage")
     
     def get_week_data(self, week: int) -> PregnancyWeek:
         """Get pregnancy data for a specific week"""
-        if week < 1 or week > 40:
+        # Negative indexes would wrap around, only the upper bound is left to IndexError
+        if week < 1:
             raise ValueError(f"Week {week} is not valid. Week must be between 1 and 40.")
+        try:
+            week_data = self._weeks_by_index[week - 1]
+        except IndexError:
+            raise ValueError(f"Week {week} is not valid. Week must be between 1 and 40.") from None
         
         if self.use_qdrant and self.qdrant_service:
             return self._get_week_data_from_qdrant(week)
-        else:
-            return self.pregnancy_data.get(week)
+        return week_data
     
     def get_all_weeks(self) -> Dict[int, PregnancyWeek]:
         """Get all pregnancy week data"""
@@ -69,12 +238,15 @@ class PregnancyDataService:
     
     def get_weeks_by_trimester(self, trimester: int) -> List[PregnancyWeek]:
         """Get all weeks for a specific trimester"""
-        weeks = []
-        for week in range(1, 41):
-            week_data = self.get_week_data(week)
-            if week_data.trimester == trimester:
-                weeks.append(week_data)
-        return weeks
+        return list(self._trimester_weeks.get(trimester, []))
+    
+    def _build_trimester_index(self, pregnancy_data: Dict[int, PregnancyWeek]) -> Dict[int, List[PregnancyWeek]]:
+        """Group week data by trimester, each list sorted by week"""
+        by_trimester: Dict[int, List[PregnancyWeek]] = {1: [], 2: [], 3: []}
+        for week in sorted(pregnancy_data):
+            week_data = pregnancy_data[week]
+            by_trimester.setdefault(week_data.trimester, []).append(week_data)
+        return by_trimester
     
     def semantic_search(self, query: str, limit: int = 5) -> List[Dict]:
         """Perform semantic search on pregnancy data"""
@@ -97,54 +269,51 @@ class PregnancyDataService:
     
     def _initialize_data(self) -> Dict[int, PregnancyWeek]:
         """Initialize pregnancy week data with key developments - loads all 40 weeks"""
-        try:
-            # Try to import full pregnancy data from shared pregnancy_rag module
-            from app.shared.pregnancy_rag.pregnancy_data_full import get_all_40_weeks_data
-            return get_all_40_weeks_data()
-        except Exception as e:
-            print(f"⚠️ Could not load full pregnancy data: {e}")
-            print("Using basic fallback data")
-            
-            # Fallback: Basic data for key weeks
-            data = {}
-            
-            # Week 1
-            data[1] = PregnancyWeek(
-                week=1,
-                trimester=1,
-                days_remaining=280,
-                baby_size=BabySize(size="Poppy seed", weight="0.1g", length="0.1cm"),
-                key_developments=[
-                    KeyDevelopment(
-                        title="Fertilization",
-                        description="The egg is fertilized by sperm, beginning the journey of pregnancy.",
-                        icon="🌱",
-                        category="conception"
-                    ),
-                ],
-                symptoms=["Spotting", "Mild cramping"],
-                tips=["Start taking prenatal vitamins", "Avoid alcohol and smoking"]
-            )
-            
-            # Week 10
-            data[10] = PregnancyWeek(
-                week=10,
-                trimester=1,
-                days_remaining=210,
-                baby_size=BabySize(size="Kumquat", weight="4g", length="3.1cm"),
-                key_developments=[
-                    KeyDevelopment(
-                        title="Finger Development",
-                        description="Tiny fingers and toes are forming with individual digits.",
-                        icon="👶",
-                        category="development"
-                    ),
-                ],
-                symptoms=["Nausea", "Fatigue", "Breast tenderness"],
-                tips=["Eat small, frequent meals", "Stay hydrated", "Get plenty of rest"]
-            )
-            
-            return data
+        if _ALL_40_WEEKS is not None:
+            return _ALL_40_WEEKS
+        
+        logger.warning("Using basic fallback data")
+        
+        # Fallback: Basic data for key weeks
+        data = {}
+        
+        # Week 1
+        data[1] = PregnancyWeek(
+            week=1,
+            trimester=1,
+            days_remaining=280,
+            baby_size=BabySize(size="Poppy seed", weight="0.1g", length="0.1cm"),
+            key_developments=[
+                KeyDevelopment(
+                    title="Fertilization",
+                    description="The egg is fertilized by sperm, beginning the journey of pregnancy.",
+                    icon="🌱",
+                    category="conception"
+                ),
+            ],
+            symptoms=["Spotting", "Mild cramping"],
+            tips=["Start taking prenatal vitamins", "Avoid alcohol and smoking"]
+        )
+        
+        # Week 10
+        data[10] = PregnancyWeek(
+            week=10,
+            trimester=1,
+            days_remaining=210,
+            baby_size=BabySize(size="Kumquat", weight="4g", length="3.1cm"),
+            key_developments=[
+                KeyDevelopment(
+                    title="Finger Development",
+                    description="Tiny fingers and toes are forming with individual digits.",
+                    icon="👶",
+                    category="development"
+                ),
+            ],
+            symptoms=["Nausea", "Fatigue", "Breast tenderness"],
+            tips=["Eat small, frequent meals", "Stay hydrated", "Get plenty of rest"]
+        )
+        
+        return data
 
 
 class OpenAIBabySizeService:
@@ -156,61 +325,95 @@ class OpenAIBabySizeService:
         
         try:
             import openai
-            self.client = openai.OpenAI(api_key=settings.OPENAI_API_KEY)
+            self._openai = openai
             self.model = settings.OPENAI_MODEL
             self.max_tokens = settings.OPENAI_MAX_TOKENS
+            # Arguments shared by every chat completion request
+            self._base_kwargs = {"model": self.model, "max_tokens": self.max_tokens, "temperature": 0.7}
         except ImportError:
             raise ValueError("OpenAI package is required. Please install it with: pip install openai")
+        
+        # Async client and semaphore are created lazily because they are bound to an event loop
+        self._async_client = None
+        self._semaphore = None
+        self._async_client_loop = None
+        
+        # Week-only AI responses are the same for every patient, cache them by (kind, week)
+        self._response_cache: Dict[Tuple[str, int], Tuple[float, Any]] = {}
+        
+        # Responses precomputed through the Batch API never expire, keyed by (kind, week)
+        self._precomputed: Dict[Tuple[str, int], Any] = {}
+        if settings.OPENAI_PRECOMPUTED_PATH:
+            self.load_precomputed(settings.OPENAI_PRECOMPUTED_PATH)
     
     async def get_baby_size_for_week(self, week: int) -> BabySize:
         """Get baby size information for a specific pregnancy week using OpenAI"""
+        cached = self._get_cached_response("baby_size", week)
+        if cached is not None:
+            return cached
+        
         try:
             prompt = self._create_baby_size_prompt(week)
             response = await self._call_openai(prompt)
-            baby_size_data = self._parse_baby_size_response(response, week)
-            return baby_size_data
+            return self._cache_response("baby_size", week, self._parse_response(response, "baby_size", week))
         except Exception as e:
-            print(f"OpenAI baby size generation failed: {e}")
+            logger.warning("OpenAI baby size generation failed: %s", e, exc_info=True)
             return self._get_fallback_baby_size(week)
     
     async def get_early_symptoms(self, week: int) -> SymptomInfo:
         """Get AI-powered early symptoms information"""
+        cached = self._get_cached_response("symptoms", week)
+        if cached is not None:
+            return cached
+        
         try:
             prompt = self._create_symptoms_prompt(week)
             response = await self._call_openai(prompt)
-            return self._parse_symptoms_response(response)
+            return self._cache_response("symptoms", week, self._parse_response(response, "symptoms", week))
         except Exception as e:
-            print(f"OpenAI symptoms generation failed: {e}")
+            logger.warning("OpenAI symptoms generation failed: %s", e, exc_info=True)
             return self._get_fallback_symptoms(week)
     
     async def get_prenatal_screening(self, week: int) -> ScreeningInfo:
         """Get AI-powered prenatal screening information"""
+        cached = self._get_cached_response("screening", week)
+        if cached is not None:
+            return cached
+        
         try:
             prompt = self._create_screening_prompt(week)
             response = await self._call_openai(prompt)
-            return self._parse_screening_response(response)
+            return self._cache_response("screening", week, self._parse_response(response, "screening", week))
         except Exception as e:
-            print(f"OpenAI screening generation failed: {e}")
+            logger.warning("OpenAI screening generation failed: %s", e, exc_info=True)
             return self._get_fallback_screening(week)
     
     async def get_wellness_tips(self, week: int) -> WellnessInfo:
         """Get AI-powered wellness tips"""
+        cached = self._get_cached_response("wellness", week)
+        if cached is not None:
+            return cached
+        
         try:
             prompt = self._create_wellness_prompt(week)
             response = await self._call_openai(prompt)
-            return self._parse_wellness_response(response)
+            return self._cache_response("wellness", week, self._parse_response(response, "wellness", week))
         except Exception as e:
-            print(f"OpenAI wellness generation failed: {e}")
+            logger.warning("OpenAI wellness generation failed: %s", e, exc_info=True)
             return self._get_fallback_wellness(week)
     
     async def get_nutrition_tips(self, week: int) -> NutritionInfo:
         """Get AI-powered nutrition tips"""
+        cached = self._get_cached_response("nutrition", week)
+        if cached is not None:
+            return cached
+        
         try:
             prompt = self._create_nutrition_prompt(week)
             response = await self._call_openai(prompt)
-            return self._parse_nutrition_response(response)
+            return self._cache_response("nutrition", week, self._parse_response(response, "nutrition", week))
         except Exception as e:
-            print(f"OpenAI nutrition generation failed: {e}")
+            logger.warning("OpenAI nutrition generation failed: %s", e, exc_info=True)
             return self._get_fallback_nutrition(week)
     
     async def get_detailed_baby_info(self, week: int) -> dict:
@@ -223,6 +426,10 @@ class OpenAIBabySizeService:
         Returns:
             Dictionary with detailed baby information
         """
+        cached = self._get_cached_response("detailed_info", week)
+        if cached is not None:
+            return cached
+        
         try:
             prompt = f"""
             Provide detailed information about a baby at pregnancy week {week}. 
@@ -243,11 +450,9 @@ class OpenAIBabySizeService:
             
             # Try to parse JSON response
             try:
-                json_start = response.find('{')
-                json_end = response.rfind('}') + 1
-                if json_start != -1 and json_end != 0:
-                    json_str = response[json_start:json_end]
-                    return json.loads(json_str)
+                data = _extract_json(response)
+                if data is not None:
+                    return self._cache_response("detailed_info", week, data)
             except:
                 pass
             
@@ -262,7 +467,7 @@ class OpenAIBabySizeService:
             }
             
         except Exception as e:
-            print(f"OpenAI detailed baby info generation failed: {e}")
+            logger.warning("OpenAI detailed baby info generation failed: %s", e, exc_info=True)
             return {
                 "size": f"Week {week} baby",
                 "weight": "Unknown",
@@ -272,225 +477,207 @@ class OpenAIBabySizeService:
                 "development_highlight": "Continuous development"
             }
     
+    def _get_cached_response(self, kind: str, week: int) -> Optional[Any]:
+        """Get a precomputed or cached AI response for a week, None if missing or older than OPENAI_RESPONSE_CACHE_TTL"""
+        precomputed = self._precomputed.get((kind, week))
+        if precomputed is not None:
+            return precomputed
+        entry = self._response_cache.get((kind, week))
+        if entry and time.monotonic() - entry[0] < settings.OPENAI_RESPONSE_CACHE_TTL:
+            return entry[1]
+        return None
+    
+    def _cache_response(self, kind: str, week: int, value: Any) -> Any:
+        """Cache an AI response for a week and return it"""
+        self._response_cache[(kind, week)] = (time.monotonic(), value)
+        return value
+    
+    def _get_async_client(self):
+        """Get the AsyncOpenAI client and concurrency semaphore for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            # The client retries rate limit and transient errors with exponential backoff
+            self._async_client = self._openai.AsyncOpenAI(
+                api_key=settings.OPENAI_API_KEY,
+                max_retries=settings.OPENAI_MAX_RETRIES,
+                http_client=get_http_client()
+            )
+            self._semaphore = asyncio.Semaphore(settings.OPENAI_MAX_CONCURRENCY)
+            self._async_client_loop = loop
+        return self._async_client, self._semaphore
+    
     async def _call_openai(self, prompt: str) -> str:
-        """Make async call to OpenAI API"""
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None, 
-            lambda: self.client.chat.completions.create(
-                model=self.model,
+        """Make async call to OpenAI API, throttled to OPENAI_MAX_CONCURRENCY in-flight requests"""
+        client, semaphore = self._get_async_client()
+        async with semaphore:
+            response = await client.chat.completions.create(
                 messages=[{"role": "user", "content": prompt}],
-                max_tokens=self.max_tokens,
-                temperature=0.7
+                **self._base_kwargs
             )
-        )
         return response.choices[0].message.content
     
-    def _create_baby_size_prompt(self, week: int) -> str:
-        """Create a prompt for OpenAI to get baby size information"""
-        return f"""
-        Provide detailed baby size information for pregnancy week {week}. 
+    async def get_week_bundle(self, week: int) -> Dict[str, Any]:
+        """Get baby size, symptoms, screening, wellness and nutrition for a week
         
-        Please respond with a JSON object containing:
-        - "size": A relatable size comparison (e.g., "Lima bean", "Blueberry", "Coconut", "Avocado")
-        - "weight": Weight in grams (e.g., "0.1g", "1.2g", "15g")
-        - "length": Length in centimeters (e.g., "0.1cm", "0.5cm", "2.5cm")
-        
-        Make the size comparison relatable and easy to understand.
+        The five prompts are independent, so they run concurrently instead of
+        paying five sequential OpenAI round-trips.
         """
+        getters = (
+            self.get_baby_size_for_week, self.get_early_symptoms, self.get_prenatal_screening,
+            self.get_wellness_tips, self.get_nutrition_tips
+        )
+        results = await asyncio.gather(*(getter(week) for getter in getters))
+        return dict(zip(_BUNDLE_KINDS, results))
     
-    def _create_symptoms_prompt(self, week: int) -> str:
-        """Create a prompt for symptoms information"""
-        return f"""
-        Provide comprehensive early pregnancy symptoms information for week {week}.
+    async def submit_batch(self, requests: List[Dict[str, str]]) -> str:
+        """Submit {"custom_id", "prompt"} requests as one OpenAI Batch API job and return its id"""
+        lines = [
+            json.dumps({
+                "custom_id": request["custom_id"],
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {"messages": [{"role": "user", "content": request["prompt"]}], **self._base_kwargs}
+            })
+            for request in requests
+        ]
         
-        Respond with a JSON object containing:
-        - "common_symptoms": List of common symptoms for this week
-        - "when_to_call_doctor": List of warning signs requiring medical attention
-        - "relief_tips": List of practical relief suggestions
-        - "severity_level": Overall severity level (mild, moderate, severe)
-        """
+        client, _ = self._get_async_client()
+        batch_file = await client.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = await client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        return batch.id
     
-    def _create_screening_prompt(self, week: int) -> str:
-        """Create a prompt for screening information"""
-        return f"""
-        Provide prenatal screening information for pregnancy week {week}.
+    async def wait_for_batch(self, batch_id: str, poll_interval: Optional[float] = None) -> Dict[str, str]:
+        """Wait for a batch job to finish and return response content by custom_id for successful requests"""
+        client, _ = self._get_async_client()
+        poll_interval = poll_interval or settings.OPENAI_BATCH_POLL_INTERVAL
         
-        Respond with a JSON object containing:
-        - "recommended_tests": List of recommended screening tests
-        - "test_descriptions": List of descriptions for each test
-        - "timing": When these tests should be performed
-        - "importance": Why these tests are important
-        """
-    
-    def _create_wellness_prompt(self, week: int) -> str:
-        """Create a prompt for wellness tips"""
-        return f"""
-        Provide wellness and lifestyle tips for pregnancy week {week}.
+        while True:
+            batch = await client.batches.retrieve(batch_id)
+            if batch.status == "completed":
+                break
+            if batch.status in ("failed", "expired", "cancelled"):
+                raise RuntimeError(f"OpenAI batch {batch_id} ended with status {batch.status}")
+            logger.info("OpenAI batch %s is %s, checking again in %ss", batch_id, batch.status, poll_interval)
+            await asyncio.sleep(poll_interval)
         
-        Respond with a JSON object containing:
-        - "exercise_tips": List of safe exercise recommendations
-        - "sleep_advice": List of sleep and rest tips
-        - "stress_management": List of stress management techniques
-        - "general_wellness": List of general wellness practices
-        """
+        if not batch.output_file_id:
+            return {}
+        
+        output = await client.files.content(batch.output_file_id)
+        results = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            response = item.get("response") or {}
+            if response.get("status_code") == 200:
+                results[item["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+        return results
     
-    def _create_nutrition_prompt(self, week: int) -> str:
-        """Create a prompt for nutrition tips"""
-        return f"""
-        Provide nutrition guidance for pregnancy week {week}.
+    async def get_bundle_batch(self, weeks: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Precompute the week bundle for many weeks through one Batch API job
         
-        Respond with a JSON object containing:
-        - "essential_nutrients": List of key nutrients needed
-        - "foods_to_avoid": List of foods to avoid or limit
-        - "meal_suggestions": List of meal and snack ideas
-        - "hydration_tips": List of hydration recommendations
+        Parsed responses are kept as precomputed, so later get_* calls for these
+        weeks need no OpenAI request. Prompts that failed in the batch get the
+        fallback data in the returned bundle and are not kept.
         """
-    
-    def _parse_baby_size_response(self, response: str, week: int) -> BabySize:
-        """Parse OpenAI response for baby size data"""
-        try:
-            # Try to extract JSON from response
-            json_start = response.find('{')
-            json_end = response.rfind('}') + 1
-            if json_start != -1 and json_end != 0:
-                json_str = response[json_start:json_end]
-                data = json.loads(json_str)
-                return BabySize(
-                    size=data.get('size', f'Week {week} baby'),
-                    weight=data.get('weight', 'Unknown'),
-                    length=data.get('length', 'Unknown')
-                )
-        except Exception as e:
-            print(f"Failed to parse baby size response: {e}")
+        requests = [
+            {"custom_id": f"{kind}:{week}", "prompt": getattr(self, f"_create_{kind}_prompt")(week)}
+            for week in weeks
+            for kind in _BUNDLE_KINDS
+        ]
+        batch_id = await self.submit_batch(requests)
+        logger.info("Submitted OpenAI batch %s with %d requests", batch_id, len(requests))
+        contents = await self.wait_for_batch(batch_id)
         
-        return self._get_fallback_baby_size(week)
+        bundles = {}
+        for week in weeks:
+            bundle = {}
+            for kind in _BUNDLE_KINDS:
+                content = contents.get(f"{kind}:{week}")
+                if content is None:
+                    bundle[kind] = getattr(self, f"_get_fallback_{kind}")(week)
+                else:
+                    bundle[kind] = self._precomputed[(kind, week)] = self._parse_response(content, kind, week)
+            bundles[week] = bundle
+        return bundles
     
-    def _parse_symptoms_response(self, response: str) -> SymptomInfo:
-        """Parse OpenAI response for symptoms data"""
-        try:
-            json_start = response.find('{')
-            json_end = response.rfind('}') + 1
-            if json_start != -1 and json_end != 0:
-                json_str = response[json_start:json_end]
-                data = json.loads(json_str)
-                return SymptomInfo(
-                    common_symptoms=data.get('common_symptoms', []),
-                    when_to_call_doctor=data.get('when_to_call_doctor', []),
-                    relief_tips=data.get('relief_tips', []),
-                    severity_level=data.get('severity_level', 'mild')
-                )
-        except Exception as e:
-            print(f"Failed to parse symptoms response: {e}")
-        
-        return self._get_fallback_symptoms(1)
+    def save_precomputed(self, path: str):
+        """Write the precomputed responses to a JSON file for load_precomputed"""
+        data: Dict[str, Dict[str, Any]] = {}
+        for (kind, week), value in sorted(self._precomputed.items()):
+            data.setdefault(kind, {})[str(week)] = value.model_dump(mode="json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
     
-    def _parse_screening_response(self, response: str) -> ScreeningInfo:
-        """Parse OpenAI response for screening data"""
+    def load_precomputed(self, path: str):
+        """Load responses written by save_precomputed, a missing or invalid file is logged and skipped"""
         try:
-            json_start = response.find('{')
-            json_end = response.rfind('}') + 1
-            if json_start != -1 and json_end != 0:
-                json_str = response[json_start:json_end]
-                data = json.loads(json_str)
-                return ScreeningInfo(
-                    recommended_tests=data.get('recommended_tests', []),
-                    test_descriptions=data.get('test_descriptions', []),
-                    timing=data.get('timing', 'As recommended by healthcare provider'),
-                    importance=data.get('importance', 'Important for monitoring pregnancy health')
-                )
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            for kind, weeks in data.items():
+                model_cls = _PARSE_SPECS[kind][0]
+                for week, value in weeks.items():
+                    self._precomputed[(kind, int(week))] = model_cls.model_validate(value)
+            logger.info("Loaded %d precomputed OpenAI responses from %s", len(self._precomputed), path)
         except Exception as e:
-            print(f"Failed to parse screening response: {e}")
-        
-        return self._get_fallback_screening(1)
+            logger.warning("Could not load precomputed OpenAI responses from %s: %s", path, e)
     
-    def _parse_wellness_response(self, response: str) -> WellnessInfo:
-        """Parse OpenAI response for wellness data"""
-        try:
-            json_start = response.find('{')
-            json_end = response.rfind('}') + 1
-            if json_start != -1 and json_end != 0:
-                json_str = response[json_start:json_end]
-                data = json.loads(json_str)
-                return WellnessInfo(
-                    exercise_tips=data.get('exercise_tips', []),
-                    sleep_advice=data.get('sleep_advice', []),
-                    stress_management=data.get('stress_management', []),
-                    general_wellness=data.get('general_wellness', [])
-                )
-        except Exception as e:
-            print(f"Failed to parse wellness response: {e}")
-        
-        return self._get_fallback_wellness(1)
+    def _create_baby_size_prompt(self, week: int) -> str:
+        """Create a prompt for OpenAI to get baby size information"""
+        return _BABY_SIZE_PROMPT.format(week=week)
     
-    def _parse_nutrition_response(self, response: str) -> NutritionInfo:
-        """Parse OpenAI response for nutrition data"""
+    def _create_symptoms_prompt(self, week: int) -> str:
+        """Create a prompt for symptoms information"""
+        return _SYMPTOMS_PROMPT.format(week=week)
+    
+    def _create_screening_prompt(self, week: int) -> str:
+        """Create a prompt for screening information"""
+        return _SCREENING_PROMPT.format(week=week)
+    
+    def _create_wellness_prompt(self, week: int) -> str:
+        """Create a prompt for wellness tips"""
+        return _WELLNESS_PROMPT.format(week=week)
+    
+    def _create_nutrition_prompt(self, week: int) -> str:
+        """Create a prompt for nutrition tips"""
+        return _NUTRITION_PROMPT.format(week=week)
+    
+    def _parse_response(self, response: str, kind: str, week: int) -> Any:
+        """Parse an OpenAI response into the model registered for kind in _PARSE_SPECS"""
+        model_cls, get_defaults = _PARSE_SPECS[kind]
         try:
-            json_start = response.find('{')
-            json_end = response.rfind('}') + 1
-            if json_start != -1 and json_end != 0:
-                json_str = response[json_start:json_end]
-                data = json.loads(json_str)
-                return NutritionInfo(
-                    essential_nutrients=data.get('essential_nutrients', []),
-                    foods_to_avoid=data.get('foods_to_avoid', []),
-                    meal_suggestions=data.get('meal_suggestions', []),
-                    hydration_tips=data.get('hydration_tips', [])
-                )
+            data = _extract_json(response)
+            if data is not None:
+                return model_cls.model_validate({**get_defaults(week), **data})
         except Exception as e:
-            print(f"Failed to parse nutrition response: {e}")
+            logger.warning("Failed to parse %s response: %s", kind, e)
         
-        return self._get_fallback_nutrition(1)
+        return getattr(self, f"_get_fallback_{kind}")(week)
     
     def _get_fallback_baby_size(self, week: int) -> BabySize:
         """Fallback baby size data when OpenAI fails"""
-        fallback_sizes = {
-            1: BabySize(size="Poppy seed", weight="0.1g", length="0.1cm"),
-            10: BabySize(size="Kumquat", weight="4g", length="3.1cm"),
-            20: BabySize(size="Banana", weight="300g", length="16.4cm"),
-            30: BabySize(size="Cabbage", weight="1.3kg", length="39.9cm"),
-            40: BabySize(size="Watermelon", weight="3.4kg", length="51.2cm")
-        }
-        
-        # Find closest week
-        for w in sorted(fallback_sizes.keys()):
-            if week <= w:
-                return fallback_sizes[w]
-        
-        return fallback_sizes[40]
+        return _FALLBACK_BABY_SIZE_BY_WEEK[min(max(week, 1), 40)]
     
     def _get_fallback_symptoms(self, week: int) -> SymptomInfo:
         """Fallback symptoms data"""
-        return SymptomInfo(
-            common_symptoms=["Nausea", "Fatigue", "Breast tenderness"],
-            when_to_call_doctor=["Severe nausea", "Heavy bleeding", "Severe pain"],
-            relief_tips=["Eat small meals", "Stay hydrated", "Get plenty of rest"],
-            severity_level="mild"
-        )
+        return _FALLBACK_SYMPTOMS
     
     def _get_fallback_screening(self, week: int) -> ScreeningInfo:
         """Fallback screening data"""
-        return ScreeningInfo(
-            recommended_tests=["Blood work", "Ultrasound"],
-            test_descriptions=["Basic blood tests", "First trimester screening"],
-            timing="As recommended by healthcare provider",
-            importance="Important for monitoring pregnancy health"
-        )
+        return _FALLBACK_SCREENING
     
     def _get_fallback_wellness(self, week: int) -> WellnessInfo:
         """Fallback wellness data"""
-        return WellnessInfo(
-            exercise_tips=["Walking", "Prenatal yoga", "Swimming"],
-            sleep_advice=["Sleep on side", "Use pregnancy pillow", "Maintain regular schedule"],
-            stress_management=["Meditation", "Deep breathing", "Gentle exercise"],
-            general_wellness=["Stay hydrated", "Eat balanced meals", "Take prenatal vitamins"]
-        )
+        return _FALLBACK_WELLNESS
     
     def _get_fallback_nutrition(self, week: int) -> NutritionInfo:
         """Fallback nutrition data"""
-        return NutritionInfo(
-            essential_nutrients=["Folic acid", "Iron", "Calcium", "Protein"],
-            foods_to_avoid=["Raw fish", "Unpasteurized cheese", "Excessive caffeine"],
-            meal_suggestions=["Balanced breakfast", "Protein-rich snacks", "Colorful vegetables"],
-            hydration_tips=["Drink 8-10 glasses of water", "Limit caffeine", "Include hydrating foods"]
-        )
+        return _FALLBACK_NUTRITION
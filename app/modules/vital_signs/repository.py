@@ -3,6 +3,8 @@ Vital Signs Repository - Data Access Layer (Model)
 Handles all database operations for vital signs module
 """
 
+from datetime import datetime, timedelta
+from app.core.config import MAX_VITAL_HISTORY
 from app.core.database import db
 
 
@@ -18,27 +20,70 @@ class VitalSignsRepository:
         return self.collection.find_one({"patient_id": patient_id})
     
     def save_vital_signs(self, patient_id, vital_signs_data):
-        """Save vital signs to patient record"""
+        """Save vital signs to patient record, keeping only the newest MAX_VITAL_HISTORY entries"""
+        # History stays oldest first so the latest entry is always the last one
         result = self.collection.update_one(
             {"patient_id": patient_id},
-            {"$push": {"vital_signs_history": vital_signs_data}}
+            {
+                "$push": {
+                    "vital_signs_history": {
+                        "$each": [vital_signs_data],
+                        "$sort": {"timestamp": 1},
+                        "$slice": -MAX_VITAL_HISTORY
+                    }
+                },
+                "$setOnInsert": {"patient_id": patient_id}
+            },
+            upsert=True
         )
-        return result.modified_count > 0
+        return result.modified_count > 0 or result.upserted_id is not None
     
-    def get_vital_signs_history(self, patient_id):
-        """Get vital signs history for patient"""
-        patient = self.collection.find_one({"patient_id": patient_id})
+    def get_vital_signs_history(self, patient_id, limit=None, days=None):
+        """
+        Get vital signs history for patient
+        
+        Only the last `limit` entries and/or the entries from the last `days`
+        days are returned if given.
+        """
+        if days:
+            return self._get_recent_vital_signs_history(patient_id, days, limit)
+        
+        history_projection = {"$slice": -limit} if limit else 1
+        patient = self.collection.find_one(
+            {"patient_id": patient_id},
+            {"vital_signs_history": history_projection, "_id": 0}
+        )
         if patient:
             return patient.get('vital_signs_history', [])
         return []
     
+    def _get_recent_vital_signs_history(self, patient_id, days, limit=None):
+        """Filter the history by timestamp in Mongo so only the requested window is sent back"""
+        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+        recent = {
+            "$filter": {
+                "input": {"$ifNull": ["$vital_signs_history", []]},
+                "as": "v",
+                "cond": {"$gte": ["$$v.timestamp", cutoff]}
+            }
+        }
+        if limit:
+            recent = {"$slice": [recent, -limit]}
+        
+        patients = list(self.collection.aggregate([
+            {"$match": {"patient_id": patient_id}},
+            {"$limit": 1},
+            {"$project": {"_id": 0, "vital_signs_history": recent}}
+        ]))
+        if patients:
+            return patients[0].get('vital_signs_history', [])
+        return []
+    
     def get_latest_vital_signs(self, patient_id):
         """Get latest vital signs for patient"""
-        patient = self.collection.find_one({"patient_id": patient_id})
-        if patient:
-            history = patient.get('vital_signs_history', [])
-            return history[-1] if history else None
-        return None
+        # Only the last history entry is sent back, not the whole array
+        history = self.get_vital_signs_history(patient_id, limit=1)
+        return history[0] if history else None
     
     def delete_vital_sign(self, patient_id, vital_id):
         """Delete specific vital sign entry"""
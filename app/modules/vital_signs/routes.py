@@ -2,6 +2,9 @@
 Vital Signs Routes - EXTRACTED FROM app_simple.py
 Thin routing layer that delegates to services containing EXACT original logic
 """
+import os
+import shutil
+import tempfile
 from flask import Blueprint, request, jsonify
 from app.core.auth import token_required
 from .services import (
@@ -23,11 +26,24 @@ from app.shared.ocr_service import ocr_service as vital_ocr_service
 
 vital_signs_bp = Blueprint('vital_signs', __name__)
 
+UPLOAD_COPY_CHUNK_SIZE = 1 << 20  # 1 MB
+
+
+def _save_upload_to_tempfile(file):
+    """Stream an uploaded file to a temporary file in chunks and return its path
+
+    The caller is responsible for deleting the file.
+    """
+    suffix = os.path.splitext(file.filename or '')[1]
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+        shutil.copyfileobj(file.stream, tmp, UPLOAD_COPY_CHUNK_SIZE)
+    return tmp.name
+
 
 @vital_signs_bp.route('/record', methods=['POST'])
 def record_vital_sign():
     """EXTRACTED FROM app_simple.py line 3548"""
-    data = request.get_json()
+    data = request.get_json(cache=False, silent=True)
     return record_vital_sign_service(data)
 
 
@@ -41,7 +57,7 @@ def get_vital_signs_history(patient_id):
 @vital_signs_bp.route('/analyze', methods=['POST'])
 def analyze_vital_signs():
     """EXTRACTED FROM app_simple.py line 3595"""
-    data = request.get_json()
+    data = request.get_json(cache=False, silent=True)
     return analyze_vital_signs_service(data)
 
 
@@ -61,7 +77,9 @@ def get_health_summary(patient_id):
 @vital_signs_bp.route('/alerts', methods=['POST'])
 def create_vital_alert():
     """EXTRACTED FROM app_simple.py line 3693"""
-    data = request.get_json()
+    data = request.get_json(cache=False, silent=True)
+    if data is None:
+        return jsonify({'error': 'Invalid or missing JSON body'}), 400
     return create_vital_alert_service(data)
 
 
@@ -79,13 +97,19 @@ def process_vital_signs_ocr():
     
     file = request.files['file']
     patient_id = request.form.get('patient_id')
-    return process_vital_signs_ocr_service(file, patient_id)
+    file_path = _save_upload_to_tempfile(file)
+    try:
+        return process_vital_signs_ocr_service(file_path, file.filename, patient_id)
+    finally:
+        os.unlink(file_path)
 
 
 @vital_signs_bp.route('/process-text', methods=['POST'])
 def process_vital_signs_text():
     """EXTRACTED FROM app_simple.py line 3816"""
-    data = request.get_json()
+    data = request.get_json(cache=False, silent=True)
+    if data is None:
+        return jsonify({'error': 'Invalid or missing JSON body'}), 400
     return process_vital_signs_text_service(data)
 
 
@@ -99,13 +123,20 @@ def vital_ocr_upload():
         return jsonify({'success': False, 'message': 'No file provided'}), 400
     
     file = request.files['file']
-    return vital_ocr_upload_service(file, vital_ocr_service)
+    if file.filename == '':
+        return vital_ocr_upload_service(None, file.filename, file.content_type, vital_ocr_service)
+    
+    file_path = _save_upload_to_tempfile(file)
+    try:
+        return vital_ocr_upload_service(file_path, file.filename, file.content_type, vital_ocr_service)
+    finally:
+        os.unlink(file_path)
 
 
 @vital_signs_bp.route('/vital-ocr/base64', methods=['POST'])
 def vital_ocr_base64():
     """Process base64 encoded image for OCR"""
-    data = request.get_json()
+    data = request.get_json(cache=False, silent=True)
     return vital_ocr_base64_service(data, vital_ocr_service)
 
 
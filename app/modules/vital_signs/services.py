@@ -3,16 +3,53 @@ Vital Signs Service - EXTRACTED FROM app_simple.py
 Contains EXACT business logic from lines 3548-3844
 NO CHANGES to functionality - just reorganized
 """
+import binascii
+import logging
+import mimetypes
 from flask import jsonify
 from datetime import datetime, timedelta
 from app.core.database import db
+from app.core.cache import cache
+from app.core.validators import decode_base64_payload
 from app.shared.external_services.vital_signs_service import VitalSignsService
 from app.shared.ocr_service import OCRService
 
+logger = logging.getLogger(__name__)
+
 # Initialize
 vital_signs_service = VitalSignsService(db)
 ocr_service = OCRService()
 
+# Cache timeouts (seconds) for dashboard reads
+STATS_CACHE_TIMEOUT = 60
+HEALTH_SUMMARY_CACHE_TIMEOUT = 120
+# Default window of the /stats endpoint, invalidated on new readings
+DEFAULT_STATS_DAYS = 30
+
+
+def _is_success(result):
+    """Only cache successful results, errors are retried on the next request"""
+    return result.get('success')
+
+
+@cache.memoize(timeout=STATS_CACHE_TIMEOUT, response_filter=_is_success)
+def _vital_signs_stats(patient_id, days):
+    return vital_signs_service.get_stats_aggregated(patient_id, days)
+
+
+@cache.memoize(timeout=HEALTH_SUMMARY_CACHE_TIMEOUT, response_filter=_is_success)
+def _health_summary(patient_id):
+    return vital_signs_service.get_health_summary(patient_id)
+
+
+def _invalidate_patient_cache(patient_id):
+    """Drop cached reads for a patient after their vitals or alerts change
+
+    Stats for non-default windows are left to expire with STATS_CACHE_TIMEOUT.
+    """
+    cache.delete_memoized(_vital_signs_stats, patient_id, DEFAULT_STATS_DAYS)
+    cache.delete_memoized(_health_summary, patient_id)
+
 
 def record_vital_sign_service(data):
     """
@@ -38,12 +75,13 @@ def record_vital_sign_service(data):
         result = vital_signs_service.record_vital_sign(patient_id, data)
         
         if result['success']:
+            _invalidate_patient_cache(patient_id)
             return jsonify(result), 200
         else:
             return jsonify(result), 500
             
     except Exception as e:
-        print(f"Error recording vital sign: {e}")
+        logger.exception("Error recording vital sign")
         return jsonify({'success': False, 'message': f'Error: {str(e)}'}), 500
 
 
@@ -62,7 +100,7 @@ def get_vital_signs_history_service(patient_id, days=30):
             return jsonify(result), 500
             
     except Exception as e:
-        print(f"Error getting vital signs history: {e}")
+        logger.exception("Error getting vital signs history")
         return jsonify({'success': False, 'message': f'Error: {str(e)}'}), 500
 
 
@@ -90,7 +128,7 @@ def analyze_vital_signs_service(data):
             return jsonify(result), 500
             
     except Exception as e:
-        print(f"Error analyzing vital signs: {e}")
+        logger.exception("Error analyzing vital signs")
         return jsonify({'success': False, 'message': f'Error: {str(e)}'}), 500
 
 
@@ -101,54 +139,23 @@ def get_vital_signs_stats_service(patient_id, days=30):
     EXACT SAME LOGIC - NO CHANGES
     """
     try:
-        # Get vital signs history
-        history_result = vital_signs_service.get_vital_signs_history(patient_id, days)
-        if not history_result['success']:
-            return jsonify(history_result), 500
-        
-        vital_signs = history_result['vital_signs']
+        # Statistics are aggregated in MongoDB, only per-type results come back
+        result = _vital_signs_stats(patient_id, days)
         
-        # Calculate statistics
-        stats = {}
-        for vs in vital_signs:
-            vs_type = vs.get('type')
-            value = vs.get('value', 0)
-            
-            if vs_type not in stats:
-                stats[vs_type] = {
-                    'count': 0,
-                    'values': [],
-                    'latest_value': value,
-                    'latest_timestamp': vs.get('timestamp')
-                }
-            
-            stats[vs_type]['count'] += 1
-            stats[vs_type]['values'].append(value)
-        
-        # Calculate averages
-        for vs_type in stats:
-            values = stats[vs_type]['values']
-            if values:
-                stats[vs_type]['average'] = sum(values) / len(values)
-                stats[vs_type]['min'] = min(values)
-                stats[vs_type]['max'] = max(values)
-        
-        return jsonify({
-            'success': True,
-            'patient_id': patient_id,
-            'days': days,
-            'statistics': stats
-        }), 200
+        if result['success']:
+            return jsonify(result), 200
+        else:
+            return jsonify(result), 500
             
     except Exception as e:
-        print(f"Error getting vital signs stats: {e}")
+        logger.exception("Error getting vital signs stats")
         return jsonify({'success': False, 'message': f'Error: {str(e)}'}), 500
 
 
 def get_health_summary_service(patient_id):
     """EXTRACTED FROM app_simple.py lines 3678-3691"""
     try:
-        result = vital_signs_service.get_health_summary(patient_id)
+        result = _health_summary(patient_id)
         return jsonify(result), 200 if result.get('success') else 500
     except Exception as e:
         return jsonify({'success': False, 'message': f'Error: {str(e)}'}), 500
@@ -162,6 +169,8 @@ def create_vital_alert_service(data):
             return jsonify({'error': 'Patient ID is required'}), 400
         
         result = vital_signs_service.create_alert(patient_id, data)
+        if result.get('success'):
+            _invalidate_patient_cache(patient_id)
         return jsonify(result), 200 if result.get('success') else 500
     except Exception as e:
         return jsonify({'error': f'Failed: {str(e)}'}), 500
@@ -176,11 +185,10 @@ def get_vital_alerts_service(patient_id):
         return jsonify({'error': f'Failed: {str(e)}'}), 500
 
 
-def process_vital_signs_ocr_service(file, patient_id):
+def process_vital_signs_ocr_service(file_path, filename, patient_id):
     """EXTRACTED FROM app_simple.py lines 3778-3814"""
     try:
-        file_content = file.read()
-        result = ocr_service.process_file(file_content, file.filename)
+        result = ocr_service.process_file_path(file_path, filename)
         
         return jsonify(result), 200 if result.get('success') else 400
     except Exception as e:
@@ -190,60 +198,65 @@ def process_vital_signs_ocr_service(file, patient_id):
 # ==================== VITAL OCR ENDPOINTS ====================
 # EXTRACTED FROM app_simple.py lines 3844-3933
 
-def vital_ocr_upload_service(file, vital_ocr_service):
+def vital_ocr_upload_service(file_path, filename, content_type, vital_ocr_service):
     """Upload document for enhanced OCR - EXACT from line 3844"""
     try:
-        if not file or file.filename == '':
+        if not file_path or filename == '':
             return jsonify({'success': False, 'message': 'No file selected'}), 400
         
         # Validate file type
-        if not vital_ocr_service.validate_file_type(file.content_type, file.filename):
+        if not vital_ocr_service.validate_file_type(content_type, filename):
             return jsonify({
                 'success': False, 
-                'message': f'Unsupported file type: {file.content_type}. Allowed types: {vital_ocr_service.allowed_types}'
+                'message': f'Unsupported file type: {content_type}. Allowed types: {vital_ocr_service.allowed_types}'
             }), 400
         
-        # Read file content
-        file_content = file.read()
-        
-        # Process file using vital OCR service
-        result = vital_ocr_service.process_file(file_content, file.filename)
+        # Process the uploaded file from disk using vital OCR service
+        result = vital_ocr_service.process_file_path(file_path, filename)
         
         return jsonify(result), 200 if result.get('success') else 400
         
     except Exception as e:
-        print(f"Error processing vital OCR upload: {e}")
+        logger.exception("Error processing vital OCR upload")
         return jsonify({'success': False, 'message': f'Error: {str(e)}'}), 500
 
 
 def vital_ocr_base64_service(data, vital_ocr_service):
     """Process base64 encoded image - EXACT from line 3874"""
     try:
-        print("[*] Vital OCR base64 endpoint called")
-        print(f"[*] Received data keys: {list(data.keys()) if data else 'None'}")
+        # Building the key list is only worth it when debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Vital OCR base64 request, data keys: %s", list(data.keys()) if data else None)
         
         if not data or 'image' not in data:
-            print("[ERROR] No image data provided")
+            logger.debug("Vital OCR base64: no image data provided")
             return jsonify({'success': False, 'message': 'No image data provided'}), 400
         
         image_data = data['image']
-        print(f"[*] Image data length: {len(image_data) if image_data else 0}")
+        logger.debug("Vital OCR base64: image data length %d", len(image_data) if isinstance(image_data, str) else 0)
         
-        if not image_data or not image_data.strip():
-            print("[ERROR] Image data is empty")
+        # Non-string values are rejected as invalid base64 below
+        if not image_data or (isinstance(image_data, str) and not image_data.strip()):
+            logger.debug("Vital OCR base64: image data is empty")
             return jsonify({'success': False, 'message': 'Image data cannot be empty'}), 400
         
-        print("[*] Processing base64 image with vital OCR service...")
-        # Process base64 image using vital OCR service
-        result = vital_ocr_service.process_base64_image(image_data, "base64_image")
-        print(f"[*] Vital OCR result: {result}")
+        # Decode once here, malformed input is rejected before any OCR work
+        try:
+            decoded, mime_type = decode_base64_payload(image_data)
+        except binascii.Error:
+            return jsonify({'success': False, 'message': 'Invalid base64 image data'}), 400
+        
+        # OCR dispatches on the file extension; untyped payloads are treated as PNG
+        extension = (mime_type and mimetypes.guess_extension(mime_type)) or '.png'
+        
+        # Process decoded image using vital OCR service
+        result = vital_ocr_service.process_file(decoded, f"base64_image{extension}")
+        logger.debug("Vital OCR base64 result: %s", result)
         
         return jsonify(result), 200 if result.get('success') else 400
         
     except Exception as e:
-        print(f"[ERROR] Error processing vital OCR base64: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error processing vital OCR base64")
         return jsonify({'success': False, 'message': f'Error: {str(e)}'}), 500
 
 
@@ -258,7 +271,7 @@ def get_vital_ocr_formats_service(vital_ocr_service):
         }), 200
         
     except Exception as e:
-        print(f"Error getting vital OCR formats: {e}")
+        logger.exception("Error getting vital OCR formats")
         return jsonify({'success': False, 'message': f'Error: {str(e)}'}), 500
 
 
@@ -272,7 +285,7 @@ def get_vital_ocr_status_service(vital_ocr_service):
         }), 200
         
     except Exception as e:
-        print(f"Error getting vital OCR status: {e}")
+        logger.exception("Error getting vital OCR status")
         return jsonify({'success': False, 'message': f'Error: {str(e)}'}), 500
 
 
@@ -6,11 +6,31 @@ Business logic for voice transcription, AI response, text-to-speech
 NO CHANGES TO LOGIC - Exact extraction, converted to function-based
 """
 
+import binascii
+import os
 from flask import jsonify
-import asyncio
+from app.core.config import MAX_VOICE_SIZE
+from app.core.validators import decode_base64_payload
+from app.shared.async_runner import run_coro
 from app.shared.external_services.voice_interaction_service import voice_interaction_service
 
 
+def _upload_size(file):
+    """Size in bytes of an uploaded file's stream, without reading it"""
+    stream = file.stream
+    position = stream.tell()
+    size = stream.seek(0, os.SEEK_END)
+    stream.seek(position)
+    return size
+
+
+def _audio_too_large_response():
+    return jsonify({
+        'success': False,
+        'error': f'Audio file too large. Maximum size: {MAX_VOICE_SIZE}MB'
+    }), 413
+
+
 def voice_transcribe_service(file, patient_id):
     """Transcribe audio to text - EXACT from line 8535"""
     try:
@@ -20,11 +40,15 @@ def voice_transcribe_service(file, patient_id):
                 'error': 'No audio file selected'
             }), 400
         
-        # Read audio data
+        # Check the size before reading, so oversize audio is never loaded into memory
+        if _upload_size(file) > MAX_VOICE_SIZE * 1024 * 1024:
+            return _audio_too_large_response()
+        
+        # Read audio data (the STT provider takes bytes)
         audio_data = file.read()
         
         # Transcribe audio
-        result = asyncio.run(voice_interaction_service.transcribe_audio(audio_data))
+        result = run_coro(voice_interaction_service.transcribe_audio(audio_data))
         
         # Add patient ID to result
         result['patient_id'] = patient_id
@@ -49,8 +73,17 @@ def voice_transcribe_base64_service(data, patient_id):
                 'error': 'Base64 audio data is required'
             }), 400
         
-        # Transcribe base64 audio
-        result = asyncio.run(voice_interaction_service.transcribe_base64_audio(base64_audio))
+        # Decode once here, malformed input is rejected before calling the STT provider
+        try:
+            audio_data, _ = decode_base64_payload(base64_audio)
+        except binascii.Error:
+            return jsonify({
+                'success': False,
+                'error': 'Invalid base64 audio data'
+            }), 400
+        
+        # Transcribe decoded audio
+        result = run_coro(voice_interaction_service.transcribe_audio(audio_data))
         
         # Add patient ID to result
         result['patient_id'] = patient_id
@@ -77,7 +110,7 @@ def voice_ai_response_service(data, patient_id):
             }), 400
         
         # Generate AI response
-        result = asyncio.run(voice_interaction_service.generate_ai_response(text, conversation_history))
+        result = run_coro(voice_interaction_service.generate_ai_response(text, conversation_history))
         
         # Add patient ID to result
         result['patient_id'] = patient_id
@@ -103,7 +136,7 @@ def voice_text_to_speech_service(data, patient_id):
             }), 400
         
         # Convert text to speech
-        result = asyncio.run(voice_interaction_service.text_to_speech(text))
+        result = run_coro(voice_interaction_service.text_to_speech(text))
         
         # Add patient ID to result
         result['patient_id'] = patient_id
@@ -126,11 +159,15 @@ def voice_process_service(file, enable_tts, patient_id):
                 'error': 'No audio file selected'
             }), 400
         
-        # Read audio data
+        # Check the size before reading, so oversize audio is never loaded into memory
+        if _upload_size(file) > MAX_VOICE_SIZE * 1024 * 1024:
+            return _audio_too_large_response()
+        
+        # Read audio data (the STT provider takes bytes)
         audio_data = file.read()
         
         # Process voice interaction
-        result = asyncio.run(voice_interaction_service.process_voice_interaction(audio_data, enable_tts))
+        result = run_coro(voice_interaction_service.process_voice_interaction(audio_data, enable_tts))
         
         # Add patient ID to result
         result['patient_id'] = patient_id
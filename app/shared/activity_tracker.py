@@ -2,19 +2,32 @@
 User Activity Tracking System
 Tracks all user activities from login to logout
 """
+import atexit
 import os
+import threading
 import uuid
+from collections import deque
 from datetime import datetime
 from flask import request
 # Import shared database instance and create global tracker
 from app.core.database import db
+from app.core.config import ACTIVITY_FLUSH_INTERVAL, ACTIVITY_FLUSH_BATCH
 
 class UserActivityTracker:
     """Track all user activities from login to logout"""
     
     def __init__(self, db):
         self.db = db
-        self.activities_collection = db.client[os.getenv("DB_NAME", "patients_db")]["user_activities"]
+        database = db.client[os.getenv("DB_NAME", "patients_db")]
+        self.activities_collection = database["user_activities"]
+        # One document per activity, instead of a growing array on the session
+        self.events_collection = database["user_activity_events"]
+        
+        # Activity events are buffered and written in batches by a background thread
+        self._buffer = deque()
+        self._buffer_lock = threading.Lock()
+        self._flush_event = threading.Event()
+        self._flusher_pid = None
         
         # Create indexes for efficient querying
         try:
@@ -22,6 +35,9 @@ class UserActivityTracker:
             self.activities_collection.create_index("session_id")
             self.activities_collection.create_index("timestamp")
             self.activities_collection.create_index("activity_type")
+            self.events_collection.create_index("session_id")
+            self.events_collection.create_index([("user_email", 1), ("activity_type", 1)])
+            self.events_collection.create_index("timestamp")
             print("[OK] User Activity Tracker initialized")
         except Exception as e:
             print(f"[WARN] Activity tracker index creation: {e}")
@@ -97,15 +113,75 @@ class UserActivityTracker:
             "ip_address": request.remote_addr if request else "unknown"
         }
         
-        # Add activity to session
-        result = self.activities_collection.update_one(
-            {"session_id": session_id},
-            {"$push": {"activities": activity_entry}}
-        )
+        # Queue the activity as its own event document, written by the flush thread
+        self._ensure_flusher()
+        with self._buffer_lock:
+            self._buffer.append({**activity_entry, "session_id": session_id, "user_email": user_email})
+            buffer_full = len(self._buffer) >= ACTIVITY_FLUSH_BATCH
+        if buffer_full:
+            self._flush_event.set()
         
         print(f"[*] Logged activity: {activity_type} for user {user_email}")
         return activity_entry["activity_id"]
     
+    def _ensure_flusher(self):
+        """Start the flush thread on first use in this process
+
+        Started lazily (and per pid) so pre-forked workers each get their own
+        thread instead of inheriting a dead one from the master.
+        """
+        pid = os.getpid()
+        if self._flusher_pid == pid:
+            return
+        with self._buffer_lock:
+            if self._flusher_pid == pid:
+                return
+            # Events buffered before a fork belong to the parent process
+            self._buffer.clear()
+            threading.Thread(target=self._flush_loop, name="activity-flush", daemon=True).start()
+            atexit.register(self.flush)
+            self._flusher_pid = pid
+    
+    def _flush_loop(self):
+        while True:
+            self._flush_event.wait(ACTIVITY_FLUSH_INTERVAL)
+            self._flush_event.clear()
+            self.flush()
+    
+    def flush(self):
+        """Write all buffered activity events in one batch"""
+        with self._buffer_lock:
+            if not self._buffer:
+                return
+            events = list(self._buffer)
+            self._buffer.clear()
+        try:
+            self.events_collection.insert_many(events, ordered=False)
+        except Exception as e:
+            print(f"[WARN] Failed to write {len(events)} activity events: {e}")
+    
+    def _attach_activities(self, sessions):
+        """Fill each session's activities list from the events collection
+
+        Sessions recorded before events moved out keep their embedded
+        activities; new events are appended after them.
+        """
+        # Write anything still buffered so reads include this process's recent activity
+        self.flush()
+        by_session = {session["session_id"]: session for session in sessions}
+        for session in sessions:
+            session["activities"] = session.get("activities") or []
+        if not by_session:
+            return sessions
+        
+        events = self.events_collection.find(
+            {"session_id": {"$in": list(by_session)}},
+            {"_id": 0, "user_email": 0}
+        ).sort("timestamp", 1)
+        for event in events:
+            by_session[event.pop("session_id")]["activities"].append(event)
+        return sessions
+    
     def get_user_activities(self, user_email, limit=100):
         """Get all activities for a user"""
         sessions = list(self.activities_collection.find(
@@ -113,7 +189,7 @@ class UserActivityTracker:
             {"_id": 0}
         ).sort("created_at", -1).limit(limit))
         
-        return sessions
+        return self._attach_activities(sessions)
     
     def get_session_activities(self, session_id):
         """Get all activities for a specific session"""
@@ -121,22 +197,38 @@ class UserActivityTracker:
             {"session_id": session_id},
             {"_id": 0}
         )
+        if session is not None:
+            self._attach_activities([session])
         return session
     
     def get_activity_summary(self, user_email):
         """Get summary of user activities"""
+        self.flush()
         pipeline = [
             {"$match": {"user_email": user_email}},
-            {"$unwind": "$activities"},
+            {"$project": {"_id": 0, "activity_type": 1, "timestamp": 1}},
+            # Activities embedded in sessions recorded before events moved out
+            {"$unionWith": {
+                "coll": self.activities_collection.name,
+                "pipeline": [
+                    {"$match": {"user_email": user_email, "activities.0": {"$exists": True}}},
+                    {"$unwind": "$activities"},
+                    {"$project": {
+                        "_id": 0,
+                        "activity_type": "$activities.activity_type",
+                        "timestamp": "$activities.timestamp"
+                    }}
+                ]
+            }},
             {"$group": {
-                "_id": "$activities.activity_type",
+                "_id": "$activity_type",
                 "count": {"$sum": 1},
-                "last_activity": {"$max": "$activities.timestamp"}
+                "last_activity": {"$max": "$timestamp"}
             }},
             {"$sort": {"count": -1}}
         ]
         
-        summary = list(self.activities_collection.aggregate(pipeline))
+        summary = list(self.events_collection.aggregate(pipeline))
         return summary
 
 
@@ -0,0 +1,114 @@
+"""
+Shared background event loop for running coroutines from sync Flask code
+
+One long-lived loop per worker process replaces asyncio.run() per request, so
+async clients keep their connection pools between calls. Dispatch is bounded
+by a semaphore and, optionally, a token-bucket rate limit towards upstream.
+"""
+import asyncio
+import concurrent.futures
+import os
+import threading
+import time
+
+from app.core.config import ASYNC_RUNNER_CONCURRENCY, ASYNC_RUNNER_RATE_LIMIT, ASYNC_RUNNER_TIMEOUT
+
+try:
+    import uvloop  # Faster event loop, Linux/macOS only
+except ImportError:
+    uvloop = None
+
+_loop = None
+_loop_pid = None
+_loop_lock = threading.Lock()
+
+# Created on the loop thread, they must belong to the running loop
+_semaphore = None
+_rate_limiter = None
+
+
+class _TokenBucket:
+    """Token bucket allowing `rate` calls per second with bursts up to `rate`"""
+    
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.capacity = max(rate, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+    
+    async def acquire(self):
+        async with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens < 1:
+                delta = (1 - self.tokens) / self.rate
+                await asyncio.sleep(delta)
+                self.updated = time.monotonic()
+                self.tokens = 1
+            self.tokens -= 1
+
+
+def _start_loop(loop: asyncio.AbstractEventLoop):
+    global _semaphore, _rate_limiter
+    asyncio.set_event_loop(loop)
+    _semaphore = asyncio.Semaphore(ASYNC_RUNNER_CONCURRENCY)
+    _rate_limiter = _TokenBucket(ASYNC_RUNNER_RATE_LIMIT) if ASYNC_RUNNER_RATE_LIMIT > 0 else None
+    loop.run_forever()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Get the background loop, starting it on first use in this process
+
+    Started lazily (and per pid) rather than at import, so a loop thread
+    started before a pre-forking server forks is not inherited dead.
+    """
+    global _loop, _loop_pid
+    pid = os.getpid()
+    if _loop is None or _loop_pid != pid:
+        with _loop_lock:
+            if _loop is None or _loop_pid != pid:
+                loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+                threading.Thread(target=_start_loop, args=(loop,), name="async-runner-loop", daemon=True).start()
+                _loop, _loop_pid = loop, pid
+    return _loop
+
+
+async def _bounded(coro):
+    if _rate_limiter is not None:
+        await _rate_limiter.acquire()
+    async with _semaphore:
+        return await coro
+
+
+def run_coro(coro, timeout: float = ASYNC_RUNNER_TIMEOUT):
+    """Run a coroutine on the shared loop and wait for its result
+
+    A call still running after `timeout` seconds is cancelled on the loop
+    and TimeoutError is raised in the calling thread.
+    """
+    future = asyncio.run_coroutine_threadsafe(_bounded(coro), _get_loop())
+    try:
+        return future.result(timeout=timeout)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        raise TimeoutError(f"Async call timed out after {timeout}s")
+
+
+async def await_on_shared_loop(coro):
+    """Await a coroutine on the shared loop from a coroutine running on any other loop
+
+    Lets code driven by a short-lived loop (asyncio.run per request) use
+    clients that are bound to the long-lived loop, such as pooled HTTP sessions.
+    """
+    loop = _get_loop()
+    if asyncio.get_running_loop() is loop:
+        # Already dispatched through run_coro, which holds a semaphore slot
+        return await coro
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(_bounded(coro), loop))
+
+
+def get_shared_loop() -> asyncio.AbstractEventLoop:
+    """Get the shared background loop of this process"""
+    return _get_loop()
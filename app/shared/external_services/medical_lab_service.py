@@ -372,9 +372,7 @@ class MedicalLabService:
             # Run OCR with timeout to prevent hanging
             try:
                 result = await asyncio.wait_for(
-                    asyncio.get_event_loop().run_in_executor(
-                        None, ocr.ocr, opencv_image
-                    ),
+                    asyncio.to_thread(ocr.ocr, opencv_image),
                     timeout=120  # 2 minutes timeout
                 )
                 logger.info(f"[OK] PaddleOCR completed for {filename}")
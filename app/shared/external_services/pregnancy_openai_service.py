@@ -1,9 +1,19 @@
-import openai
+import aiohttp
+import atexit
 import json
 import asyncio
 import os
+import random
 from typing import Dict, Optional
 from .pregnancy_models import BabySize, SymptomInfo, ScreeningInfo, WellnessInfo, NutritionInfo
+from app.shared.async_runner import await_on_shared_loop, get_shared_loop
+
+OPENAI_CHAT_COMPLETIONS_URL = "https://api.openai.com/v1/chat/completions"
+# Rate limits, timeouts and server errors are worth retrying
+RETRYABLE_STATUSES = {408, 409, 429, 500, 502, 503, 504}
+MAX_RETRY_DELAY = 30
+# Pooled connections to api.openai.com kept by the shared session
+OPENAI_CONNECTION_LIMIT = 64
 
 class OpenAIBabySizeService:
     def __init__(self):
@@ -11,9 +21,14 @@ class OpenAIBabySizeService:
         if not openai_api_key:
             raise ValueError("OpenAI API key is required. Please set OPENAI_API_KEY in your environment variables.")
         
-        self.client = openai.OpenAI(api_key=openai_api_key)
+        self.api_key = openai_api_key
         self.model = os.getenv("OPENAI_MODEL", "gpt-4")
         self.max_tokens = int(os.getenv("OPENAI_MAX_TOKENS", "1500"))
+        self.max_retries = int(os.getenv("OPENAI_MAX_RETRIES", "3"))
+        
+        # Created lazily on the shared async_runner loop, so TLS connections are reused across requests
+        self._session = None
+        self._session_loop = None
     
     async def get_baby_size_for_week(self, week: int) -> BabySize:
         """
@@ -63,22 +78,72 @@ class OpenAIBabySizeService:
         """
     
     async def _call_openai(self, prompt: str) -> str:
-        """Make an async call to OpenAI API"""
-        loop = asyncio.get_event_loop()
+        """Make an async call to the OpenAI chat completions endpoint"""
+        payload = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": "You are a medical AI assistant specializing in pregnancy development. Provide accurate, helpful information about fetal development and baby sizes."},
+                {"role": "user", "content": prompt}
+            ],
+            "max_tokens": self.max_tokens,
+            "temperature": 0.7
+        }
         
-        def _call():
-            return self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a medical AI assistant specializing in pregnancy development. Provide accurate, helpful information about fetal development and baby sizes."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=self.max_tokens,
-                temperature=0.7
+        # Callers run each request on a fresh event loop (asyncio.run), so the
+        # request itself is sent from the long-lived shared loop that owns the session
+        return await await_on_shared_loop(self._post_chat_completion(payload))
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the pooled session, creating it on the running (shared) loop on first use"""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session_loop is not loop:
+            self._session = aiohttp.ClientSession(
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                timeout=aiohttp.ClientTimeout(total=60),
+                connector=aiohttp.TCPConnector(limit=OPENAI_CONNECTION_LIMIT)
             )
-        
-        response = await loop.run_in_executor(None, _call)
-        return response.choices[0].message.content.strip()
+            if self._session_loop is None:
+                atexit.register(self._close_session)
+            self._session_loop = loop
+        return self._session
+    
+    def _close_session(self):
+        """Close the pooled session on its loop at interpreter exit"""
+        session, loop = self._session, self._session_loop
+        if session is None or session.closed or loop is not get_shared_loop() or not loop.is_running():
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(session.close(), loop).result(timeout=5)
+        except Exception:
+            pass
+    
+    async def _post_chat_completion(self, payload: Dict) -> str:
+        """POST a chat completion with retries, runs on the shared loop"""
+        session = self._get_session()
+        for attempt in range(self.max_retries + 1):
+            retry_after = None
+            try:
+                async with session.post(OPENAI_CHAT_COMPLETIONS_URL, json=payload) as response:
+                    if response.status in RETRYABLE_STATUSES and attempt < self.max_retries:
+                        retry_after = response.headers.get("Retry-After")
+                    else:
+                        response.raise_for_status()
+                        data = await response.json()
+                        return data["choices"][0]["message"]["content"].strip()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt >= self.max_retries:
+                    raise
+            
+            await asyncio.sleep(self._retry_delay(attempt, retry_after))
+    
+    def _retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Seconds to wait before retrying, the server's Retry-After or exponential backoff with jitter"""
+        if retry_after:
+            try:
+                return min(float(retry_after), MAX_RETRY_DELAY)
+            except ValueError:
+                pass
+        return min(2 ** attempt, MAX_RETRY_DELAY) + random.uniform(0, 1)
     
     def _parse_baby_size_response(self, response: str, week: int) -> BabySize:
         """Parse OpenAI response into BabySize object"""
@@ -11,6 +11,8 @@ from typing import List, Dict, Any, Optional
 from pymongo import MongoClient
 import logging
 
+from app.core.config import MAX_VITAL_HISTORY
+
 logger = logging.getLogger(__name__)
 
 class VitalSignsService:
@@ -53,10 +55,10 @@ class VitalSignsService:
                 "created_at": datetime.now()
             }
             
-            # Add to patient's vital_signs_logs array
+            # Add to patient's vital_signs_logs array, keeping only the newest MAX_VITAL_HISTORY entries
             result = self.db.patients_collection.update_one(
                 {"patient_id": patient_id},
-                {"$push": {"vital_signs_logs": vital_record}},
+                {"$push": {"vital_signs_logs": {"$each": [vital_record], "$slice": -MAX_VITAL_HISTORY}}},
                 upsert=True
             )
             
@@ -82,22 +84,26 @@ class VitalSignsService:
             if self.db is None:
                 return {"success": False, "message": "Database not connected"}
             
-            # Find patient
-            patient = self.db.patients_collection.find_one({"patient_id": patient_id})
-            if not patient:
-                return {"success": False, "message": "Patient not found"}
-            
-            # Get vital signs logs
-            vital_signs_logs = patient.get('vital_signs_logs', [])
-            
-            # Filter by date range
             end_date = datetime.now()
             start_date = end_date - timedelta(days=days)
             
-            filtered_logs = [
-                log for log in vital_signs_logs
-                if log.get('timestamp', datetime.now()) >= start_date
-            ]
+            # Filter by date range in Mongo so only the requested window is sent back;
+            # logs without a timestamp count as current
+            patients = list(self.db.patients_collection.aggregate([
+                {"$match": {"patient_id": patient_id}},
+                {"$limit": 1},
+                {"$project": {"_id": 0, "vital_signs_logs": {
+                    "$filter": {
+                        "input": {"$ifNull": ["$vital_signs_logs", []]},
+                        "as": "log",
+                        "cond": {"$gte": [{"$ifNull": ["$$log.timestamp", end_date]}, start_date]}
+                    }
+                }}}
+            ]))
+            if not patients:
+                return {"success": False, "message": "Patient not found"}
+            
+            filtered_logs = patients[0].get('vital_signs_logs', [])
             
             # Sort by timestamp (newest first)
             filtered_logs.sort(key=lambda x: x.get('timestamp', datetime.now()), reverse=True)
@@ -114,6 +120,55 @@ class VitalSignsService:
             logger.error(f"Error getting vital signs history: {e}")
             return {"success": False, "message": f"Error: {str(e)}"}
     
+    def get_stats_aggregated(self, patient_id: str, days: int = 30) -> Dict[str, Any]:
+        """Get per-type vital signs statistics, computed by MongoDB"""
+        try:
+            if self.db is None:
+                return {"success": False, "message": "Database not connected"}
+            
+            end_date = datetime.now()
+            start_date = end_date - timedelta(days=days)
+            value = {"$ifNull": ["$value", 0]}
+            
+            # Logs without a timestamp count as current, as in get_vital_signs_history
+            pipeline = [
+                {"$match": {"patient_id": patient_id}},
+                {"$unwind": "$vital_signs_logs"},
+                {"$replaceRoot": {"newRoot": "$vital_signs_logs"}},
+                {"$addFields": {"_sort_timestamp": {"$ifNull": ["$timestamp", end_date]}}},
+                {"$match": {"_sort_timestamp": {"$gte": start_date}}},
+                {"$sort": {"_sort_timestamp": -1}},
+                {"$group": {
+                    "_id": "$type",
+                    "count": {"$sum": 1},
+                    "values": {"$push": value},
+                    "latest_value": {"$first": value},
+                    "latest_timestamp": {"$first": "$timestamp"},
+                    "average": {"$avg": value},
+                    "min": {"$min": value},
+                    "max": {"$max": value}
+                }}
+            ]
+            
+            stats = {}
+            for group in self.db.patients_collection.aggregate(pipeline):
+                stats[group.pop("_id")] = group
+            
+            # No groups can also mean an unknown patient; the index answers that cheaply
+            if not stats and self.db.patients_collection.find_one({"patient_id": patient_id}, {"_id": 1}) is None:
+                return {"success": False, "message": "Patient not found"}
+            
+            return {
+                "success": True,
+                "patient_id": patient_id,
+                "days": days,
+                "statistics": stats
+            }
+            
+        except Exception as e:
+            logger.error(f"Error getting vital signs stats: {e}")
+            return {"success": False, "message": f"Error: {str(e)}"}
+    
     def analyze_vital_signs(self, patient_id: str, days: int = 7) -> Dict[str, Any]:
         """Analyze vital signs for anomalies and trends"""
         try:
@@ -174,20 +229,26 @@ class VitalSignsService:
             if self.db is None:
                 return {"success": False, "message": "Database not connected"}
             
-            # Find patient
-            patient = self.db.patients_collection.find_one({"patient_id": patient_id})
-            if not patient:
-                return {"success": False, "message": "Patient not found"}
-            
-            # Get recent vital signs (last 24 hours)
-            vital_signs_logs = patient.get('vital_signs_logs', [])
             end_date = datetime.now()
             start_date = end_date - timedelta(hours=24)
             
-            recent_vitals = [
-                log for log in vital_signs_logs
-                if log.get('timestamp', datetime.now()) >= start_date
-            ]
+            # Find patient, fetching only the alerts and the last 24 hours of vital signs
+            patients = list(self.db.patients_collection.aggregate([
+                {"$match": {"patient_id": patient_id}},
+                {"$limit": 1},
+                {"$project": {"_id": 0, "vital_signs_alerts": 1, "vital_signs_logs": {
+                    "$filter": {
+                        "input": {"$ifNull": ["$vital_signs_logs", []]},
+                        "as": "log",
+                        "cond": {"$gte": [{"$ifNull": ["$$log.timestamp", end_date]}, start_date]}
+                    }
+                }}}
+            ]))
+            if not patients:
+                return {"success": False, "message": "Patient not found"}
+            
+            patient = patients[0]
+            recent_vitals = patient.get('vital_signs_logs', [])
             
             # Get alerts
             alerts = patient.get('vital_signs_alerts', [])
@@ -13,6 +13,8 @@ from datetime import datetime
 from typing import Dict, Any, List, Optional
 from dotenv import load_dotenv
 
+from app.shared.retry import retry_transient
+
 # Load environment variables
 load_dotenv()
 
@@ -66,7 +68,7 @@ class VoiceInteractionService:
     async def transcribe_audio(self, audio_data: bytes, **kwargs) -> Dict[str, Any]:
         """Transcribe audio data to text"""
         try:
-            result = await self.stt_service.transcribe_audio(audio_data, **kwargs)
+            result = await retry_transient(lambda: self.stt_service.transcribe_audio(audio_data, **kwargs))
             return {
                 'success': True,
                 'transcription': result,
@@ -100,7 +102,7 @@ class VoiceInteractionService:
             if conversation_history is None:
                 conversation_history = []
             
-            result = await self.ai_service.generate_response(text, conversation_history)
+            result = await retry_transient(lambda: self.ai_service.generate_response(text, conversation_history))
             return {
                 'success': True,
                 'response': result,
@@ -117,7 +119,7 @@ class VoiceInteractionService:
     async def text_to_speech(self, text: str, **kwargs) -> Dict[str, Any]:
         """Convert text to speech"""
         try:
-            result = await self.tts_service.text_to_speech(text, **kwargs)
+            result = await retry_transient(lambda: self.tts_service.text_to_speech(text, **kwargs))
             return {
                 'success': True,
                 'audio': result,
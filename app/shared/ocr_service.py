@@ -2,7 +2,7 @@
 OCR Service for processing prescription documents, PDFs, and images
 """
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Union
 
 # Optional imports with fallback
 try:
@@ -78,15 +78,26 @@ class OCRService:
     
     def process_file(self, file_content: bytes, filename: str) -> Dict[str, Any]:
         """Process any supported file type and return unified results"""
+        return self._process(file_content, filename)
+    
+    def process_file_path(self, file_path: str, filename: str) -> Dict[str, Any]:
+        """Process a file saved on disk, PDFs are read by PyMuPDF from the path instead of loaded into memory"""
+        return self._process(file_path, filename)
+    
+    def _process(self, source: Union[bytes, str], filename: str) -> Dict[str, Any]:
+        """Dispatch file content (bytes) or a file path (str) to the processor for its type"""
         try:
             file_type = self.get_file_type(filename)
             
             if file_type == 'pdf':
-                return self._process_pdf(file_content, filename)
+                return self._process_pdf(source, filename)
             elif file_type == 'text':
-                return self._process_text_file(file_content, filename)
+                if isinstance(source, str):
+                    with open(source, 'rb') as f:
+                        source = f.read()
+                return self._process_text_file(source, filename)
             elif file_type == 'image':
-                return self._process_image(file_content, filename)
+                return self._process_image(source, filename)
             else:
                 return {
                     "success": False,
@@ -102,7 +113,7 @@ class OCRService:
                 "filename": filename
             }
     
-    def _process_pdf(self, file_content: bytes, filename: str) -> Dict[str, Any]:
+    def _process_pdf(self, file_content: Union[bytes, str], filename: str) -> Dict[str, Any]:
         """Process PDF file (both native text and scanned pages)"""
         if not PYMUPDF_AVAILABLE:
             return {
@@ -112,7 +123,10 @@ class OCRService:
         
         try:
             # Open PDF with PyMuPDF
-            pdf_document = fitz.open(stream=file_content, filetype="pdf")
+            if isinstance(file_content, str):
+                pdf_document = fitz.open(file_content, filetype="pdf")
+            else:
+                pdf_document = fitz.open(stream=file_content, filetype="pdf")
             
             results = []
             total_pages = len(pdf_document)
@@ -204,7 +218,7 @@ class OCRService:
                 "filename": filename
             }
     
-    def _process_image(self, file_content: bytes, filename: str) -> Dict[str, Any]:
+    def _process_image(self, file_content: Union[bytes, str], filename: str) -> Dict[str, Any]:
         """Process image files (basic text extraction placeholder)"""
         if not PIL_AVAILABLE:
             return {
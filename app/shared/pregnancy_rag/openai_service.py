@@ -3,18 +3,106 @@ import json
 import asyncio
 import requests
 import base64
-from typing import Dict, Optional
+from typing import Dict, List
 from app.shared.pregnancy_rag.pregnancy_config import settings
 from app.shared.pregnancy_rag.pregnancy_models import BabySize, SymptomInfo, ScreeningInfo, WellnessInfo, NutritionInfo
+from app.shared.async_runner import await_on_shared_loop
+
+
+# Prompts only vary by week, so the templates are formatted per call
+_BABY_SIZE_PROMPT = """
+    Provide detailed baby size information for pregnancy week {week}. 
+    
+    Please respond with a JSON object containing:
+    - "size": A relatable size comparison (e.g., "Lima bean", "Blueberry", "Coconut", "Avocado")
+    - "weight": Weight in grams (e.g., "0.1g", "1.2g", "15g")
+    - "length": Length in centimeters (e.g., "0.1cm", "0.5cm", "2.5cm")
+    
+    Make the size comparison creative and memorable. For example:
+    - Week 1-4: Very small seeds (poppy seed, sesame seed)
+    - Week 5-8: Small fruits (blueberry, raspberry, grape)
+    - Week 9-12: Medium fruits (strawberry, lime, plum)
+    - Week 13-16: Larger fruits (lemon, avocado, orange)
+    - Week 17-20: Small vegetables (potato, sweet potato)
+    - Week 21-24: Medium vegetables (carrot, corn cob)
+    - Week 25-28: Large fruits (coconut, cantaloupe)
+    - Week 29-32: Small melons (honeydew, small watermelon)
+    - Week 33-36: Medium melons (cantaloupe, large watermelon)
+    - Week 37-40: Full-term baby size
+    
+    Respond only with valid JSON, no additional text.
+    """
+
+_SYMPTOMS_PROMPT = """
+    Provide detailed early pregnancy symptoms information for week {week}.
+    
+    Please respond with a JSON object containing:
+    - "common_symptoms": Array of 5-8 common symptoms for this week
+    - "when_to_call_doctor": Array of 3-5 warning signs that require medical attention
+    - "relief_tips": Array of 5-7 practical tips to manage symptoms
+    - "severity_level": String describing typical severity (e.g., "Mild", "Moderate", "Severe")
+    
+    Make it specific to week {week} and trimester. Be helpful and reassuring.
+    Respond only with valid JSON, no additional text.
+    """
+
+_SCREENING_PROMPT = """
+    Provide detailed prenatal screening information for pregnancy week {week}.
+    
+    Please respond with a JSON object containing:
+    - "recommended_tests": Array of 3-6 tests recommended for this week
+    - "test_descriptions": Array of brief descriptions for each test
+    - "timing": String describing when these tests should be done
+    - "importance": String explaining why these tests are important
+    
+    Focus on tests that are typically done around week {week}.
+    Be informative and reassuring about the importance of prenatal care.
+    Respond only with valid JSON, no additional text.
+    """
+
+_WELLNESS_PROMPT = """
+    Provide detailed wellness tips for pregnancy week {week}.
+    
+    Please respond with a JSON object containing:
+    - "exercise_tips": Array of 4-6 safe exercise recommendations for this week
+    - "sleep_advice": Array of 3-5 sleep tips specific to this week
+    - "stress_management": Array of 4-6 stress relief techniques
+    - "general_wellness": Array of 4-6 general wellness practices
+    
+    Make it specific to week {week} and trimester. Focus on safety and comfort.
+    Respond only with valid JSON, no additional text.
+    """
+
+_NUTRITION_PROMPT = """
+    Provide detailed nutrition tips for pregnancy week {week}.
+    
+    Please respond with a JSON object containing:
+    - "essential_nutrients": Array of 5-7 key nutrients needed this week
+    - "foods_to_avoid": Array of 4-6 foods to avoid or limit
+    - "meal_suggestions": Array of 4-6 meal ideas for this week
+    - "hydration_tips": Array of 3-5 hydration recommendations
+    
+    Make it specific to week {week} and trimester. Focus on baby's development needs.
+    Respond only with valid JSON, no additional text.
+    """
+
+_SYSTEM_MESSAGE = {"role": "system", "content": "You are a medical AI assistant specializing in pregnancy development. Provide accurate, helpful information about fetal development and baby sizes."}
 
 class OpenAIBabySizeService:
     def __init__(self):
         if not settings.OPENAI_API_KEY:
             raise ValueError("OpenAI API key is required. Please set OPENAI_API_KEY in your environment variables.")
         
-        self.client = openai.OpenAI(api_key=settings.OPENAI_API_KEY)
+        # Created lazily on the shared async_runner loop, which every OpenAI call
+        # runs on, so one client and one semaphore serve the whole process
+        self.client = None
+        self._client_loop = None
+        self._semaphore = None
         self.model = settings.OPENAI_MODEL
         self.max_tokens = settings.OPENAI_MAX_TOKENS
+        
+        # Arguments shared by every chat completion request
+        self._base_kwargs = {"model": self.model, "max_tokens": self.max_tokens, "temperature": 0.7}
     
     async def get_baby_size_for_week(self, week: int) -> BabySize:
         """
@@ -40,45 +128,41 @@ class OpenAIBabySizeService:
     
     def _create_baby_size_prompt(self, week: int) -> str:
         """Create a prompt for OpenAI to get baby size information"""
-        return f"""
-        Provide detailed baby size information for pregnancy week {week}. 
-        
-        Please respond with a JSON object containing:
-        - "size": A relatable size comparison (e.g., "Lima bean", "Blueberry", "Coconut", "Avocado")
-        - "weight": Weight in grams (e.g., "0.1g", "1.2g", "15g")
-        - "length": Length in centimeters (e.g., "0.1cm", "0.5cm", "2.5cm")
-        
-        Make the size comparison creative and memorable. For example:
-        - Week 1-4: Very small seeds (poppy seed, sesame seed)
-        - Week 5-8: Small fruits (blueberry, raspberry, grape)
-        - Week 9-12: Medium fruits (strawberry, lime, plum)
-        - Week 13-16: Larger fruits (lemon, avocado, orange)
-        - Week 17-20: Small vegetables (potato, sweet potato)
-        - Week 21-24: Medium vegetables (carrot, corn cob)
-        - Week 25-28: Large fruits (coconut, cantaloupe)
-        - Week 29-32: Small melons (honeydew, small watermelon)
-        - Week 33-36: Medium melons (cantaloupe, large watermelon)
-        - Week 37-40: Full-term baby size
-        
-        Respond only with valid JSON, no additional text.
-        """
+        return _BABY_SIZE_PROMPT.format(week=week)
+    
+    def _build_messages(self, prompt: str) -> List[Dict[str, str]]:
+        """Build the chat messages for a prompt"""
+        return [_SYSTEM_MESSAGE, {"role": "user", "content": prompt}]
+    
+    def _get_client(self):
+        """Get the AsyncOpenAI client and concurrency semaphore, only called on the shared loop"""
+        loop = asyncio.get_running_loop()
+        # The shared loop only changes after a fork, when the old one is gone
+        if self.client is None or self._client_loop is not loop:
+            # The client retries rate limit and transient errors with exponential backoff
+            self.client = openai.AsyncOpenAI(
+                api_key=settings.OPENAI_API_KEY,
+                max_retries=settings.OPENAI_MAX_RETRIES,
+                timeout=settings.OPENAI_TIMEOUT
+            )
+            self._semaphore = asyncio.Semaphore(settings.OPENAI_MAX_CONCURRENCY)
+            self._client_loop = loop
+        return self.client, self._semaphore
     
     async def _call_openai(self, prompt: str) -> str:
-        """Make an async call to OpenAI API"""
-        loop = asyncio.get_event_loop()
-        
-        def _call():
-            return self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a medical AI assistant specializing in pregnancy development. Provide accurate, helpful information about fetal development and baby sizes."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=self.max_tokens,
-                temperature=0.7
+        """Make an async call to OpenAI API, throttled to OPENAI_MAX_CONCURRENCY in-flight requests"""
+        # Callers run each request on a fresh event loop, so the request itself
+        # is sent from the long-lived shared loop that owns the client
+        return await await_on_shared_loop(self._create_completion(prompt))
+    
+    async def _create_completion(self, prompt: str) -> str:
+        """Create a chat completion, runs on the shared loop"""
+        client, semaphore = self._get_client()
+        async with semaphore:
+            response = await client.chat.completions.create(
+                messages=self._build_messages(prompt),
+                **self._base_kwargs
             )
-        
-        response = await loop.run_in_executor(None, _call)
         return response.choices[0].message.content.strip()
     
     def _parse_baby_size_response(self, response: str, week: int) -> BabySize:
@@ -165,19 +249,8 @@ class OpenAIBabySizeService:
         try:
             prompt = f"A professional medical illustration of a single {fruit_name} on a clean white background, representing baby size at {week} weeks of pregnancy. The {fruit_name} should be approximately {size_cm}cm in size. High quality, photorealistic, centered composition. Medical illustration style, clean and professional."
             
-            loop = asyncio.get_event_loop()
-            
-            def _generate_image():
-                response = self.client.images.generate(
-                    model="dall-e-3",
-                    prompt=prompt,
-                    size="1024x1024",
-                    quality="standard",
-                    n=1
-                )
-                return response.data[0].url
-            
-            image_url = await loop.run_in_executor(None, _generate_image)
+            response = await await_on_shared_loop(self._generate_image(prompt))
+            image_url = response.data[0].url
             
             # Download the image and convert to base64
             def _download_image():
@@ -185,13 +258,25 @@ class OpenAIBabySizeService:
                 img_response.raise_for_status()
                 return base64.b64encode(img_response.content).decode()
             
-            image_base64 = await loop.run_in_executor(None, _download_image)
+            image_base64 = await asyncio.to_thread(_download_image)
             return image_base64
             
         except Exception as e:
             print(f"Error generating DALL-E image for week {week}: {e}")
             return None
     
+    async def _generate_image(self, prompt: str):
+        """Generate a DALL-E 3 image, runs on the shared loop"""
+        client, semaphore = self._get_client()
+        async with semaphore:
+            return await client.images.generate(
+                model="dall-e-3",
+                prompt=prompt,
+                size="1024x1024",
+                quality="standard",
+                n=1
+            )
+    
     async def get_detailed_baby_info(self, week: int) -> Dict:
         """
         Get detailed baby information including size, development milestones, and fun facts
@@ -242,32 +327,27 @@ class OpenAIBabySizeService:
             SymptomInfo with symptoms, relief tips, and when to call doctor
         """
         try:
-            prompt = f"""
-            Provide detailed early pregnancy symptoms information for week {week}.
-            
-            Please respond with a JSON object containing:
-            - "common_symptoms": Array of 5-8 common symptoms for this week
-            - "when_to_call_doctor": Array of 3-5 warning signs that require medical attention
-            - "relief_tips": Array of 5-7 practical tips to manage symptoms
-            - "severity_level": String describing typical severity (e.g., "Mild", "Moderate", "Severe")
-            
-            Make it specific to week {week} and trimester. Be helpful and reassuring.
-            Respond only with valid JSON, no additional text.
-            """
-            
-            response = await self._call_openai(prompt)
-            data = json.loads(response)
-            
-            return SymptomInfo(
-                common_symptoms=data.get("common_symptoms", []),
-                when_to_call_doctor=data.get("when_to_call_doctor", []),
-                relief_tips=data.get("relief_tips", []),
-                severity_level=data.get("severity_level", "Mild")
-            )
+            response = await self._call_openai(self._create_symptoms_prompt(week))
+            return self._parse_symptoms_response(response, week)
             
         except Exception as e:
             return self._get_fallback_symptoms(week)
     
+    def _create_symptoms_prompt(self, week: int) -> str:
+        """Create a prompt for OpenAI to get symptoms information"""
+        return _SYMPTOMS_PROMPT.format(week=week)
+    
+    def _parse_symptoms_response(self, response: str, week: int) -> SymptomInfo:
+        """Parse OpenAI response into SymptomInfo object"""
+        data = json.loads(response)
+        
+        return SymptomInfo(
+            common_symptoms=data.get("common_symptoms", []),
+            when_to_call_doctor=data.get("when_to_call_doctor", []),
+            relief_tips=data.get("relief_tips", []),
+            severity_level=data.get("severity_level", "Mild")
+        )
+    
     async def get_prenatal_screening(self, week: int) -> ScreeningInfo:
         """
         Get AI-generated prenatal screening information for a specific week
@@ -279,33 +359,27 @@ class OpenAIBabySizeService:
             ScreeningInfo with recommended tests and timing
         """
         try:
-            prompt = f"""
-            Provide detailed prenatal screening information for pregnancy week {week}.
-            
-            Please respond with a JSON object containing:
-            - "recommended_tests": Array of 3-6 tests recommended for this week
-            - "test_descriptions": Array of brief descriptions for each test
-            - "timing": String describing when these tests should be done
-            - "importance": String explaining why these tests are important
-            
-            Focus on tests that are typically done around week {week}.
-            Be informative and reassuring about the importance of prenatal care.
-            Respond only with valid JSON, no additional text.
-            """
-            
-            response = await self._call_openai(prompt)
-            data = json.loads(response)
-            
-            return ScreeningInfo(
-                recommended_tests=data.get("recommended_tests", []),
-                test_descriptions=data.get("test_descriptions", []),
-                timing=data.get("timing", "As recommended by your doctor"),
-                importance=data.get("importance", "Important for monitoring baby's health")
-            )
+            response = await self._call_openai(self._create_screening_prompt(week))
+            return self._parse_screening_response(response, week)
             
         except Exception as e:
             return self._get_fallback_screening(week)
     
+    def _create_screening_prompt(self, week: int) -> str:
+        """Create a prompt for OpenAI to get screening information"""
+        return _SCREENING_PROMPT.format(week=week)
+    
+    def _parse_screening_response(self, response: str, week: int) -> ScreeningInfo:
+        """Parse OpenAI response into ScreeningInfo object"""
+        data = json.loads(response)
+        
+        return ScreeningInfo(
+            recommended_tests=data.get("recommended_tests", []),
+            test_descriptions=data.get("test_descriptions", []),
+            timing=data.get("timing", "As recommended by your doctor"),
+            importance=data.get("importance", "Important for monitoring baby's health")
+        )
+    
     async def get_wellness_tips(self, week: int) -> WellnessInfo:
         """
         Get AI-generated wellness tips for a specific week
@@ -317,32 +391,27 @@ class OpenAIBabySizeService:
             WellnessInfo with exercise, sleep, and stress management tips
         """
         try:
-            prompt = f"""
-            Provide detailed wellness tips for pregnancy week {week}.
-            
-            Please respond with a JSON object containing:
-            - "exercise_tips": Array of 4-6 safe exercise recommendations for this week
-            - "sleep_advice": Array of 3-5 sleep tips specific to this week
-            - "stress_management": Array of 4-6 stress relief techniques
-            - "general_wellness": Array of 4-6 general wellness practices
-            
-            Make it specific to week {week} and trimester. Focus on safety and comfort.
-            Respond only with valid JSON, no additional text.
-            """
-            
-            response = await self._call_openai(prompt)
-            data = json.loads(response)
-            
-            return WellnessInfo(
-                exercise_tips=data.get("exercise_tips", []),
-                sleep_advice=data.get("sleep_advice", []),
-                stress_management=data.get("stress_management", []),
-                general_wellness=data.get("general_wellness", [])
-            )
+            response = await self._call_openai(self._create_wellness_prompt(week))
+            return self._parse_wellness_response(response, week)
             
         except Exception as e:
             return self._get_fallback_wellness(week)
     
+    def _create_wellness_prompt(self, week: int) -> str:
+        """Create a prompt for OpenAI to get wellness information"""
+        return _WELLNESS_PROMPT.format(week=week)
+    
+    def _parse_wellness_response(self, response: str, week: int) -> WellnessInfo:
+        """Parse OpenAI response into WellnessInfo object"""
+        data = json.loads(response)
+        
+        return WellnessInfo(
+            exercise_tips=data.get("exercise_tips", []),
+            sleep_advice=data.get("sleep_advice", []),
+            stress_management=data.get("stress_management", []),
+            general_wellness=data.get("general_wellness", [])
+        )
+    
     async def get_nutrition_tips(self, week: int) -> NutritionInfo:
         """
         Get AI-generated nutrition tips for a specific week
@@ -354,32 +423,27 @@ class OpenAIBabySizeService:
             NutritionInfo with nutrition advice and meal suggestions
         """
         try:
-            prompt = f"""
-            Provide detailed nutrition tips for pregnancy week {week}.
-            
-            Please respond with a JSON object containing:
-            - "essential_nutrients": Array of 5-7 key nutrients needed this week
-            - "foods_to_avoid": Array of 4-6 foods to avoid or limit
-            - "meal_suggestions": Array of 4-6 meal ideas for this week
-            - "hydration_tips": Array of 3-5 hydration recommendations
-            
-            Make it specific to week {week} and trimester. Focus on baby's development needs.
-            Respond only with valid JSON, no additional text.
-            """
-            
-            response = await self._call_openai(prompt)
-            data = json.loads(response)
-            
-            return NutritionInfo(
-                essential_nutrients=data.get("essential_nutrients", []),
-                foods_to_avoid=data.get("foods_to_avoid", []),
-                meal_suggestions=data.get("meal_suggestions", []),
-                hydration_tips=data.get("hydration_tips", [])
-            )
+            response = await self._call_openai(self._create_nutrition_prompt(week))
+            return self._parse_nutrition_response(response, week)
             
         except Exception as e:
             return self._get_fallback_nutrition(week)
     
+    def _create_nutrition_prompt(self, week: int) -> str:
+        """Create a prompt for OpenAI to get nutrition information"""
+        return _NUTRITION_PROMPT.format(week=week)
+    
+    def _parse_nutrition_response(self, response: str, week: int) -> NutritionInfo:
+        """Parse OpenAI response into NutritionInfo object"""
+        data = json.loads(response)
+        
+        return NutritionInfo(
+            essential_nutrients=data.get("essential_nutrients", []),
+            foods_to_avoid=data.get("foods_to_avoid", []),
+            meal_suggestions=data.get("meal_suggestions", []),
+            hydration_tips=data.get("hydration_tips", [])
+        )
+    
     def _get_fallback_symptoms(self, week: int) -> SymptomInfo:
         """Fallback symptoms data if OpenAI fails"""
         return SymptomInfo(
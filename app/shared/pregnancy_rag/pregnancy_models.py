@@ -1,19 +1,26 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import List, Optional, Dict
 from datetime import datetime
 
+# Week data models are built once per process and shared by every request, so they are frozen
 class KeyDevelopment(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     title: str
     description: str
     icon: Optional[str] = None
     category: str
 
 class BabySize(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     size: str
     weight: Optional[str] = None
     length: Optional[str] = None
 
 class PregnancyWeek(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     week: int
     trimester: int
     days_remaining: int
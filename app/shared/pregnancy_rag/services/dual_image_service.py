@@ -147,7 +147,8 @@ class DualImageService:
                 rag_response = await self.rag_service.get_personalized_developments(
                     week=week,
                     patient_id=patient_id,
-                    use_mock_data=use_mock_data
+                    use_mock_data=use_mock_data,
+                    week_data=week_data
                 )
                 result["analysis"]["rag_personalized"] = rag_response
                 print(f"✅ RAG analysis completed for week {week}")
@@ -1,10 +1,10 @@
 from qdrant_client import QdrantClient
 from qdrant_client.models import (
     Distance, VectorParams, PointStruct, Filter, FieldCondition, MatchValue,
-    PayloadSchemaType
+    MatchAny, PayloadSchemaType, SearchRequest
 )
 from sentence_transformers import SentenceTransformer
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from app.shared.pregnancy_rag.pregnancy_models import PregnancyWeek, KeyDevelopment
 from app.shared.pregnancy_rag.pregnancy_config import settings
 import uuid
@@ -125,10 +125,11 @@ class QdrantService:
         """Upload multiple weeks data to Qdrant"""
         points = []
         
-        for week_data in weeks_data:
-            text = self._convert_week_to_text(week_data)
-            embedding = self.embedding_model.encode(text).tolist()
-            
+        # Encode all weeks in a single batched call
+        texts = [self._convert_week_to_text(week_data) for week_data in weeks_data]
+        embeddings = self.embedding_model.encode(texts) if texts else []
+        
+        for week_data, text, embedding in zip(weeks_data, texts, embeddings):
             payload = {
                 "week": week_data.week,
                 "trimester": week_data.trimester,
@@ -143,7 +144,7 @@ class QdrantService:
             points.append(
                 PointStruct(
                     id=str(uuid.uuid4()),
-                    vector=embedding,
+                    vector=embedding.tolist(),
                     payload=payload
                 )
             )
@@ -177,6 +178,29 @@ class QdrantService:
             return self._payload_to_pregnancy_week(payload)
         return None
     
+    def get_weeks_by_numbers(self, weeks: List[int]) -> Dict[int, PregnancyWeek]:
+        """Retrieve several weeks' data by week number in a single scroll"""
+        search_filter = Filter(
+            must=[
+                FieldCondition(
+                    key="week",
+                    match=MatchAny(any=list(weeks))
+                )
+            ]
+        )
+        
+        results = self.client.scroll(
+            collection_name=self.collection_name,
+            scroll_filter=search_filter,
+            limit=100
+        )
+        
+        weeks_dict = {}
+        for point in results[0]:
+            weeks_dict.setdefault(point.payload["week"], point.payload)
+        
+        return {week: self._payload_to_pregnancy_week(payload) for week, payload in weeks_dict.items()}
+    
     def get_weeks_by_trimester(self, trimester: int) -> List[PregnancyWeek]:
         """Retrieve all weeks for a specific trimester"""
         search_filter = Filter(
@@ -229,17 +253,45 @@ class QdrantService:
             limit=limit
         )
         
-        results = []
-        for result in search_results:
-            results.append({
-                "score": result.score,
-                "week": result.payload["week"],
-                "trimester": result.payload["trimester"],
-                "data": self._payload_to_pregnancy_week(result.payload),
-                "matched_text": result.payload["searchable_text"][:200] + "..."
-            })
+        return [self._format_search_result(result) for result in search_results]
+    
+    def get_week_with_related(
+        self, week: int, query: str, limit: int = 5
+    ) -> Tuple[Optional[PregnancyWeek], List[Dict]]:
+        """
+        Retrieve a week's data and semantic search results for a query in a
+        single Qdrant round trip
+        """
+        query_embedding = self.embedding_model.encode(query).tolist()
+        week_filter = Filter(
+            must=[
+                FieldCondition(
+                    key="week",
+                    match=MatchValue(value=week)
+                )
+            ]
+        )
         
-        return results
+        related_results, week_results = self.client.search_batch(
+            collection_name=self.collection_name,
+            requests=[
+                SearchRequest(vector=query_embedding, limit=limit, with_payload=True),
+                SearchRequest(vector=query_embedding, filter=week_filter, limit=1, with_payload=True)
+            ]
+        )
+        
+        week_data = self._payload_to_pregnancy_week(week_results[0].payload) if week_results else None
+        return week_data, [self._format_search_result(result) for result in related_results]
+    
+    def _format_search_result(self, result) -> Dict:
+        """Convert a Qdrant search hit to a search result dict"""
+        return {
+            "score": result.score,
+            "week": result.payload["week"],
+            "trimester": result.payload["trimester"],
+            "data": self._payload_to_pregnancy_week(result.payload),
+            "matched_text": result.payload["searchable_text"][:200] + "..."
+        }
     
     def _payload_to_pregnancy_week(self, payload: dict) -> PregnancyWeek:
         """Convert Qdrant payload back to PregnancyWeek object"""
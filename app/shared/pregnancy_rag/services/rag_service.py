@@ -21,22 +21,29 @@ class RAGService:
         week: int, 
         patient_id: str,
         use_openai: bool = True,
-        use_mock_data: bool = False
+        use_mock_data: bool = False,
+        week_data: Optional[PregnancyWeek] = None
     ) -> RAGPregnancyResponse:
-        """RAG pipeline for personalized pregnancy developments"""
+        """
+        RAG pipeline for personalized pregnancy developments
+        
+        week_data can be passed when the caller already retrieved it, so only
+        the related weeks search is sent to Qdrant.
+        """
         
         try:
-            # STEP 1: RETRIEVAL - Get relevant pregnancy data
-            week_data = self.qdrant_service.get_week_by_number(week)
+            # STEP 1: RETRIEVAL - Get relevant pregnancy data and related weeks
+            # for broader context in a single Qdrant round trip
+            related_query = f"week {week} pregnancy developments symptoms"
+            if week_data is None:
+                week_data, related_weeks = self.qdrant_service.get_week_with_related(
+                    week, related_query, limit=3
+                )
+            else:
+                related_weeks = self.qdrant_service.semantic_search(related_query, limit=3)
             if not week_data:
                 raise ValueError(f"Week {week} data not found")
             
-            # Get related weeks for broader context
-            related_weeks = self.qdrant_service.semantic_search(
-                f"week {week} pregnancy developments symptoms", 
-                limit=3
-            )
-            
             # STEP 2: RETRIEVAL - Get patient medical history
             try:
                 if use_mock_data:
@@ -342,12 +349,8 @@ class RAGService:
             else:
                 raise ValueError("Trimester must be 1, 2, or 3")
             
-            # Get trimester-specific pregnancy data
-            trimester_weeks = []
-            for week in weeks:
-                week_data = self.qdrant_service.get_week_by_number(week)
-                if week_data:
-                    trimester_weeks.append(week_data)
+            # Get trimester-specific pregnancy data in a single scroll
+            trimester_weeks = self.qdrant_service.get_weeks_by_numbers(weeks)
             
             # Get related trimester information
             related_info = self.qdrant_service.semantic_search(
@@ -378,7 +381,7 @@ class RAGService:
             }.get(trimester, [])
             
             for week in key_weeks:
-                week_data = self.qdrant_service.get_week_by_number(week)
+                week_data = trimester_weeks.get(week)
                 if week_data:
                     # Generate fruit image for this week
                     try:
@@ -396,7 +399,7 @@ class RAGService:
                         # Add patient-specific notes if available
                         if patient_profile and patient_profile.disease_history:
                             recommendation["medical_notes"] = self._get_fruit_medical_notes(
-                                week, patient_profile.disease_history
+                                week_data, patient_profile.disease_history
                             )
                         
                         fruit_recommendations.append(recommendation)
@@ -468,23 +471,23 @@ class RAGService:
             else:
                 return "Late Third"
     
-    def _get_fruit_medical_notes(self, week: int, disease_history: List[PatientDiseaseHistory]) -> List[str]:
+    def _get_fruit_medical_notes(self, week_data: PregnancyWeek, disease_history: List[PatientDiseaseHistory]) -> List[str]:
         """Generate medical notes related to fruit size comparisons"""
         notes = []
+        week_fruit = self._get_week_fruit(week_data)
         
         for disease in disease_history:
             if disease.disease_name.lower() in ["diabetes", "gestational diabetes"]:
-                notes.append(f"Monitor blood sugar levels as baby grows to {self._get_week_fruit(week)} size")
+                notes.append(f"Monitor blood sugar levels as baby grows to {week_fruit} size")
             elif disease.disease_name.lower() in ["hypertension", "high blood pressure"]:
-                notes.append(f"Regular blood pressure checks recommended during {self._get_week_fruit(week)} size phase")
+                notes.append(f"Regular blood pressure checks recommended during {week_fruit} size phase")
             elif disease.disease_name.lower() in ["anemia"]:
-                notes.append(f"Iron-rich diet important as baby reaches {self._get_week_fruit(week)} size")
+                notes.append(f"Iron-rich diet important as baby reaches {week_fruit} size")
         
         return notes
     
-    def _get_week_fruit(self, week: int) -> str:
-        """Get fruit name for a specific week"""
-        week_data = self.qdrant_service.get_week_by_number(week)
+    def _get_week_fruit(self, week_data: Optional[PregnancyWeek]) -> str:
+        """Get fruit name for a week's data"""
         if week_data and week_data.size_comparison:
             return week_data.size_comparison
         return "current size"
@@ -0,0 +1,61 @@
+"""
+Retry transient upstream failures (rate limits, quota, 5xx gateway errors)
+
+Errors are classified by HTTP status where the exception carries one, and by
+message text otherwise. Retries back off exponentially with jitter.
+"""
+import asyncio
+import logging
+import random
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUSES = frozenset((429, 502, 503, 504))
+RETRYABLE_MESSAGES = ("rate limit", "ratelimit", "quota", "too many requests")
+
+
+def _error_status(exc: Exception):
+    """HTTP status carried by an SDK/HTTP client exception, if any"""
+    for attr in ("status_code", "status", "http_status"):
+        status = getattr(exc, attr, None)
+        if isinstance(status, int):
+            return status
+    response = getattr(exc, "response", None)
+    status = getattr(response, "status_code", None) or getattr(response, "status", None)
+    return status if isinstance(status, int) else None
+
+
+def classify_error(exc: Exception):
+    """Return the reason an error is worth retrying, or None if it is not"""
+    status = _error_status(exc)
+    if status in RETRYABLE_STATUSES:
+        return f"status_{status}"
+    message = str(exc).lower()
+    for needle in RETRYABLE_MESSAGES:
+        if needle in message:
+            return needle.replace(" ", "_")
+    return None
+
+
+async def retry_transient(coro_factory, max_attempts: int = 3, base: float = 0.5, cap: float = 8.0):
+    """Await coro_factory(), retrying transient failures up to max_attempts times
+
+    Takes a factory rather than a coroutine because a coroutine can only be
+    awaited once; each attempt builds a fresh one.
+    """
+    attempt = 0
+    while True:
+        try:
+            return await coro_factory()
+        except Exception as e:
+            attempt += 1
+            reason = classify_error(e)
+            if reason is None or attempt >= max_attempts:
+                raise
+            delay = min(cap, base * 2 ** (attempt - 1)) + random.random() * 0.25
+            logger.warning(
+                "Transient upstream error, retrying",
+                extra={"retry_reason": reason, "attempt": attempt, "max_attempts": max_attempts,
+                       "delay": round(delay, 3), "error": str(e)}
+            )
+            await asyncio.sleep(delay)